@@ -0,0 +1,6 @@
+"""
+SEED Scraper Benchmarks
+======================
+
+Offline record-and-replay harness for tuning the SEED scrapers.
+"""
@@ -0,0 +1,197 @@
+"""
+SEED Fixture Recorder
+====================
+
+Records SEED HTML responses and the product list export into a HAR-like
+fixture file with credentials scrubbed, for offline replay.
+
+Usage:
+    python -m benchmarks.recorder --date 2025-08-01
+"""
+
+import os
+import re
+import json
+import base64
+import asyncio
+import argparse
+import tempfile
+from datetime import datetime
+from urllib.parse import urlparse
+from config.report_config import SEED_BASE_URL
+
+FIXTURE_DIRECTORY = os.path.join("benchmarks", "fixtures")
+
+# Resource types worth replaying (the scrapers only read documents)
+RECORDED_RESOURCE_TYPES = {"document", "xhr", "fetch"}
+
+# Headers that carry credentials or session state
+SCRUBBED_HEADERS = {"authorization", "cookie", "set-cookie", "proxy-authorization"}
+
+# Anti-forgery tokens and similar hidden values
+TOKEN_PATTERN = re.compile(r'(name="__RequestVerificationToken"[^>]*value=")[^"]*(")', re.IGNORECASE)
+
+class SeedRecorder:
+    """
+    Collects scrubbed SEED responses from a Playwright context
+    """
+
+    def __init__(self, username=None, password=None):
+        """
+        Initialize recorder
+
+        Args:
+            username (str): SEED username to scrub from recorded bodies
+            password (str): SEED password to scrub from recorded bodies
+        """
+        self.secrets = [secret for secret in (username, password) if secret]
+        self.entries = []
+        self._pending = []
+
+    def attach(self, context):
+        """Record responses from a browser context"""
+        context.on("response", lambda response: self._pending.append(asyncio.ensure_future(self.record_response(response))))
+
+    async def flush(self):
+        """Wait for in-flight response bodies"""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+            self._pending = []
+
+    async def record_response(self, response):
+        """Save one response if it is a SEED document"""
+        request = response.request
+        if request.resource_type not in RECORDED_RESOURCE_TYPES:
+            return
+        if urlparse(response.url).hostname != urlparse(SEED_BASE_URL).hostname:
+            return
+        # Login submission and redirects carry credentials or no body
+        if request.method != "GET" or 300 <= response.status < 400:
+            return
+        try:
+            body = await response.body()
+        except Exception:
+            return
+        self.add_entry(response.url, response.status, response.headers, body)
+
+    def add_entry(self, url, status, headers, body):
+        """
+        Add a scrubbed entry
+
+        Args:
+            url (str): Absolute response URL
+            status (int): HTTP status
+            headers (dict): Response headers
+            body (bytes): Response body
+        """
+        parsed = urlparse(url)
+        path = parsed.path + (f"?{parsed.query}" if parsed.query else "")
+        content_type = headers.get("content-type", "application/octet-stream")
+        entry = {
+            'request': {'method': 'GET', 'path': path},
+            'response': {
+                'status': status,
+                'headers': {name: value for name, value in headers.items()
+                            if name.lower() not in SCRUBBED_HEADERS and name.lower() != "content-length"},
+                'content_type': content_type
+            }
+        }
+        if content_type.startswith("text/") or "json" in content_type or "javascript" in content_type:
+            entry['response']['text'] = self.scrub_text(body.decode("utf-8", errors="replace"))
+        else:
+            entry['response']['base64'] = base64.b64encode(body).decode()
+
+        # Keep the last response per path (re-visits after go_back)
+        self.entries = [existing for existing in self.entries if existing['request']['path'] != path]
+        self.entries.append(entry)
+
+    def scrub_text(self, text):
+        """Remove credentials, tokens and absolute SEED links from a body"""
+        for secret in self.secrets:
+            text = text.replace(secret, "[SCRUBBED]")
+        text = TOKEN_PATTERN.sub(r"\1[SCRUBBED]\2", text)
+        # Make links relative so the replay server serves them
+        return text.replace(SEED_BASE_URL, "")
+
+    def save(self, fixture_path, metadata):
+        """
+        Write the fixture file
+
+        Args:
+            fixture_path (str): Output path
+            metadata (dict): Recording details (date, cluster, ...)
+        """
+        os.makedirs(os.path.dirname(fixture_path), exist_ok=True)
+        with open(fixture_path, 'w', encoding='utf-8') as file:
+            json.dump({'metadata': metadata, 'entries': self.entries}, file, indent=1)
+        print(f"💾 Saved {len(self.entries)} responses to {fixture_path}")
+
+async def record_seed_fixtures(target_date, headless=True):
+    """
+    Log in to live SEED and record the pages the scrapers read
+
+    Args:
+        target_date (str): RoutesSummary date (YYYY-MM-DD)
+        headless (bool): Run browser in headless mode
+
+    Returns:
+        str: Path to fixture file
+    """
+    from web_automation.inventory_confirmation_scraper import InventoryConfirmationScraper
+    from utils.seed_http import SeedHttpClient
+
+    scraper = InventoryConfirmationScraper(headless=headless, use_cache=False)
+    scraper.resource_profile = "off"
+    recorder = SeedRecorder(scraper.username, scraper.password)
+
+    try:
+        await scraper.setup_browser()
+        recorder.attach(scraper.context)
+        if not await scraper.setup_and_login(force_login=True):
+            raise Exception("Failed to login to SEED")
+
+        # Routes summary + every incomplete route's detail page
+        routes = await scraper.get_incomplete_routes(target_date, concurrency=2)
+        await recorder.flush()
+        print(f"📋 Recorded summary and {len(routes.routes)} incomplete routes ({len(recorder.entries)} pages)")
+
+        # Product list export (downloads don't fire a readable response)
+        client = SeedHttpClient.from_session_cache()
+        if client:
+            try:
+                export_path = os.path.join(tempfile.mkdtemp(), "ItemImportExample.xlsx")
+                client.download_product_list(export_path)
+                with open(export_path, 'rb') as file:
+                    recorder.add_entry(
+                        client.get_product_list_url(), 200,
+                        {"content-type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                         "content-disposition": 'attachment; filename="ItemImportExample.xlsx"'},
+                        file.read()
+                    )
+                print("📋 Recorded product list export")
+            except Exception as e:
+                print(f"⚠️ Product list export not recorded: {str(e)}")
+            finally:
+                client.close()
+
+        fixture_path = os.path.join(FIXTURE_DIRECTORY, f"seed_{target_date}.json")
+        recorder.save(fixture_path, {
+            'target_date': target_date,
+            'cluster': scraper.cluster or "cs1",
+            'recorded_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        })
+        return fixture_path
+    finally:
+        await scraper.cleanup_browser()
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Record SEED pages for offline benchmarking")
+    parser.add_argument("--date", required=True, help="RoutesSummary date (YYYY-MM-DD)")
+    parser.add_argument("--visible", action="store_true", help="Show the browser")
+    args = parser.parse_args()
+
+    asyncio.run(record_seed_fixtures(args.date, headless=not args.visible))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+SEED Replay Server
+=================
+
+Local stand-in for mycantaloupe.com that serves recorded fixtures with
+configurable latency. Provides a synthetic login form and export page so
+the unmodified scrapers can log in and download offline.
+
+Usage:
+    python -m benchmarks.replay_server benchmarks/fixtures/seed_2025-08-01.json --latency 150
+"""
+
+import json
+import time
+import base64
+import random
+import argparse
+import threading
+from urllib.parse import urlparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+SESSION_COOKIE = "replay_session"
+
+# Same selectors as the real SEED login form
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><title>SEED Login (replay)</title></head>
+<body>
+<form method="GET" action="/replay-login">
+  <input class="testEmailInput" name="email" type="text">
+  <input class="testPasswordInput" name="password" type="password">
+  <button class="testSignInButton" type="submit">Sign In</button>
+</form>
+</body></html>"""
+
+HOME_PAGE = """<!DOCTYPE html>
+<html><head><title>Home (replay)</title></head><body><h1>Home</h1></body></html>"""
+
+EXPORT_PAGE = """<!DOCTYPE html>
+<html><head><title>Item Import/Export (replay)</title></head>
+<body><a href="/{cluster}/ItemImportExport/ExcelExport"><button type="button">Export Importable Data</button></a></body></html>"""
+
+class ReplayServer:
+    """
+    Threaded HTTP server replaying a fixture file
+    """
+
+    def __init__(self, fixture_path, latency_ms=0, jitter_ms=0, host="127.0.0.1", port=0):
+        """
+        Initialize replay server
+
+        Args:
+            fixture_path (str): Fixture JSON from benchmarks.recorder
+            latency_ms (int): Delay added to every response
+            jitter_ms (int): Random extra delay (0..jitter_ms)
+            host (str): Bind address
+            port (int): Bind port (0 = any free port)
+        """
+        with open(fixture_path, 'r', encoding='utf-8') as file:
+            fixture = json.load(file)
+
+        self.metadata = fixture.get('metadata', {})
+        self.cluster = self.metadata.get('cluster', 'cs1')
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.entries = {}
+        self.entries_by_path = {}
+        for entry in fixture['entries']:
+            path = entry['request']['path']
+            self.entries[path] = entry['response']
+            self.entries_by_path.setdefault(urlparse(path).path, entry['response'])
+
+        self.request_count = 0
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.thread = None
+
+    @property
+    def base_url(self):
+        """URL to use as SEED_BASE_URL"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve in a background thread"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def delay(self):
+        """Simulate network latency"""
+        delay_ms = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+
+    def find_response(self, path):
+        """Look up a recorded response by path+query, then by path alone"""
+        return self.entries.get(path) or self.entries_by_path.get(urlparse(path).path)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass  # Keep benchmark output clean
+
+            def do_GET(self):
+                server.request_count += 1
+                server.delay()
+                path = urlparse(self.path).path
+
+                if path in ("/", "/Login"):
+                    return self.send_body(200, "text/html; charset=utf-8", LOGIN_PAGE.encode())
+
+                if path == "/replay-login":
+                    self.send_response(302)
+                    self.send_header("Set-Cookie", f"{SESSION_COOKIE}=1; Path=/")
+                    self.send_header("Location", f"/{server.cluster}/Home")
+                    self.end_headers()
+                    return
+
+                # Everything else requires the login cookie, like SEED
+                if f"{SESSION_COOKIE}=1" not in (self.headers.get("Cookie") or ""):
+                    self.send_response(302)
+                    self.send_header("Location", "/Login")
+                    self.end_headers()
+                    return
+
+                if path.rstrip("/").endswith("/ItemImportExport"):
+                    page = EXPORT_PAGE.format(cluster=server.cluster).encode()
+                    return self.send_body(200, "text/html; charset=utf-8", page)
+
+                recorded = server.find_response(self.path)
+                if recorded:
+                    if 'text' in recorded:
+                        body = recorded['text'].encode("utf-8")
+                    else:
+                        body = base64.b64decode(recorded['base64'])
+                    extra_headers = {name: value for name, value in recorded['headers'].items()
+                                     if name.lower() == "content-disposition"}
+                    return self.send_body(recorded['status'], recorded['content_type'], body, extra_headers)
+
+                if path.endswith("/Home"):
+                    return self.send_body(200, "text/html; charset=utf-8", HOME_PAGE.encode())
+
+                self.send_body(404, "text/plain", b"Not recorded")
+
+            def send_body(self, status, content_type, body, extra_headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (extra_headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Replay recorded SEED fixtures locally")
+    parser.add_argument("fixture", help="Fixture JSON from benchmarks.recorder")
+    parser.add_argument("--latency", type=int, default=0, help="Latency per response in ms")
+    parser.add_argument("--jitter", type=int, default=0, help="Random extra latency in ms")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    args = parser.parse_args()
+
+    server = ReplayServer(args.fixture, args.latency, args.jitter, port=args.port)
+    print(f"🔁 Replaying {len(server.entries)} responses at {server.base_url}")
+    print(f"   Set SEED_BASE_URL={server.base_url} to point the scrapers here (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+SEED Scraper Benchmarks
+======================
+
+Times login, navigation, extraction and export for each scraper strategy
+against the offline replay server. No network access needed.
+
+Usage:
+    python -m benchmarks.run_benchmarks benchmarks/fixtures/seed_2025-08-01.json --latency 150 --repeat 3
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import statistics
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.replay_server import ReplayServer
+
+STRATEGIES = ["browser_sequential", "browser_parallel", "http"]
+
+class StageTimer:
+    """Collects stage durations for one benchmark run"""
+
+    def __init__(self):
+        self.timings = {}
+
+    async def time(self, stage, coroutine):
+        start = time.perf_counter()
+        result = await coroutine
+        self.timings[stage] = time.perf_counter() - start
+        return result
+
+def configure_offline_environment(base_url, session_directory):
+    """
+    Point the scrapers at the replay server before they are imported
+
+    Args:
+        base_url (str): Replay server URL
+        session_directory (str): Throwaway directory for the replay session file
+    """
+    os.environ["SEED_BASE_URL"] = base_url
+    os.environ["SEED_SESSION_FILE"] = os.path.join(session_directory, "seed_session.json")
+    os.environ.setdefault("SEED_USERNAME", "replay-user")
+    os.environ.setdefault("SEED_PASSWORD", "replay-password")
+
+async def run_inventory_strategy(strategy, target_date, headless=True):
+    """
+    Benchmark one inventory confirmation strategy
+
+    Returns:
+        dict: Stage timings and record counts
+    """
+    from web_automation.inventory_confirmation_scraper import InventoryConfirmationScraper
+
+    timer = StageTimer()
+    scraper = InventoryConfirmationScraper(headless=headless, use_cache=False)
+    try:
+        if strategy == "http":
+            # Session restore happens once per run, the pages are fetched without rendering
+            routes = await timer.time("extraction", scraper.get_incomplete_routes_http(target_date))
+        else:
+            await timer.time("login", scraper.setup_and_login(force_login=True))
+            await timer.time("navigation", scraper.navigate_to_route_summary(target_date))
+            concurrency = 1 if strategy == "browser_sequential" else 4
+            routes = await timer.time("extraction", scraper.get_incomplete_routes(target_date, concurrency=concurrency))
+    finally:
+        await scraper.cleanup_browser()
+
+    return {
+        'timings': timer.timings,
+        'routes': len(routes.routes),
+        'assets': routes.asset_count
+    }
+
+async def run_export_strategy(strategy, headless=True):
+    """
+    Benchmark one product list export strategy ("browser" or "http")
+
+    Returns:
+        dict: Stage timings
+    """
+    from web_automation.items_scraper import ItemsScraper
+    from utils.seed_http import SeedHttpClient
+
+    timer = StageTimer()
+    if strategy == "http":
+        client = SeedHttpClient.from_session_cache()
+        try:
+            target_path = os.path.join(tempfile.mkdtemp(), "ItemImportExample.xlsx")
+            await timer.time("export", asyncio.to_thread(client.download_product_list, target_path))
+        finally:
+            client.close()
+    else:
+        scraper = ItemsScraper(headless=headless)
+        try:
+            await timer.time("login", scraper.setup_and_login())
+            await timer.time("export", scraper.download_items_list())
+        finally:
+            await scraper.cleanup_browser()
+    return {'timings': timer.timings}
+
+def summarize(runs):
+    """Median and min per stage over repeated runs"""
+    stages = sorted({stage for run in runs for stage in run['timings']})
+    summary = {}
+    for stage in stages:
+        values = [run['timings'][stage] for run in runs if stage in run['timings']]
+        summary[stage] = {'median': statistics.median(values), 'min': min(values), 'runs': len(values)}
+    summary['total'] = {'median': statistics.median(sum(run['timings'].values()) for run in runs)}
+    return summary
+
+async def run_benchmarks(fixture_path, latency_ms, jitter_ms, repeat, headless, include_export):
+    """
+    Run every strategy against the replay server
+
+    Returns:
+        dict: Summary per strategy
+    """
+    with ReplayServer(fixture_path, latency_ms, jitter_ms) as server, tempfile.TemporaryDirectory() as session_directory:
+        configure_offline_environment(server.base_url, session_directory)
+        target_date = server.metadata['target_date']
+        print(f"🔁 Replay server at {server.base_url} ({latency_ms}ms latency, {jitter_ms}ms jitter)")
+
+        results = {}
+        for strategy in STRATEGIES:
+            runs = []
+            for _ in range(repeat):
+                runs.append(await run_inventory_strategy(strategy, target_date, headless))
+            results[f"inventory_{strategy}"] = {'summary': summarize(runs), 'routes': runs[-1]['routes'], 'assets': runs[-1]['assets']}
+
+        if include_export:
+            for strategy in ("browser", "http"):
+                runs = [await run_export_strategy(strategy, headless) for _ in range(repeat)]
+                results[f"export_{strategy}"] = {'summary': summarize(runs)}
+
+        results['requests_served'] = server.request_count
+        return results
+
+def print_results(results):
+    """Print a timing table"""
+    print("\n🏁 BENCHMARK RESULTS (median seconds)")
+    print("=" * 70)
+    print(f"{'Strategy':<30}{'login':>9}{'navigate':>10}{'extract':>10}{'export':>9}{'total':>9}")
+    for name, result in results.items():
+        if name == 'requests_served':
+            continue
+        summary = result['summary']
+        cells = [summary.get(stage, {}).get('median') for stage in ('login', 'navigation', 'extraction', 'export', 'total')]
+        formatted = [f"{value:.2f}" if value is not None else "-" for value in cells]
+        print(f"{name:<30}{formatted[0]:>9}{formatted[1]:>10}{formatted[2]:>10}{formatted[3]:>9}{formatted[4]:>9}")
+    print(f"\n📡 Requests served: {results['requests_served']}")
+
+def main():
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark SEED scraper strategies offline")
+    parser.add_argument("fixture", help="Fixture JSON from benchmarks.recorder")
+    parser.add_argument("--latency", type=int, default=100, help="Latency per response in ms")
+    parser.add_argument("--jitter", type=int, default=0, help="Random extra latency in ms")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per strategy")
+    parser.add_argument("--visible", action="store_true", help="Show the browser")
+    parser.add_argument("--skip-export", action="store_true", help="Skip product list export benchmarks")
+    parser.add_argument("--output", help="Write results JSON to this path")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmarks(
+        args.fixture, args.latency, args.jitter, args.repeat, not args.visible, not args.skip_export
+    ))
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+        print(f"💾 Results saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
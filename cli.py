@@ -0,0 +1,308 @@
+"""
+MONUMATOR - Command-Line Batch Runner
+=====================================
+
+Runs reports without the menu, for Task Scheduler and scripts:
+
+    python main.py daily
+    python main.py inventory_confirmation --date 2025-01-17 --output-dir D:/Reports
+    python main.py all --parallel 2 --json-output downloads/last_run.json
+    python main.py --schedule          # Run SCHEDULED_JOBS before their deadlines
+    python main.py --history 14        # Stage timings and regressions of the last 14 days
+
+Progress output goes to stderr; the JSON results go to stdout (or --json-output).
+
+Exit codes:
+    0   every report succeeded (or was skipped as not ready)
+    1   at least one report failed
+    2   usage error (unknown report, bad date, ...)
+    130 interrupted
+"""
+
+import sys
+import json
+import time
+import argparse
+import threading
+import contextvars
+from datetime import datetime
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+
+from config.report_config import PERFORMANCE_HISTORY_SETTINGS
+from reports.report_registry import REPORTS, GROUPS, resolve_reports
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+# Browser reports share the SEED Firefox profile, so only one runs at a time
+_browser_lock = threading.Lock()
+
+# Runner option -> command-line flag
+_OPTION_FLAGS = {
+    'date': "--date",
+    'end_date': "--end-date",
+    'output_directory': "--output-dir",
+    'headless': "--visible",
+    'resume': "--resume"
+}
+
+def _valid_date(value: str) -> str:
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}' (expected YYYY-MM-DD)")
+    return value
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser for the batch runner"""
+    parser = argparse.ArgumentParser(
+        prog="monumator",
+        description="Run Monumator reports without the interactive menu.",
+        epilog=f"Groups: {', '.join(GROUPS)}. Use --list to see every report."
+    )
+    parser.add_argument("reports", nargs="*", metavar="REPORT",
+                        help="Report or group names to run, in order")
+    parser.add_argument("--list", action="store_true", help="List reports and groups, then exit")
+    parser.add_argument("--schedule", action="store_true",
+                        help="Run the scheduled jobs (SCHEDULED_JOBS) before their deadlines until stopped")
+    parser.add_argument("--plan", action="store_true", help="Show when each scheduled job will pre-warm and start")
+    parser.add_argument("--history", type=int, nargs="?", const=PERFORMANCE_HISTORY_SETTINGS["days"],
+                        metavar="DAYS", help="Show p50/p95 stage timings and regressions from the run history")
+    parser.add_argument("--date", type=_valid_date,
+                        help="Target date YYYY-MM-DD (start date for inventory_confirmation_sweep, last day of the week for weekly reports)")
+    parser.add_argument("--end-date", type=_valid_date, help="End date YYYY-MM-DD for inventory_confirmation_sweep")
+    parser.add_argument("--visible", action="store_true", help="Show the browser (headless by default)")
+    parser.add_argument("--parallel", type=int, default=1, metavar="N",
+                        help="Run up to N reports at the same time (default: 1)")
+    parser.add_argument("--trace", action="store_true",
+                        help="Write a timeline of DB, HTTP, browser and Excel spans to each run's directory (trace.json)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Write sampled CPU stacks (flame graph) and top allocations per stage to each run's directory")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue each report from its last failed run's completed stages")
+    parser.add_argument("--output-dir", help="Directory for generated reports (default: each report's own)")
+    parser.add_argument("--json-output", metavar="PATH", help="Write the JSON results to a file instead of stdout")
+    return parser
+
+def list_reports() -> str:
+    """Report and group names with the options each report accepts"""
+    lines = ["Reports:"]
+    for name, entry in REPORTS.items():
+        options = ", ".join(_OPTION_FLAGS[option] for option in entry.options) or "none"
+        lines.append(f"  {name:<30} {entry.title} [{entry.group}] (options: {options})")
+    lines.append("\nGroups:")
+    for name, members in GROUPS.items():
+        lines.append(f"  {name:<30} {', '.join(members)}")
+    return "\n".join(lines)
+
+def get_ignored_flags(entry, options: Dict[str, Any]) -> List[str]:
+    """
+    Command-line flags that were given but the report does not take
+
+    Args:
+        entry: ReportEntry to run
+        options: Runner options (headless is always set, so only --visible counts as given)
+
+    Returns:
+        list: Flags such as "--date" that the report will not see
+    """
+    return [_OPTION_FLAGS[option] for option, value in options.items()
+            if value is not None and not (option == 'headless' and value)
+            and option in _OPTION_FLAGS and not entry.accepts(option)]
+
+def run_report(entry, options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one report and describe the outcome
+
+    Args:
+        entry: ReportEntry to run
+        options: Runner options (date, end_date, output_directory, headless, resume)
+
+    Returns:
+        dict: {'report', 'status' (success/failed/skipped), 'elapsed_time', 'result' or 'error',
+               'ignored_options' when flags were given that the report does not take}
+    """
+    start_time = time.time()
+    outcome = {'report': entry.name, 'title': entry.title}
+    ignored_flags = get_ignored_flags(entry, options)
+    if ignored_flags:
+        print(f"⚠️ {entry.title} does not take {', '.join(ignored_flags)} - ignored")
+        outcome['ignored_options'] = ignored_flags
+    try:
+        if not entry.is_ready():
+            print(f"⏭️ {entry.title}: not ready for processing - skipped")
+            outcome.update(status='skipped', error='Not ready for processing')
+        else:
+            print(f"🚀 {entry.title}...")
+            if entry.accepts('headless'):
+                with _browser_lock:
+                    result = entry.run(**options)
+            else:
+                result = entry.run(**options)
+            outcome['status'] = 'success' if result.get('success') else 'failed'
+            outcome['result'] = result
+            if not result.get('success'):
+                outcome['error'] = result.get('error', 'Unknown error')
+    except Exception as e:
+        print(f"❌ {entry.title} failed: {str(e)}")
+        outcome.update(status='failed', error=str(e))
+    outcome['elapsed_time'] = time.time() - start_time
+    return outcome
+
+def run_reports(entries: List, options: Dict[str, Any], parallel: int = 1) -> List[Dict[str, Any]]:
+    """
+    Run reports one after another or on a thread pool
+
+    Args:
+        entries: ReportEntry objects to run
+        options: Runner options passed to every report
+        parallel: Maximum reports running at the same time
+
+    Returns:
+        list: Outcomes in the order the reports were given
+    """
+    if parallel <= 1 or len(entries) <= 1:
+        return [run_report(entry, options) for entry in entries]
+
+    # Each worker may drive Excel, so it initializes COM like the task graph's Excel thread
+    from utils.task_graph import initialize_com
+    with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="report", initializer=initialize_com) as executor:
+        # Each report runs in its own copy of the caller's context, so runs don't share a trace
+        futures = [executor.submit(contextvars.copy_context().run, run_report, entry, options) for entry in entries]
+        return [future.result() for future in futures]
+
+def run_scheduler(plan_only: bool = False) -> int:
+    """
+    Show the schedule or run the scheduler until interrupted
+
+    Args:
+        plan_only: Print the next run of every job and exit
+
+    Returns:
+        int: Process exit code
+    """
+    from utils.scheduler import ReportScheduler
+    try:
+        scheduler = ReportScheduler()
+    except (KeyError, ValueError) as e:
+        print(f"monumator: error: invalid SCHEDULED_JOBS entry: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    if plan_only:
+        scheduler.print_plan()
+        return EXIT_OK
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Scheduler stopped")
+    return EXIT_OK
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point
+
+    Args:
+        argv: Arguments without the program name (default: sys.argv[1:])
+
+    Returns:
+        int: Process exit code
+    """
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return EXIT_OK if e.code == 0 else EXIT_USAGE
+
+    if args.list:
+        print(list_reports())
+        return EXIT_OK
+    if args.history is not None:
+        from utils.run_history import print_performance_history
+        print_performance_history(days=args.history)
+        return EXIT_OK
+    if args.schedule or args.plan:
+        if args.reports:
+            print("monumator: error: --schedule/--plan run the configured jobs and take no report names", file=sys.stderr)
+            return EXIT_USAGE
+        return run_scheduler(args.plan)
+    if not args.reports:
+        parser.print_usage(sys.stderr)
+        print("monumator: error: no reports given (see --list)", file=sys.stderr)
+        return EXIT_USAGE
+    if args.parallel < 1:
+        print("monumator: error: --parallel must be at least 1", file=sys.stderr)
+        return EXIT_USAGE
+
+    try:
+        entries = resolve_reports(args.reports)
+    except KeyError as e:
+        print(f"monumator: error: unknown report or group {e} (see --list)", file=sys.stderr)
+        return EXIT_USAGE
+
+    # The sweep needs both ends of the range
+    if any(entry.accepts('end_date') for entry in entries) and not (args.date and args.end_date):
+        print("monumator: error: inventory_confirmation_sweep needs --date and --end-date", file=sys.stderr)
+        return EXIT_USAGE
+    if args.date and args.end_date and args.end_date < args.date:
+        print("monumator: error: --end-date is before --date", file=sys.stderr)
+        return EXIT_USAGE
+
+    if args.trace:
+        from utils.tracing import set_tracing
+        set_tracing(True)
+    if args.profile:
+        from utils.profiling import set_profiling
+        set_profiling(True)
+
+    options = {
+        'date': args.date,
+        'end_date': args.end_date,
+        'output_directory': args.output_dir,
+        'headless': not args.visible,
+        'resume': args.resume or None
+    }
+
+    start_time = time.time()
+    started_at = datetime.now().isoformat(timespec='seconds')
+    interrupted = False
+    try:
+        # Keep stdout clean for the JSON results
+        with redirect_stdout(sys.stderr):
+            outcomes = run_reports(entries, options, args.parallel)
+    except KeyboardInterrupt:
+        interrupted = True
+        outcomes = []
+
+    summary = {
+        'success': not interrupted and all(outcome['status'] != 'failed' for outcome in outcomes),
+        'started_at': started_at,
+        'elapsed_time': time.time() - start_time,
+        'options': {**options, 'parallel': args.parallel},
+        'counts': {status: sum(1 for outcome in outcomes if outcome['status'] == status)
+                   for status in ('success', 'failed', 'skipped')},
+        'reports': outcomes,
+        'interrupted': interrupted
+    }
+
+    # Results may hold paths, dates or DataFrame-derived values; anything unusual becomes a string
+    payload = json.dumps(summary, indent=2, default=str)
+    if args.json_output:
+        try:
+            with open(args.json_output, 'w') as file:
+                file.write(payload)
+        except OSError as e:
+            print(f"❌ Could not write {args.json_output}: {str(e)}", file=sys.stderr)
+            print(payload)
+    else:
+        print(payload)
+
+    if interrupted:
+        return EXIT_INTERRUPTED
+    return EXIT_OK if summary['success'] else EXIT_FAILED
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,47 +4,87 @@ Database Configuration
 
 This module contains database connection configuration for the Lightspeed database.
 Provides connection settings, connection management, and database utilities.
+
+Credentials are read from the environment the first time a connection
+setting is needed, so menus and reports that never touch the database
+start without them (and without loading pyodbc/pandas).
 """
 
-import pyodbc
-import pandas as pd
 from datetime import datetime
-import logging
 import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
-# Get database credentials from environment variables
-DB_USERNAME = os.getenv('DB_USERNAME')
-DB_PASSWORD = os.getenv('DB_PASSWORD')
-
-if not DB_USERNAME or not DB_PASSWORD:
-    raise ValueError("DB_USERNAME and DB_PASSWORD must be set in .env file")
+DB_SERVER = "10.216.207.32"
 
 # Dual Database Connection Configuration
 # Based on Access setup: dbo_ItemView connects to LightSpeed, dbo_AreaItemParView connects to Level
-LIGHTSPEED_CONNECTION = {
-    "dsn": "Lightspeed",
-    "uid": DB_USERNAME, 
-    "pwd": DB_PASSWORD,
-    "database": "LightSpeed",
-    "connection_string": f"DRIVER={{SQL Server}};SERVER=10.216.207.32;DATABASE=LightSpeed;UID={DB_USERNAME};PWD={DB_PASSWORD}"
-}
-
-LEVEL_CONNECTION = {
-    "dsn": "Lightspeed", 
-    "uid": DB_USERNAME,
-    "pwd": DB_PASSWORD,
-    "database": "Level",
-    "connection_string": f"DRIVER={{SQL Server}};SERVER=10.216.207.32;DATABASE=Level;UID={DB_USERNAME};PWD={DB_PASSWORD}"
+DATABASES = {
+    "lightspeed": "LightSpeed",
+    "level": "Level"
 }
 
 # Database query timeout settings
 QUERY_TIMEOUT = 300  # 5 minutes
 CONNECTION_TIMEOUT = 60  # 1 minute
 
+_connection_configs = {}
+
+def get_database_credentials():
+    """
+    Read database credentials from the environment (.env)
+    
+    Returns:
+        tuple: (username, password)
+        
+    Raises:
+        ValueError: If DB_USERNAME or DB_PASSWORD is missing
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    username = os.getenv('DB_USERNAME')
+    password = os.getenv('DB_PASSWORD')
+    if not username or not password:
+        raise ValueError("DB_USERNAME and DB_PASSWORD must be set in .env file")
+    return username, password
+
+def get_connection_config(database_type="lightspeed"):
+    """
+    Connection settings for a database, built on first use
+    
+    Args:
+        database_type (str): Key of DATABASES, e.g. "lightspeed" or "level" (unknown types use LightSpeed)
+        
+    Returns:
+        dict: dsn, uid, pwd, database and connection_string
+        
+    Raises:
+        ValueError: If credentials are missing
+    """
+    database_type = database_type.lower()
+    if database_type not in DATABASES:
+        database_type = "lightspeed"
+    if database_type not in _connection_configs:
+        username, password = get_database_credentials()
+        database = DATABASES[database_type]
+        _connection_configs[database_type] = {
+            "dsn": "Lightspeed",
+            "uid": username,
+            "pwd": password,
+            "database": database,
+            "connection_string": f"DRIVER={{SQL Server}};SERVER={DB_SERVER};DATABASE={database};UID={username};PWD={password}"
+        }
+    return _connection_configs[database_type]
+
+def __getattr__(name):
+    # LIGHTSPEED_CONNECTION / LEVEL_CONNECTION / DB_USERNAME / DB_PASSWORD resolve on first access
+    if name == "LIGHTSPEED_CONNECTION":
+        return get_connection_config("lightspeed")
+    if name == "LEVEL_CONNECTION":
+        return get_connection_config("level")
+    if name in ("DB_USERNAME", "DB_PASSWORD"):
+        return get_database_credentials()[0 if name == "DB_USERNAME" else 1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def get_database_connection(database_type="lightspeed"):
     """
     Create and return a database connection to specified database
@@ -58,13 +98,10 @@ def get_database_connection(database_type="lightspeed"):
     Raises:
         Exception: If connection fails
     """
+    import pyodbc
     try:
-        if database_type.lower() == "level":
-            connection_config = LEVEL_CONNECTION
-            db_name = "Level"
-        else:
-            connection_config = LIGHTSPEED_CONNECTION
-            db_name = "LightSpeed"
+        connection_config = get_connection_config(database_type)
+        db_name = connection_config["database"]
             
         connection = pyodbc.connect(
             connection_config["connection_string"],
@@ -103,6 +140,7 @@ def execute_query(connection, query, params=None):
     Raises:
         Exception: If query execution fails
     """
+    import pandas as pd
     try:
         if params:
             df = pd.read_sql(query, connection, params=params)
@@ -153,9 +191,10 @@ def get_connection_info():
     Returns:
         dict: Connection information
     """
+    lightspeed_connection = get_connection_config("lightspeed")
     return {
-        "dsn": LIGHTSPEED_CONNECTION["dsn"],
-        "user": LIGHTSPEED_CONNECTION["uid"],
+        "dsn": lightspeed_connection["dsn"],
+        "user": lightspeed_connection["uid"],
         "timeout": QUERY_TIMEOUT,
         "connection_timeout": CONNECTION_TIMEOUT
     } 
\ No newline at end of file
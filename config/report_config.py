@@ -6,6 +6,8 @@ This module contains all configuration settings for the SEED report automation s
 Centralizes report IDs, download paths, and report type definitions for easy maintenance.
 """
 
+import os
+
 # SEED API Report IDs mapped to descriptive names
 SEED_REPORTS = {
     "daily_fill_oos": "33105",
@@ -23,7 +25,18 @@ SEED_REPORTS = {
 DOWNLOAD_PATHS = {
     "weekly": "downloads/weekly/",
     "daily": "downloads/daily/", 
-    "temp": "downloads/temp/"
+    "temp": "downloads/temp/",
+    "cache": "downloads/cache/",
+    "runs": "downloads/runs/"
+}
+
+# Weekly reports (report_workflows/weekly): each covers the seven days ending on the
+# last week_end_weekday before today (0=Monday ... 6=Sunday) unless a date is given.
+# SEED weekly reports always return the last completed week, so week_end_weekday must
+# match the week they are set up with in SEED; other weeks are only queried from SQL
+WEEKLY_REPORT_SETTINGS = {
+    "week_end_weekday": 6,
+    "output_directory": "downloads/weekly"
 }
 
 # Report type groupings
@@ -38,5 +51,176 @@ SEED_API_ENDPOINT = "/Reports/Run"
 # Download settings
 MAX_CONCURRENT_DOWNLOADS = 25
 
+# Download cache freshness (seconds) for reports covering today's business date.
+# Reports for past business dates never change and are kept permanently.
+DOWNLOAD_CACHE_TTL = {
+    "default": 900,          # 15 minutes
+    "daily_fill_oos": 300,   # Fill/OOS changes throughout the morning
+}
+
+# SEED website (override with SEED_BASE_URL to point scrapers at the offline replay server)
+SEED_BASE_URL = os.getenv("SEED_BASE_URL", "https://mycantaloupe.com")
+
 # Product List API Configuration
-PRODUCT_LIST_API_ENDPOINT = "https://mycantaloupe.com/cs4/ItemImportExport/ExcelExport" 
\ No newline at end of file
+PRODUCT_LIST_API_ENDPOINT = f"{SEED_BASE_URL}/cs4/ItemImportExport/ExcelExport"
+
+# Product list download mode: "http" streams the export with saved SEED cookies
+# (browser login only when the cookies have expired), "browser" clicks the export button
+PRODUCT_LIST_DOWNLOAD_MODE = "http"
+
+# Saved SEED session (Playwright storage state + cluster) reused across runs
+SEED_SESSION_FILE = os.getenv("SEED_SESSION_FILE", "web_automation/seed_session.json")
+SEED_SESSION_MAX_AGE = 8 * 60 * 60  # Don't try sessions older than 8 hours
+
+# Inventory confirmation: route detail pages opened in parallel tabs (1 = click through one by one)
+ROUTE_DRILL_DOWN_CONCURRENCY = 4
+
+# Inventory confirmation scrape mode: "http" reads RoutesSummary/route HTML with the saved
+# SEED session (browser fallback when a page needs JavaScript), "browser" renders every page
+INVENTORY_SCRAPE_MODE = "http"
+
+# Inventory confirmation route results cached per date (downloads/cache/routes/).
+# Dates more than this many days old are treated as closed: cached routes are reused
+# and only routes that failed or are missing from the cache are fetched again.
+ROUTE_CACHE_IMMUTABLE_AFTER_DAYS = 3
+# Open (recent) dates still change in SEED: their cached routes are only reused for
+# this many seconds, so a rerun or sweep shortly after a run skips the scrape
+ROUTE_CACHE_OPEN_DATE_TTL = 900
+
+# Workflow run directories (downloads/runs/) with stage checkpoints for resuming failed runs
+RUN_RETENTION_DAYS = 7
+
+# Multi-day inventory confirmation sweep: dates scraped at the same time
+SWEEP_DATE_CONCURRENCY = 3
+
+# Concurrent daily run: maximum steps holding each shared resource at once
+CONCURRENT_RESOURCE_LIMITS = {
+    "browser": 2,   # Firefox pages (one shared browser process)
+    "db": 2,        # Open LightSpeed/Level connections
+    "api": 4        # SEED report API downloads
+}
+ROUTE_HTTP_CONCURRENCY = 8
+
+# Playwright network resource policies per scraper
+# block_types: Playwright resource types to abort
+# stub_types: resource types answered with an empty 200 response (pages that reference them keep working)
+# block_domains: third-party hosts (analytics/trackers) that are always stubbed
+# allow_patterns: URL substrings that are never blocked
+_TRACKER_DOMAINS = [
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "hotjar.com",
+    "segment.io", "segment.com", "nr-data.net", "newrelic.com", "fullstory.com",
+    "intercom.io", "clarity.ms", "facebook.net"
+]
+RESOURCE_POLICY_PROFILES = {
+    # Nothing blocked; baseline for the bytes loaded under the other profiles
+    "off": {
+        "block_types": [],
+        "stub_types": [],
+        "block_domains": [],
+        "allow_patterns": []
+    },
+    # Login/navigation only: keep CSS so visibility checks behave like a normal page
+    "seed_default": {
+        "block_types": ["image", "media", "font"],
+        "stub_types": [],
+        "block_domains": _TRACKER_DOMAINS,
+        "allow_patterns": ["/Account/", "/Login"]
+    },
+    # Export button needs the page's scripts and layout
+    "items_export": {
+        "block_types": ["image", "media", "font"],
+        "stub_types": [],
+        "block_domains": _TRACKER_DOMAINS,
+        "allow_patterns": ["/ItemImportExport/"]
+    },
+    # Table reading only
+    "inventory_confirmation": {
+        "block_types": ["image", "media", "font"],
+        "stub_types": ["stylesheet"],
+        "block_domains": _TRACKER_DOMAINS,
+        "allow_patterns": ["/Account/", "/Login"]
+    },
+}
+
+# Warm browser daemon: one logged-in Firefox kept alive while Monumator runs
+# Enable with MONUMATOR_WARM_BROWSER=1
+WARM_BROWSER_ENABLED = os.getenv("MONUMATOR_WARM_BROWSER", "0") == "1"
+WARM_BROWSER_SETTINGS = {
+    "max_pages": 200,               # Recycle the browser after this many pages
+    "max_memory_mb": 1500,          # Recycle when Firefox processes exceed this RSS (needs psutil)
+    "health_check_interval": 60,    # Seconds between health checks
+    "max_concurrent_pages": 4,      # Pages leased at the same time
+    "startup_timeout": 60           # Seconds a caller waits for the first login
+}
+
+# Scraper page/context recycling for long sessions (checked by BaseScraper.checkpoint_page)
+BROWSER_RECYCLE_SETTINGS = {
+    "max_navigations_per_page": 40,   # Replace the page (same context, same URL) after this many navigations
+    "max_pages_per_context": 300,     # Replace the context (cookies carried over) after this many navigations
+    "max_browser_memory_mb": 1200,    # Replace the context when Firefox processes exceed this RSS (needs psutil)
+    "sample_every": 5                 # Navigations between memory samples
+}
+
+# Memory samples and recycle events, one JSON object per line
+BROWSER_METRICS_FILE = os.getenv("BROWSER_METRICS_FILE", "web_automation/browser_metrics.jsonl")
+
+# Scheduler mode (python main.py --schedule): jobs with a completion deadline.
+# reports: report or group names from reports/report_registry.py
+# deadline: HH:MM the reports must be ready by; weekdays: 0=Monday ... 6=Sunday
+SCHEDULED_JOBS = [
+    {"name": "morning_daily", "reports": ["daily"], "deadline": "07:30", "weekdays": [0, 1, 2, 3, 4], "parallel": 2},
+]
+SCHEDULER_SETTINGS = {
+    "prewarm_minutes": 10,              # Warm DB, SEED session and templates this long before the start
+    "safety_margin": 0.25,              # Start this fraction of the expected duration earlier still
+    "default_duration_minutes": 20,     # Expected duration before a job has any history
+    "duration_history": 20,             # Past durations kept per job
+    "poll_seconds": 20,                 # Scheduler loop interval
+    "durations_file": "downloads/cache/scheduler_durations.json",
+    "log_file": "downloads/scheduler_log.jsonl"
+}
+
+# Run history (per-stage timings, rows, bytes, peak memory) for the Performance History view
+RUN_HISTORY_DB = os.getenv("RUN_HISTORY_DB", "downloads/cache/run_history.sqlite3")
+PERFORMANCE_HISTORY_SETTINGS = {
+    "days": 30,                     # History shown by default
+    "baseline_runs": 20,            # Previous runs the baseline median is taken from
+    "min_baseline_runs": 5,         # Runs needed before a stage can be flagged
+    "regression_factor": 1.5,       # Flag a stage whose latest run exceeds this multiple of its baseline
+    "min_regression_seconds": 2.0,  # ...and is at least this much slower
+    "sample_interval": 0.25         # Seconds between process memory samples during a run
+}
+
+# Tracing: nested spans (DB queries, SEED HTTP, browser, Excel) written per run as
+# downloads/runs/<workflow>/<run>/trace.json (Chrome trace format, open in ui.perfetto.dev)
+TRACING_SETTINGS = {
+    "enabled": os.getenv("MONUMATOR_TRACE", "0") == "1",  # Also: python main.py ... --trace
+    "max_spans": 50000                                      # Spans kept per run; later ones are counted only
+}
+
+# Profiling: sampling CPU profiler (folded stacks for flame graphs) and tracemalloc
+# allocation reports per stage, written to downloads/runs/<workflow>/<run>/profile/
+PROFILING_SETTINGS = {
+    "enabled": os.getenv("MONUMATOR_PROFILE", "0") == "1",  # Also: --profile, or the Daily Reports menu switch
+    "sample_interval_ms": 5,       # Time between stack samples of every thread
+    "include_idle": False,         # Keep samples of threads blocked in waits/selects (wall-clock view)
+    "allocation_frames": 1,        # Traceback depth tracemalloc records per allocation
+    "top_allocations": 25,         # Allocation sites listed per stage
+    "top_functions": 10            # Hottest project functions printed after the run
+}
+
+# Memory budgets (process RSS in MB) per workflow. A stage that is expected to push
+# the run past its budget switches to a chunked mode where one exists, or the run
+# fails before the stage starts. Needs psutil; remove a workflow to disable its budget.
+MEMORY_BUDGETS_MB = {
+    "stockout": 1500,
+    "inventory_adjustment": 3000,
+    "inventory_confirmation": 2000,
+    "concurrent_daily": 4000,
+    "weekly_reports": 3000
+}
+MEMORY_BUDGET_SETTINGS = {
+    "pressure_fraction": 0.8,       # Switch to chunked modes above this fraction of the budget
+    "growth_percentile": 95,        # Expected stage growth: this percentile of past runs
+    "chunk_rows": 5000              # Rows per Excel write in chunked mode
+}
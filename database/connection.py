@@ -6,10 +6,9 @@ Handles all database connections for Lightspeed and Level databases.
 Provides connection pooling and error handling.
 """
 
-import pyodbc
-import pandas as pd
 from datetime import datetime
-from config.database_config import LIGHTSPEED_CONNECTION, LEVEL_CONNECTION, QUERY_TIMEOUT, CONNECTION_TIMEOUT
+from config.database_config import get_connection_config, QUERY_TIMEOUT, CONNECTION_TIMEOUT
+from utils.tracing import span
 
 def get_database_connection(database_type="lightspeed"):
     """
@@ -24,16 +23,16 @@ def get_database_connection(database_type="lightspeed"):
     Raises:
         Exception: If connection fails
     """
+    # pyodbc and the credentials load with the first connection
+    import pyodbc
     try:
-        if database_type.lower() == "level":
-            connection_config = LEVEL_CONNECTION
-        else:
-            connection_config = LIGHTSPEED_CONNECTION
+        connection_config = get_connection_config(database_type)
             
-        connection = pyodbc.connect(
-            connection_config["connection_string"],
-            timeout=CONNECTION_TIMEOUT
-        )
+        with span("db.connect", database=database_type):
+            connection = pyodbc.connect(
+                connection_config["connection_string"],
+                timeout=CONNECTION_TIMEOUT
+            )
         return connection
     except Exception as e:
         raise
@@ -61,15 +60,17 @@ def execute_query(connection, query, params=None):
     Raises:
         Exception: If query execution fails
     """
+    import pandas as pd
     try:
         import warnings
         # Suppress pandas SQLAlchemy warning
-        with warnings.catch_warnings():
+        with span("db.query") as current, warnings.catch_warnings():
             warnings.simplefilter("ignore")
             if params:
                 df = pd.read_sql(query, connection, params=params)
             else:
                 df = pd.read_sql(query, connection)
+            current.set(rows=len(df))
         return df
     except Exception as e:
         raise
@@ -138,9 +139,10 @@ def get_connection_info():
     Returns:
         dict: Connection information
     """
+    lightspeed_connection = get_connection_config("lightspeed")
     return {
-        "dsn": LIGHTSPEED_CONNECTION["dsn"],
-        "user": LIGHTSPEED_CONNECTION["uid"],
+        "dsn": lightspeed_connection["dsn"],
+        "user": lightspeed_connection["uid"],
         "timeout": QUERY_TIMEOUT,
         "connection_timeout": CONNECTION_TIMEOUT
     }
\ No newline at end of file
@@ -9,6 +9,7 @@ Simplified to use SQL for all logic instead of pandas post-processing.
 import pandas as pd
 import warnings
 from datetime import datetime
+from utils.tracing import span, traced
 from .connection import get_lightspeed_connection, execute_query
 
 def get_highlights_data():
@@ -63,9 +64,10 @@ def get_highlights_data():
     
     try:
         lightspeed_conn = get_lightspeed_connection()
-        with warnings.catch_warnings():
+        with span("db.query", query="highlights") as current, warnings.catch_warnings():
             warnings.simplefilter("ignore")
             df = pd.read_sql(query, lightspeed_conn)
+            current.set(rows=len(df))
         lightspeed_conn.close()
         
         return df
@@ -124,9 +126,10 @@ def get_markets_data():
     
     try:
         lightspeed_conn = get_lightspeed_connection()
-        with warnings.catch_warnings():
+        with span("db.query", query="markets") as current, warnings.catch_warnings():
             warnings.simplefilter("ignore")
             df = pd.read_sql(query, lightspeed_conn)
+            current.set(rows=len(df))
         lightspeed_conn.close()
         
         return df
@@ -157,9 +160,10 @@ def get_null_orders_data():
     
     try:
         lightspeed_conn = get_lightspeed_connection()
-        with warnings.catch_warnings():
+        with span("db.query", query="null_orders") as current, warnings.catch_warnings():
             warnings.simplefilter("ignore")
             df = pd.read_sql(query, lightspeed_conn)
+            current.set(rows=len(df))
         lightspeed_conn.close()
         
         return df
@@ -215,9 +219,10 @@ def get_ocs_data():
     
     try:
         lightspeed_conn = get_lightspeed_connection()
-        with warnings.catch_warnings():
+        with span("db.query", query="ocs") as current, warnings.catch_warnings():
             warnings.simplefilter("ignore")
             df = pd.read_sql(query, lightspeed_conn)
+            current.set(rows=len(df))
         lightspeed_conn.close()
         
         return df
@@ -225,6 +230,7 @@ def get_ocs_data():
         print(f"OCS query failed: {str(e)}")
         raise
 
+@traced("db.execute_all_queries")
 def execute_all_queries():
     """
     Execute all four queries and return results
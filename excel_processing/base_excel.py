@@ -9,6 +9,7 @@ Provides template management and common utilities.
 import os
 import shutil
 from datetime import datetime
+from utils.tracing import traced
 
 class ExcelProcessorBase:
     """
@@ -26,13 +27,15 @@ class ExcelProcessorBase:
         self.output_path = None
         
     
-    def create_working_copy(self, output_directory, filename_prefix):
+    @traced("excel.create_working_copy")
+    def create_working_copy(self, output_directory, filename_prefix, date_label=None):
         """
         Create a working copy of the template file
         
         Args:
             output_directory (str): Directory to save the working copy
             filename_prefix (str): Prefix for the output filename
+            date_label (str): Date part of the filename (default: today as MM.DD.YY)
             
         Returns:
             str: Path to the working copy file
@@ -42,7 +45,7 @@ class ExcelProcessorBase:
         
         # Generate output filename with date
         today = datetime.now()
-        date_str = today.strftime("%m.%d.%y")
+        date_str = date_label or today.strftime("%m.%d.%y")
         filename = f"{filename_prefix} {date_str}.xlsx"
         self.output_path = os.path.join(output_directory, filename)
         
@@ -51,6 +54,22 @@ class ExcelProcessorBase:
         
         return self.output_path
     
+    def move_working_copy(self, output_directory):
+        """
+        Move the filled working copy into the output directory
+        
+        Args:
+            output_directory (str): Directory to save the report
+            
+        Returns:
+            str: Path to the report in the output directory
+        """
+        os.makedirs(output_directory, exist_ok=True)
+        output_path = os.path.join(output_directory, os.path.basename(self.output_path))
+        shutil.move(self.output_path, output_path)
+        self.output_path = output_path
+        return output_path
+    
     def cleanup_temp_files(self, *file_paths):
         """
         Clean up temporary files
@@ -8,6 +8,7 @@ Supports complex formula application and Excel automation.
 
 import pandas as pd
 import xlwings as xw
+from utils.tracing import traced, annotate
 from .base_excel import ExcelProcessorBase
 
 class InventoryExcelProcessor(ExcelProcessorBase):
@@ -20,7 +21,9 @@ class InventoryExcelProcessor(ExcelProcessorBase):
         super().__init__(template_path)
         self.workbook = None
         self.app = None
+        self.chunk_rows = None  # Rows per write; None writes each DataFrame in one call
         
+    @traced("excel.load_workbook")
     def load_workbook(self):
         """
         Load the working copy workbook with xlwings
@@ -44,6 +47,7 @@ class InventoryExcelProcessor(ExcelProcessorBase):
                 self.app.quit()
             raise
     
+    @traced("excel.clear_sheet")
     def clear_sheet_data(self, sheet_name, start_row=2):
         """
         Clear data from a sheet while preserving formatting
@@ -67,6 +71,7 @@ class InventoryExcelProcessor(ExcelProcessorBase):
         except Exception as e:
             print(f"⚠️ Could not clear sheet '{sheet_name}': {str(e)}")
     
+    @traced("excel.insert_dataframe")
     def insert_dataframe_to_sheet(self, dataframe, sheet_name, start_row=2, start_col=1, show_message=True):
         """
         Insert a pandas DataFrame into a worksheet
@@ -87,16 +92,22 @@ class InventoryExcelProcessor(ExcelProcessorBase):
         
         try:
             sheet = self.workbook.sheets[sheet_name]
+            annotate(sheet=sheet_name, rows=dataframe.shape[0], columns=dataframe.shape[1])
             
-            # Insert data using xlwings (more efficient than cell-by-cell)
-            target_range = sheet.range((start_row, start_col)).resize(dataframe.shape[0], dataframe.shape[1])
-            target_range.value = dataframe.values
+            # Insert data using xlwings (more efficient than cell-by-cell), in blocks when
+            # chunk_rows is set so only one block's values are converted for COM at a time
+            chunk_rows = self.chunk_rows or len(dataframe)
+            for offset in range(0, len(dataframe), chunk_rows):
+                chunk = dataframe.iloc[offset:offset + chunk_rows]
+                target_range = sheet.range((start_row + offset, start_col)).resize(chunk.shape[0], chunk.shape[1])
+                target_range.value = chunk.values
             
             if show_message:
                 print(f"📊 Inserted {len(dataframe)} rows into sheet '{sheet_name}'")
         except Exception as e:
             print(f"❌ Failed to insert data into sheet '{sheet_name}': {str(e)}")
     
+    @traced("excel.copy_formulas_down")
     def copy_formulas_down(self, sheet_name, num_rows):
         """
         Copy formulas down for the specified number of rows using batch operations
@@ -162,6 +173,7 @@ class InventoryExcelProcessor(ExcelProcessorBase):
         self.clear_sheet_data("Seed Product List")
         self.insert_dataframe_to_sheet(items_data, "Seed Product List")
     
+    @traced("excel.save_workbook")
     def save_and_close_workbook(self):
         """
         Save the workbook and close Excel application
@@ -196,7 +208,8 @@ class InventoryExcelProcessor(ExcelProcessorBase):
                 pass
             raise
     
-    def generate_inventory_adjustment_report(self, iad_data, items_data, output_directory="downloads/daily"):
+    @traced("excel.inventory_adjustment_report")
+    def generate_inventory_adjustment_report(self, iad_data, items_data, output_directory="downloads/daily", chunk_rows=None):
         """
         Complete workflow to generate Inventory Adjustment Report
         
@@ -204,13 +217,17 @@ class InventoryExcelProcessor(ExcelProcessorBase):
             iad_data (pandas.DataFrame): IAD data
             items_data (pandas.DataFrame): Product list data
             output_directory (str): Directory to save the report
+            chunk_rows (int): Write sheets this many rows at a time (less memory)
             
         Returns:
             str: Path to the generated Excel file
         """
+        if chunk_rows:
+            self.chunk_rows = chunk_rows
         try:
-            # Create working copy
-            self.create_working_copy(output_directory, "Inventory Adjustment Summary")
+            # Create working copy (unless it was prepared while the downloads ran)
+            if not self.output_path:
+                self.create_working_copy(output_directory, "Inventory Adjustment Summary")
             
             # Load workbook
             self.load_workbook()
@@ -7,10 +7,13 @@ Generates Excel reports for inventory confirmation data using template.
 
 import os
 import shutil
+import itertools
 import pandas as pd
 from datetime import datetime
 import xlwings as xw
 from excel_processing.base_excel import ExcelProcessorBase
+from utils.route_records import AssetBatch
+from utils.tracing import span, traced
 
 class InventoryConfirmationProcessor(ExcelProcessorBase):
     """Excel processor for inventory confirmation reports"""
@@ -20,48 +23,49 @@ class InventoryConfirmationProcessor(ExcelProcessorBase):
         template_path = os.path.join("templates", "Daily Inventory Confirmation.xlsx")
         super().__init__(template_path)
     
-    def generate_report(self, route_data: list) -> str:
+    @traced("excel.inventory_confirmation_report")
+    def generate_report(self, route_data: AssetBatch, include_date_column: bool = False, date_label: str = None,
+                        output_directory: str = "downloads/daily", chunk_rows: int = None) -> str:
         """
         Generate inventory confirmation report using template
         
         Args:
-            route_data: List of route data with incomplete assets
+            route_data: AssetBatch of routes with incomplete assets
+            include_date_column: Add the route date in column F (multi-day sweeps)
+            date_label: Date part of the filename (default: today)
             output_directory: Directory to save the report
+            chunk_rows: Write this many rows at a time instead of all at once (less memory)
             
         Returns:
             Path to generated Excel file
         """
         # Create working copy of template
-        output_path = self.create_working_copy("downloads/daily", "Daily Inventory Confirmation")
+        output_path = self.create_working_copy(output_directory, "Daily Inventory Confirmation", date_label)
         
-        # Prepare data for Excel - matching template columns exactly
-        all_assets = []
-        
-        for route in route_data:
-            for asset in route.get('incomplete_assets', []):
-                all_assets.append({
-                    'Asset ID': asset.get('asset_id', ''),
-                    'Location / Place': asset.get('location', ''),
-                    'Type': asset.get('type', ''),
-                    'Restock Time': asset.get('restock_time', ''),
-                    "Inventory Req'd/Taken": asset.get('inventory_taken', 'YES/NO')
-                })
-        
-        if all_assets:
+        # Rows come straight from the batch columns, in template column order:
+        # Asset ID, Location / Place, Type, Restock Time, Inventory Req'd/Taken (, Date)
+        if route_data.asset_count:
             # Open with xlwings
             app = xw.App(visible=False)
             wb = app.books.open(output_path)
             ws = wb.sheets.active
             
-            # Start writing data from row 2 (after headers)
-            start_row = 2
-            
-            for idx, asset in enumerate(all_assets, start=start_row):
-                ws.range(f'A{idx}').value = asset['Asset ID']
-                ws.range(f'B{idx}').value = asset['Location / Place'] 
-                ws.range(f'C{idx}').value = asset['Type']
-                ws.range(f'D{idx}').value = asset['Restock Time']
-                ws.range(f'E{idx}').value = asset["Inventory Req'd/Taken"]
+            # Write all rows in one call, starting at row 2 (after headers)
+            with span("excel.write_rows", rows=route_data.asset_count, chunk_rows=chunk_rows):
+                rows = route_data.iter_rows(include_date_column)
+                if chunk_rows:
+                    # Only one block of rows is built at a time
+                    row_number = 2
+                    while True:
+                        block = [list(row) for row in itertools.islice(rows, chunk_rows)]
+                        if not block:
+                            break
+                        ws.range((row_number, 1)).value = block
+                        row_number += len(block)
+                else:
+                    ws.range('A2').value = [list(row) for row in rows]
+            if include_date_column:
+                ws.range('F1').value = 'Date'
             
             # Force recalculation
             app.calculate()
@@ -74,16 +78,20 @@ class InventoryConfirmationProcessor(ExcelProcessorBase):
         
         return output_path
 
-def generate_inventory_confirmation_report(route_data: list) -> str:
+def generate_inventory_confirmation_report(route_data: AssetBatch, include_date_column: bool = False, date_label: str = None,
+                                           output_directory: str = "downloads/daily", chunk_rows: int = None) -> str:
     """
     Convenience function for generating inventory confirmation report
     
     Args:
-        route_data: List of route data with incomplete assets
+        route_data: AssetBatch of routes with incomplete assets
+        include_date_column: Add the route date in column F (multi-day sweeps)
+        date_label: Date part of the filename (default: today)
         output_directory: Directory to save the report
+        chunk_rows: Write this many rows at a time instead of all at once (less memory)
         
     Returns:
         Path to generated Excel file
     """
     processor = InventoryConfirmationProcessor()
-    return processor.generate_report(route_data)
\ No newline at end of file
+    return processor.generate_report(route_data, include_date_column, date_label, output_directory, chunk_rows)
\ No newline at end of file
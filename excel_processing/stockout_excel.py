@@ -9,6 +9,7 @@ Preserves template formatting while inserting data.
 import pandas as pd
 from openpyxl import load_workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
+from utils.tracing import traced, annotate
 from .base_excel import ExcelProcessorBase
 
 class StockoutExcelProcessor(ExcelProcessorBase):
@@ -21,6 +22,7 @@ class StockoutExcelProcessor(ExcelProcessorBase):
         super().__init__(template_path)
         self.workbook = None
         
+    @traced("excel.load_workbook")
     def load_workbook(self):
         """
         Load the working copy workbook
@@ -38,6 +40,7 @@ class StockoutExcelProcessor(ExcelProcessorBase):
             print(f"❌ Failed to load workbook: {str(e)}")
             raise
     
+    @traced("excel.insert_dataframe")
     def insert_dataframe_to_sheet(self, dataframe, sheet_name, start_row=2, start_col=1):
         """
         Insert a pandas DataFrame into a worksheet
@@ -59,6 +62,7 @@ class StockoutExcelProcessor(ExcelProcessorBase):
             return
         
         sheet = self.workbook[sheet_name]
+        annotate(sheet=sheet_name, rows=len(dataframe), columns=len(dataframe.columns))
         
         # Convert DataFrame to rows (without header)
         for row_idx, row_data in enumerate(dataframe_to_rows(dataframe, index=False, header=False), start=start_row):
@@ -85,6 +89,7 @@ class StockoutExcelProcessor(ExcelProcessorBase):
                 # Insert new data directly (template is always blank)
                 self.insert_dataframe_to_sheet(data, sheet_name)
     
+    @traced("excel.save_workbook")
     def save_workbook(self):
         """
         Save the workbook and close it
@@ -103,6 +108,7 @@ class StockoutExcelProcessor(ExcelProcessorBase):
             print(f"❌ Failed to save workbook: {str(e)}")
             raise
     
+    @traced("excel.stockout_report")
     def generate_stockout_report(self, data_dict, output_directory="downloads/daily"):
         """
         Complete workflow to generate Daily Stockout Report
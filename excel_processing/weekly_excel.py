@@ -0,0 +1,125 @@
+"""
+Weekly Report Excel Processing
+==============================
+
+Writes the frames of a weekly report spec to Excel with openpyxl.
+Reports without a template are streamed into a new write-only workbook
+(rows go straight to the file, no cell objects are kept in memory);
+reports with a template fill in a working copy of it.
+"""
+
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.utils import get_column_letter
+from excel_processing.base_excel import ExcelProcessorBase
+from utils.tracing import span, traced
+
+def iter_frame_rows(frame: pd.DataFrame, chunk_rows: Optional[int] = None) -> Iterator[tuple]:
+    """
+    Rows of a frame as tuples of plain Python values, NaN/NaT as empty cells
+
+    Args:
+        frame: Data to write
+        chunk_rows: Convert this many rows at a time (default: the whole frame at once)
+    """
+    block_size = chunk_rows or max(len(frame), 1)
+    for start in range(0, len(frame), block_size):
+        block = frame.iloc[start:start + block_size]
+        block = block.astype(object).where(block.notna(), None)
+        yield from block.itertuples(index=False, name=None)
+
+class WeeklyExcelProcessor(ExcelProcessorBase):
+    """Excel processor for spec-driven weekly reports"""
+
+    def __init__(self, template_path: Optional[str] = None):
+        """
+        Initialize weekly report processor
+
+        Args:
+            template_path: Template to fill in (None writes a new workbook)
+        """
+        super().__init__(template_path)
+
+    @traced("excel.weekly_report")
+    def generate_report(self, frames: Dict[str, pd.DataFrame], sheets: List, output_directory: str,
+                        filename_prefix: str, date_label: str, chunk_rows: Optional[int] = None) -> str:
+        """
+        Write mapped frames to a workbook
+
+        Args:
+            frames: Frame name -> DataFrame
+            sheets: SheetMapping list (frame, sheet, start_row, start_col, header)
+            output_directory: Directory to save the report
+            filename_prefix: Output file name before the date label
+            date_label: Date part of the filename
+            chunk_rows: Convert this many rows at a time instead of whole frames (less memory)
+
+        Returns:
+            str: Path to the generated Excel file
+        """
+        mappings = []
+        for mapping in sheets:
+            if mapping.frame not in frames:
+                print(f"⚠️ No '{mapping.frame}' data for sheet '{mapping.sheet}'")
+                continue
+            mappings.append(mapping)
+
+        if self.template_path:
+            return self._fill_template(frames, mappings, output_directory, filename_prefix, date_label, chunk_rows)
+
+        os.makedirs(output_directory, exist_ok=True)
+        self.output_path = os.path.join(output_directory, f"{filename_prefix} {date_label}.xlsx")
+        workbook = Workbook(write_only=True)
+        for mapping in mappings:
+            frame = frames[mapping.frame]
+            sheet = workbook.create_sheet(mapping.sheet[:31])
+            for index, column in enumerate(frame.columns, start=mapping.start_col):
+                sheet.column_dimensions[get_column_letter(index)].width = max(len(str(column)) + 2, 10)
+            if mapping.header:
+                sheet.freeze_panes = f"A{mapping.start_row + 1}"
+
+            with span("excel.write_rows", sheet=mapping.sheet, rows=len(frame), chunk_rows=chunk_rows):
+                for _ in range(mapping.start_row - 1):
+                    sheet.append([])
+                padding = [None] * (mapping.start_col - 1)
+                if mapping.header:
+                    sheet.append(padding + [str(column) for column in frame.columns])
+                for row in iter_frame_rows(frame, chunk_rows):
+                    sheet.append(padding + list(row))
+
+        with span("excel.save_workbook"):
+            workbook.save(self.output_path)
+        return self.output_path
+
+    def _fill_template(self, frames, mappings, output_directory, filename_prefix, date_label, chunk_rows):
+        output_path = self.create_working_copy(output_directory, filename_prefix, date_label)
+        workbook = load_workbook(output_path)
+        try:
+            for mapping in mappings:
+                if mapping.sheet not in workbook.sheetnames:
+                    print(f"⚠️ Sheet '{mapping.sheet}' not found in {os.path.basename(self.template_path)}")
+                    continue
+                frame = frames[mapping.frame]
+                sheet = workbook[mapping.sheet]
+                row_number = mapping.start_row
+                with span("excel.write_rows", sheet=mapping.sheet, rows=len(frame), chunk_rows=chunk_rows):
+                    if mapping.header:
+                        for col_number, column in enumerate(frame.columns, start=mapping.start_col):
+                            sheet.cell(row=row_number, column=col_number, value=str(column))
+                        row_number += 1
+                    for row in iter_frame_rows(frame, chunk_rows):
+                        for col_number, value in enumerate(row, start=mapping.start_col):
+                            sheet.cell(row=row_number, column=col_number, value=value)
+                        row_number += 1
+            with span("excel.save_workbook"):
+                workbook.save(output_path)
+        finally:
+            workbook.close()
+        return output_path
+
+def get_week_label(week_end: str) -> str:
+    """File name date label of a report week (MM.DD.YY of its last day)"""
+    return datetime.strptime(week_end, "%Y-%m-%d").strftime("%m.%d.%y")
@@ -9,11 +9,14 @@ import sys
 import os
 import time
 from utils.menu_navigator import MenuNavigator
-from reports.weekly_reports import main as weekly_reports_main
-from reports.daily_reports import main as daily_reports_main
 
 def goodbye_with_countdown():
     """Display countdown timer with goodbye message"""
+    # Only stop the warm browser if it was loaded (avoids importing Playwright to exit)
+    browser_daemon = sys.modules.get("web_automation.browser_daemon")
+    if browser_daemon:
+        browser_daemon.stop_warm_browser()
+    
     for i in range(3, 0, -1):
         print(f"\n⏰ This window will close in: {i}...")
         time.sleep(1)
@@ -36,6 +39,7 @@ async def test_scraper_login():
     try:
         from web_automation.seed_browser import SeedBrowser
         import io
+        import asyncio
         from contextlib import redirect_stdout, redirect_stderr
         
         # Check credentials first
@@ -46,6 +50,20 @@ async def test_scraper_login():
         if not os.getenv('SEED_USERNAME') or not os.getenv('SEED_PASSWORD'):
             return False, "Missing SEED credentials in environment variables"
         
+        # Reuse the warm browser when it is running
+        from web_automation.browser_daemon import get_warm_browser
+        warm_browser = get_warm_browser()
+        if warm_browser:
+            async def warm_login(pool):
+                seed = SeedBrowser(headless=True, pool=pool)
+                try:
+                    return await seed.setup_and_login()
+                finally:
+                    await seed.cleanup_browser()
+            
+            result = await asyncio.to_thread(warm_browser.run, warm_login)
+            return (True, None) if result else (False, "Warm browser login failed - check SEED website availability")
+        
         # Test login with suppressed output
         with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
             seed = SeedBrowser(headless=True)
@@ -99,15 +117,36 @@ def system_status():
     except Exception as e:
         print(f"⚠️ Web scraper: Test failed - {str(e)}")
     
+    # Warm browser check
+    from web_automation.browser_daemon import get_warm_browser
+    warm_browser = get_warm_browser()
+    if warm_browser:
+        status = warm_browser.get_status()
+        memory = f"{status['memory_mb']:.0f} MB" if status['memory_mb'] is not None else "n/a"
+        state = "✅" if status['ready'] else "⏳"
+        print(f"{state} Warm browser: {status['pages_served']} pages served, {memory}, "
+              f"up {status['uptime'] / 60:.0f} min, {status['restarts']} restarts, {status['recycles']} recycles")
+        if status['last_error']:
+            print(f"   ⚠️ Last error: {status['last_error']}")
+    else:
+        print("ℹ️ Warm browser: off (set MONUMATOR_WARM_BROWSER=1 to enable)")
+    
     print("✅ System check complete")
 
 def main():
     """Main application entry point"""
+    from config.report_config import WARM_BROWSER_ENABLED
+    
+    # Log in to SEED in the background while the menu is open
+    if WARM_BROWSER_ENABLED:
+        from web_automation.browser_daemon import start_warm_browser
+        start_warm_browser(headless=True)
     
     options = [
         "📅 Weekly Reports",
         "📊 Daily Reports", 
         "🔍 System Status Check",
+        "📈 Performance History",
         "🚪 Exit"
     ]
     
@@ -117,19 +156,27 @@ def main():
         try:
             choice = navigator.navigate()
             
-            if choice == -1 or choice == 3:  # Quit or Exit
+            if choice == -1 or choice == 4:  # Quit or Exit
                 goodbye_with_countdown()
             
-            elif choice == 0:  # Weekly Reports
+            elif choice == 0:  # Weekly Reports (menus and workflows load on first use)
+                from reports.weekly_reports import main as weekly_reports_main
                 weekly_reports_main()
             
             elif choice == 1:  # Daily Reports
+                from reports.daily_reports import main as daily_reports_main
                 daily_reports_main()
             
             elif choice == 2:  # System Status Check
                 os.system('cls' if os.name == 'nt' else 'clear')
                 system_status()
                 input("\nPress Enter to continue...")
+            
+            elif choice == 3:  # Performance History
+                os.system('cls' if os.name == 'nt' else 'clear')
+                from utils.run_history import print_performance_history
+                print_performance_history()
+                input("\nPress Enter to continue...")
                 
         except KeyboardInterrupt:
             goodbye_with_countdown()
@@ -138,4 +185,8 @@ def main():
             input("Press Enter to continue...")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Arguments run reports without the menu (see cli.py)
+    if len(sys.argv) > 1:
+        from cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+    main()
@@ -0,0 +1,181 @@
+"""
+Concurrent Daily Reports Workflow
+=================================
+
+Runs Daily Stockout, Inventory Adjustment and Inventory Confirmation as one
+dependency graph on a single event loop. Database and file work run on
+threads, xlwings on the Excel thread, and the scrapers share one browser.
+"""
+
+import os
+import time
+import shutil
+import asyncio
+import tempfile
+import pandas as pd
+from typing import Dict, Any
+from config.report_config import CONCURRENT_RESOURCE_LIMITS
+from utils.task_graph import TaskGraph, TaskStep, ASYNC, EXCEL
+from utils.run_history import RunRecorder
+from utils.downloader import download_items_async
+from web_automation.browser_pool import BrowserPool
+from web_automation.inventory_confirmation_scraper import InventoryConfirmationScraper
+from report_workflows.daily.daily_stockout import (
+    validate_prerequisites, fetch_stockout_data, process_stockout_data, generate_stockout_excel
+)
+from report_workflows.daily.inventory_adjustment import download_iad_report
+from report_workflows.daily.inventory_confirmation import scrape_route_data
+from excel_processing.inventory_adjustment_excel import InventoryExcelProcessor
+from excel_processing.inventory_confirmation_excel import generate_inventory_confirmation_report
+
+def build_daily_report_graph(pool: BrowserPool, headless: bool = True,
+                             output_directory: str = "downloads/daily", recorder: RunRecorder = None,
+                             temp_directory: str = "downloads/temp") -> TaskGraph:
+    """
+    Build the step graph for all daily reports
+
+    Args:
+        pool: Browser pool shared by the product list export and the route scraper
+        headless: Run browser in headless mode
+        output_directory: Directory for the generated reports
+        recorder: Run recorder whose memory budget the memory-heavy steps check
+        temp_directory: Directory for the Inventory Adjustment downloads
+
+    Returns:
+        TaskGraph ready to run
+    """
+    graph = TaskGraph(CONCURRENT_RESOURCE_LIMITS)
+
+    def check_memory(step_name):
+        # Fail the step (and its dependents) instead of going over the run's memory budget;
+        # returns the chunk size for steps that can write in blocks
+        if not recorder:
+            return None
+        recorder.check_memory(step_name)
+        return recorder.get_chunk_rows(step_name)
+
+    # Daily Stockout: database -> processing -> openpyxl
+    def check_database(inputs):
+        if not validate_prerequisites()['all_valid']:
+            raise Exception("Database connection failed - cannot generate report")
+
+    def fetch_stockout(inputs):
+        check_memory("stockout.fetch")
+        raw_data = fetch_stockout_data()
+        if not raw_data:
+            raise Exception("No data retrieved")
+        return raw_data
+
+    graph.add(TaskStep("stockout.validate", check_database, resource="db"))
+    graph.add(TaskStep("stockout.fetch", fetch_stockout, ["stockout.validate"], resource="db"))
+    graph.add(TaskStep("stockout.process", lambda inputs: process_stockout_data(inputs["stockout.fetch"]), ["stockout.fetch"]))
+    def render_stockout(inputs):
+        check_memory("stockout.excel")
+        return generate_stockout_excel(inputs["stockout.process"], output_directory)
+
+    graph.add(TaskStep("stockout.excel", render_stockout, ["stockout.process"]))
+
+    # Inventory Adjustment: API download and product list export side by side
+    os.makedirs(temp_directory, exist_ok=True)
+
+    async def download_product_list(inputs):
+        return await download_items_async(temp_directory, headless=headless, pool=pool)
+
+    def render_adjustment(inputs):
+        chunk_rows = check_memory("inventory_adjustment.excel")
+        return InventoryExcelProcessor().generate_inventory_adjustment_report(
+            inputs["inventory_adjustment.parse_iad"], inputs["inventory_adjustment.parse_items"], output_directory, chunk_rows
+        )
+
+    graph.add(TaskStep("inventory_adjustment.download_iad", lambda inputs: download_iad_report(temp_directory), resource="api"))
+    graph.add(TaskStep("inventory_adjustment.download_items", download_product_list, kind=ASYNC, resource="browser"))
+    graph.add(TaskStep("inventory_adjustment.parse_iad",
+                       lambda inputs: pd.read_excel(inputs["inventory_adjustment.download_iad"]).fillna(''),
+                       ["inventory_adjustment.download_iad"]))
+    graph.add(TaskStep("inventory_adjustment.parse_items",
+                       lambda inputs: pd.read_excel(inputs["inventory_adjustment.download_items"]),
+                       ["inventory_adjustment.download_items"]))
+    graph.add(TaskStep("inventory_adjustment.excel", render_adjustment,
+                       ["inventory_adjustment.parse_iad", "inventory_adjustment.parse_items"], kind=EXCEL))
+
+    # Inventory Confirmation: browser scrape -> xlwings
+    async def scrape_routes(inputs):
+        scraper = InventoryConfirmationScraper(headless=headless, pool=pool)
+        try:
+            route_data = await scrape_route_data(scraper, scraper.get_previous_business_day())
+        finally:
+            await scraper.cleanup_browser()
+        if not route_data.routes:
+            raise Exception("No route data found")
+        return route_data
+
+    graph.add(TaskStep("inventory_confirmation.scrape", scrape_routes, kind=ASYNC, resource="browser"))
+    def render_confirmation(inputs):
+        chunk_rows = check_memory("inventory_confirmation.excel")
+        return generate_inventory_confirmation_report(inputs["inventory_confirmation.scrape"], chunk_rows=chunk_rows)
+
+    graph.add(TaskStep("inventory_confirmation.excel", render_confirmation, ["inventory_confirmation.scrape"], kind=EXCEL))
+
+    return graph
+
+async def run_all_daily_reports_concurrent_async(headless: bool = True) -> Dict[str, Any]:
+    """
+    Run every daily report concurrently
+
+    Args:
+        headless: Run browser in headless mode
+
+    Returns:
+        Results dictionary with success status, per-workflow results and the critical path
+    """
+    start_time = time.time()
+    recorder = RunRecorder("concurrent_daily")
+    print("⚡ PROCESSING ALL DAILY REPORTS CONCURRENTLY")
+    print("=" * 50)
+
+    pool = BrowserPool(headless=headless, max_pages=CONCURRENT_RESOURCE_LIMITS.get("browser", 2))
+    # The run's downloads go to their own directory, removed with everything in it
+    os.makedirs("downloads/temp", exist_ok=True)
+    temp_directory = tempfile.mkdtemp(prefix="concurrent_daily_", dir="downloads/temp")
+    graph = build_daily_report_graph(pool, headless, recorder=recorder, temp_directory=temp_directory)
+    try:
+        steps = await graph.run()
+    finally:
+        await pool.close()
+        shutil.rmtree(temp_directory, ignore_errors=True)
+
+    print()
+    graph.print_summary()
+
+    workflows = graph.get_workflow_summary()
+    # Steps were timed by the graph; completed ones go to the run history
+    for name, step in graph.steps.items():
+        if step.status == "success":
+            rows = len(step.result) if isinstance(step.result, pd.DataFrame) else None
+            recorder.add_stage(name, step.duration, rows=rows)
+    failed = [workflow['error'] for workflow in workflows.values() if not workflow['success']]
+    recorder.finish(success=not failed, error="; ".join(failed) or None)
+
+    output_paths = {step.workflow: step.result for name, step in steps.items()
+                    if name.endswith(".excel") and step.status == "success"}
+    return {
+        'success': all(workflow['success'] for workflow in workflows.values()),
+        'workflows': {name: {'success': workflow['success'], 'elapsed': workflow['elapsed'], 'error': workflow['error']}
+                      for name, workflow in workflows.items()},
+        'output_paths': output_paths,
+        'critical_path': [step.name for step in graph.get_critical_path()],
+        'elapsed_time': time.time() - start_time
+    }
+
+def process_all_daily_reports_concurrent(headless=True):
+    """
+    Run every daily report concurrently
+    Synchronous wrapper for menu system integration
+
+    Args:
+        headless (bool): Run browser in headless mode
+
+    Returns:
+        dict: Results dictionary with success status and details
+    """
+    return asyncio.run(run_all_daily_reports_concurrent_async(headless))
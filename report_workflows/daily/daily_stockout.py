@@ -11,6 +11,8 @@ from datetime import datetime
 from database.queries import execute_all_queries
 from database.connection import test_database_connection
 from excel_processing.stockout_excel import StockoutExcelProcessor
+from utils.run_checkpoint import RunCheckpoint
+from utils.run_history import RunRecorder, file_size
 
 def validate_prerequisites():
     """
@@ -93,47 +95,74 @@ def generate_stockout_excel(data_dict, output_directory="downloads/daily"):
     
     return output_path
 
-def process_stockout_report(output_directory="downloads/daily"):
+def process_stockout_report(output_directory="downloads/daily", resume=False):
     """
     Complete workflow for processing Daily Stockout Report
     
     Args:
         output_directory (str): Directory to save the report
+        resume (bool): Reuse today's query results from the last failed run
         
     Returns:
         dict: Results dictionary with success status and details
     """
     print("🚀 Starting Daily Stockout Report processing...")
     start_time = time.time()
+    recorder = None
+    checkpoint = None
     
     try:
-        # Step 1: Validate prerequisites
-        validation = validate_prerequisites()
+        # Inside the try: an unreadable checkpoint or history still ends in a result dict
+        recorder = RunRecorder("stockout")
+        checkpoint = RunCheckpoint.start("stockout", {'date': datetime.now().strftime("%Y-%m-%d")}, resume)
+        recorder.run_directory = checkpoint.directory
+        resumed_stages = checkpoint.completed_stages
         
-        if not validation['all_valid']:
-            if not validation['database_connected']:
-                raise Exception("Database connection failed - cannot generate report")
-        
-        # Step 2: Fetch data
-        raw_data = fetch_stockout_data()
-        
-        if not raw_data:
-            raise Exception("No data retrieved")
+        if checkpoint.has("fetch"):
+            # Query results saved by the failed run
+            validation = {'database_connected': None, 'all_valid': True}
+            with recorder.stage("load_checkpoint"):
+                raw_data = checkpoint.load("fetch")
+        else:
+            # Step 1: Validate prerequisites
+            with recorder.stage("validate"):
+                validation = validate_prerequisites()
+            
+            if not validation['all_valid']:
+                if not validation['database_connected']:
+                    raise Exception("Database connection failed - cannot generate report")
+            
+            # Step 2: Fetch data
+            with recorder.stage("fetch") as stage:
+                raw_data = fetch_stockout_data()
+                
+                if not raw_data:
+                    raise Exception("No data retrieved")
+                checkpoint.save("fetch", raw_data)
+                stage.rows = sum(len(frame) for frame in raw_data.values() if frame is not None)
+                stage.bytes = checkpoint.manifest['stages']['fetch']['bytes']
         
         # Step 3: Process data
-        processed_data = process_stockout_data(raw_data)
+        with recorder.stage("process"):
+            processed_data = process_stockout_data(raw_data)
         
         # Step 4: Generate Excel report
-        output_path = generate_stockout_excel(processed_data, output_directory)
+        with recorder.stage("generate_excel") as stage:
+            output_path = generate_stockout_excel(processed_data, output_directory)
+            stage.bytes = file_size(output_path)
         
         # Calculate processing time
         processing_time = time.time() - start_time
+        checkpoint.complete()
+        recorder.finish(success=True)
         
         # Prepare results
         results = {
             'success': True,
             'output_path': output_path,
             'processing_time': processing_time,
+            'stage_timings': recorder.get_stage_timings(),
+            'resumed_stages': resumed_stages,
             'data_summary': {
                 'highlights': len(processed_data.get('highlights', [])),
                 'markets': len(processed_data.get('markets', [])),
@@ -150,11 +179,17 @@ def process_stockout_report(output_directory="downloads/daily"):
     except Exception as e:
         processing_time = time.time() - start_time
         print(f"❌ Daily Stockout Report failed: {str(e)}")
+        if checkpoint:
+            checkpoint.fail(str(e))
+        if recorder:
+            recorder.finish(success=False, error=str(e))
         
         return {
             'success': False,
             'error': str(e),
-            'processing_time': processing_time
+            'processing_time': processing_time,
+            'stage_timings': recorder.get_stage_timings() if recorder else {},
+            'run_directory': checkpoint.directory if checkpoint else None
         }
 
 def get_stockout_processing_status():
@@ -8,10 +8,13 @@ Orchestrates data downloads, processing, and Excel generation.
 
 import os
 import time
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 from config.report_config import SEED_REPORTS
 from utils.downloader import download_seed_report, download_items
 from excel_processing.inventory_adjustment_excel import InventoryExcelProcessor
+from utils.run_checkpoint import RunCheckpoint
+from utils.run_history import RunRecorder, file_size
 import pandas as pd
 
 def get_inventory_adjustment_report_id():
@@ -33,6 +36,18 @@ def get_inventory_adjustment_report_id():
     
     return report_id, description
 
+def get_inventory_adjustment_business_date():
+    """
+    Get the business date covered by today's IAD report
+    Monday = Friday (3 days ago), Other days = previous day
+    
+    Returns:
+        str: Business date in YYYY-MM-DD format
+    """
+    today = datetime.now()
+    days_back = 3 if today.weekday() == 0 else 1
+    return (today - timedelta(days=days_back)).strftime("%Y-%m-%d")
+
 def download_iad_report(temp_directory="downloads/temp"):
     """
     Download inventory adjustment detail report
@@ -47,86 +62,131 @@ def download_iad_report(temp_directory="downloads/temp"):
     report_id, description = get_inventory_adjustment_report_id()
     print(f"📥 Downloading IAD report: {description}")
     
-    # Download report
+    # Download report (past business dates are served from the download cache)
     filename = "inventory_adjustment_detail.xlsx"
-    success = download_seed_report(report_id, filename, temp_directory)
+    result = download_seed_report(
+        report_id, filename, temp_directory,
+        business_date=get_inventory_adjustment_business_date()
+    )
     
-    if success:
-        file_path = os.path.join(temp_directory, filename)
+    if result['success']:
+        file_path = result['path']
         print(f"✅ IAD report downloaded: {file_path}")
         return file_path
     else:
-        raise Exception("Failed to download IAD report")
+        raise Exception(f"Failed to download IAD report: {result['error']}")
 
-
-def cleanup_temp_files(*file_paths):
+async def run_inventory_adjustment_async(output_directory="downloads/daily", headless=True, resume=False):
     """
-    Clean up temporary files
+    Async workflow for the Inventory Adjustment Summary
     
-    Args:
-        *file_paths: Variable number of file paths to clean up
-    """
-    for file_path in file_paths:
-        if file_path and os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except Exception as e:
-                print(f"⚠️ Could not remove temp file {file_path}: {str(e)}")
-
-def process_inventory_adjustment_summary(output_directory="downloads/daily", headless=True):
-    """
-    Complete workflow for processing Inventory Adjustment Summary
+    The IAD API download and the product list export run at the same time,
+    each file is parsed as soon as it arrives and the template copy is made
+    while they download. Downloads and the template copy are kept in the run
+    directory until the report is written, so a failed run leaves no unfilled
+    report in the output directory and can be resumed without downloading again.
     
     Args:
         output_directory (str): Directory to save the report
         headless (bool): Run browser in headless mode for items download
+        resume (bool): Reuse the downloads of the last failed run for the same business date
         
     Returns:
-        dict: Results dictionary with success status and details
+        dict: Results dictionary with success status, details and stage timings
     """
     start_time = time.time()
-    iad_file_path = None
-    items_file_path = None
+    recorder = None
+    checkpoint = None
+    
+    async def timed(stage, awaitable, rows=False, size=False):
+        # Downloads record their file size, parses their row count
+        with recorder.stage(stage) as record:
+            result = await awaitable
+            if rows:
+                record.rows = len(result)
+            if size:
+                record.bytes = file_size(result)
+            return result
+    
+    async def iad_pipeline():
+        if checkpoint.has('iad'):
+            iad_path = checkpoint.load('iad')
+        else:
+            iad_path = await timed('download_iad', asyncio.to_thread(download_iad_report, checkpoint.directory), size=True)
+            iad_path = checkpoint.save_file('iad', iad_path)
+        iad_data = await timed('parse_iad', asyncio.to_thread(pd.read_excel, iad_path), rows=True)
+        # Clean data (replace NaN with empty strings)
+        return iad_data.fillna('')
+    
+    async def items_pipeline():
+        if checkpoint.has('items'):
+            items_path = checkpoint.load('items')
+        else:
+            # download_items uses the warm browser when it is running
+            items_path = await timed('download_items', asyncio.to_thread(download_items, checkpoint.directory, headless),
+                                     size=True)
+            items_path = checkpoint.save_file('items', items_path)
+        return await timed('parse_items', asyncio.to_thread(pd.read_excel, items_path), rows=True)
     
     try:
         print("🚀 Starting Inventory Adjustment Summary processing...")
         
-        # Ensure temp directory exists
-        temp_dir = "downloads/temp"
-        os.makedirs(temp_dir, exist_ok=True)
+        # Inside the try: an unreadable checkpoint or history still ends in a result dict
+        recorder = RunRecorder("inventory_adjustment")
+        checkpoint = RunCheckpoint.start(
+            "inventory_adjustment", {'business_date': get_inventory_adjustment_business_date()}, resume
+        )
+        recorder.run_directory = checkpoint.directory
+        resumed_stages = checkpoint.completed_stages
         
         # Step 1: Get report ID info
         report_id, description = get_inventory_adjustment_report_id()
         
-        # Step 2: Download IAD report
-        iad_file_path = download_iad_report()
-        
-        # Step 3: Download items list
-        items_file_path = download_items(headless=headless)
-        
-        # Step 4: Load and process data
-        iad_data = pd.read_excel(iad_file_path)
+        # Step 2: Both downloads (and parsing) side by side, template copy meanwhile
+        excel_processor = InventoryExcelProcessor()
+        results = await asyncio.gather(
+            iad_pipeline(),
+            items_pipeline(),
+            timed('prepare_template', asyncio.to_thread(
+                excel_processor.create_working_copy, checkpoint.directory, "Inventory Adjustment Summary"
+            )),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        iad_data, items_data, _ = results
         
-        items_data = pd.read_excel(items_file_path)
+        downloads_time = time.time() - start_time
+        stage_timings = recorder.get_stage_timings()
+        sequential_time = sum(stage_timings.get(stage, 0) for stage in ('download_iad', 'download_items'))
+        print(f"⚡ Downloads finished in {downloads_time:.1f}s (back to back: {sequential_time:.1f}s)")
         
-        # Clean data (replace NaN with empty strings)
-        iad_data = iad_data.fillna('')
-        
-        # Step 5: Generate Excel report
+        # Step 3: Generate Excel report (xlwings stays on this thread)
         print("📄 Generating inventory adjustment Excel report...")
-        excel_processor = InventoryExcelProcessor()
-        output_path = excel_processor.generate_inventory_adjustment_report(
-            iad_data, items_data, output_directory
-        )
+        # Near the memory budget the sheets are written in row blocks
+        chunk_rows = recorder.get_chunk_rows('generate_excel')
+        with recorder.stage('generate_excel', chunked=chunk_rows is not None) as record:
+            excel_processor.generate_inventory_adjustment_report(
+                iad_data, items_data, checkpoint.directory, chunk_rows
+            )
+            # Filled in the run directory, moved into place only once saved
+            output_path = excel_processor.move_working_copy(output_directory)
+            record.rows = len(iad_data)
+            record.bytes = file_size(output_path)
         
         # Calculate processing time
         processing_time = time.time() - start_time
+        checkpoint.complete()
+        recorder.finish(success=True)
         
         # Prepare results
         results = {
             'success': True,
             'output_path': output_path,
             'processing_time': processing_time,
+            'stage_timings': recorder.get_stage_timings(),
+            'resumed_stages': resumed_stages,
             'report_id': report_id,
             'description': description,
             'data_summary': {
@@ -142,15 +202,35 @@ def process_inventory_adjustment_summary(output_directory="downloads/daily", hea
     except Exception as e:
         processing_time = time.time() - start_time
         print(f"❌ Inventory Adjustment Summary failed: {str(e)}")
+        # Downloads (and any unfilled template copy) stay in the run directory for resume;
+        # complete() removes them after a successful run
+        if checkpoint:
+            checkpoint.fail(str(e))
+        if recorder:
+            recorder.finish(success=False, error=str(e))
         
         return {
             'success': False,
             'error': str(e),
-            'processing_time': processing_time
+            'processing_time': processing_time,
+            'stage_timings': recorder.get_stage_timings() if recorder else {},
+            'run_directory': checkpoint.directory if checkpoint else None
         }
-    finally:
-        # Cleanup temp files
-        cleanup_temp_files(iad_file_path, items_file_path)
+
+def process_inventory_adjustment_summary(output_directory="downloads/daily", headless=True, resume=False):
+    """
+    Complete workflow for processing Inventory Adjustment Summary
+    Synchronous wrapper for menu system integration
+    
+    Args:
+        output_directory (str): Directory to save the report
+        headless (bool): Run browser in headless mode for items download
+        resume (bool): Reuse the downloads of the last failed run for the same business date
+        
+    Returns:
+        dict: Results dictionary with success status, details and stage timings
+    """
+    return asyncio.run(run_inventory_adjustment_async(output_directory, headless, resume))
 
 def get_inventory_adjustment_status():
     """
@@ -8,82 +8,302 @@ Orchestrates scraping and Excel generation.
 
 import asyncio
 import time
-from typing import Dict, Any
+from datetime import datetime, timedelta
+from typing import Dict, Any, List
+from config.report_config import INVENTORY_SCRAPE_MODE, SWEEP_DATE_CONCURRENCY
 from web_automation.inventory_confirmation_scraper import InventoryConfirmationScraper
+from web_automation.browser_pool import BrowserPool
+from utils.session_cache import SeedSessionCache
+from utils.route_records import AssetBatch
+from utils.run_checkpoint import RunCheckpoint
+from utils.run_history import RunRecorder, file_size
 from excel_processing.inventory_confirmation_excel import generate_inventory_confirmation_report
 
-async def run_inventory_confirmation_async(headless: bool = True) -> Dict[str, Any]:
+async def scrape_route_data(scraper: InventoryConfirmationScraper, target_date: str, scrape_mode: str = INVENTORY_SCRAPE_MODE):
+    """
+    Scrape incomplete routes, over HTTP first when enabled, else in the browser
+    
+    Args:
+        scraper: Inventory confirmation scraper (browser is set up only if needed)
+        target_date: Date in YYYY-MM-DD format
+        scrape_mode: "http" or "browser"
+        
+    Returns:
+        AssetBatch of incomplete routes
+    """
+    if scrape_mode == "http":
+        try:
+            return await scraper.get_incomplete_routes_http(target_date)
+        except Exception as e:
+            print(f"⚠️ HTTP scrape unavailable ({str(e)}), using the browser")
+    
+    # Setup browser and login (no-op if the HTTP path already opened it)
+    if not scraper.page and not await scraper.setup_and_login():
+        raise Exception("Failed to setup browser and login to SEED")
+    
+    return await scraper.get_incomplete_routes(target_date)
+
+async def run_inventory_confirmation_async(headless: bool = True, scrape_mode: str = INVENTORY_SCRAPE_MODE, pool=None,
+                                           target_date: str = None, output_directory: str = "downloads/daily",
+                                           resume: bool = False) -> Dict[str, Any]:
     """
     Async workflow for inventory confirmation report
     
     Args:
         headless: Run browser in headless mode
+        scrape_mode: "http" for render-free scraping with browser fallback, "browser" to render every page
+        pool: Optional BrowserPool (e.g. the warm browser) instead of launching Firefox
+        target_date: Date in YYYY-MM-DD format (default: previous business day)
+        output_directory: Directory to save the report
+        resume: Reuse the scraped routes of the last failed run for the same date
         
     Returns:
         Results dictionary with success status and details
     """
     scraper = None
+    checkpoint = None
     start_time = time.time()
+    recorder = None
     
     try:
         print("🚀 Starting Inventory Confirmation Report processing...")
+        # Inside the try: an unreadable checkpoint or history still ends in a result dict
+        recorder = RunRecorder("inventory_confirmation")
         
         # Initialize scraper with SEED capabilities
-        scraper = InventoryConfirmationScraper(headless=headless)
-        
-        # Setup browser and login
-        if not await scraper.setup_and_login():
-            raise Exception("Failed to setup browser and login to SEED")
+        scraper = InventoryConfirmationScraper(headless=headless, pool=pool)
         
         # Get target date
-        target_date = scraper.get_previous_business_day()
+        target_date = target_date or scraper.get_previous_business_day()
         
-        # Scrape route data (finds incomplete routes dynamically)
-        route_data = await scraper.get_incomplete_routes(target_date)
-        
-        if not route_data:
-            raise Exception("No route data found")
+        checkpoint = RunCheckpoint.start("inventory_confirmation", {'target_date': target_date}, resume)
+        recorder.run_directory = checkpoint.directory
+        if checkpoint.has("routes"):
+            # Routes scraped by the failed run
+            with recorder.stage("load_checkpoint"):
+                route_data = checkpoint.load("routes")
+        else:
+            # Scrape route data (finds incomplete routes dynamically)
+            with recorder.stage("scrape") as stage:
+                route_data = await scrape_route_data(scraper, target_date, scrape_mode)
+                
+                if not route_data.routes:
+                    raise Exception("No route data found")
+                checkpoint.save("routes", route_data)
+                stage.rows = route_data.asset_count
+                stage.bytes = checkpoint.manifest['stages']['routes']['bytes']
         
         # Calculate total assets
-        total_assets = sum(len(route.get('incomplete_assets', [])) for route in route_data)
+        total_assets = route_data.asset_count
         print(f"🎯 Total incomplete assets found: {total_assets}")
         
         # Generate Excel report using the new processor
-        excel_file = generate_inventory_confirmation_report(route_data)
+        # Near the memory budget the rows are written in blocks
+        chunk_rows = recorder.get_chunk_rows("generate_excel")
+        with recorder.stage("generate_excel", chunked=chunk_rows is not None) as stage:
+            excel_file = generate_inventory_confirmation_report(route_data, output_directory=output_directory,
+                                                                chunk_rows=chunk_rows)
+            stage.rows = total_assets
+            stage.bytes = file_size(excel_file)
         
         # Calculate results
         elapsed_time = time.time() - start_time
         print(f"✅ Inventory confirmation completed in {elapsed_time:.1f} seconds")
+        checkpoint.complete()
+        recorder.finish(success=True)
         
         return {
             'success': True,
             'output_path': excel_file,
             'elapsed_time': elapsed_time,
+            'stage_timings': recorder.get_stage_timings(),
+            'target_date': target_date,
             'total_assets': total_assets,
-            'routes_processed': len(route_data)
+            'routes_processed': len(route_data.routes)
         }
         
     except Exception as e:
         print(f"❌ Inventory confirmation failed: {str(e)}")
+        if checkpoint:
+            checkpoint.fail(str(e))
+        if recorder:
+            recorder.finish(success=False, error=str(e))
         return {
             'success': False,
             'error': str(e),
-            'elapsed_time': time.time() - start_time
+            'elapsed_time': time.time() - start_time,
+            'run_directory': checkpoint.directory if checkpoint else None
         }
     finally:
         if scraper:
             await scraper.cleanup_browser()
 
 
-def process_inventory_confirmation_report(headless=True):
+def process_inventory_confirmation_report(headless=True, target_date=None, output_directory="downloads/daily", resume=False):
     """
     Complete workflow for processing Inventory Confirmation Report
     Synchronous wrapper for menu system integration
+    Runs on the warm browser when it is running and the browser is headless
+    
+    Args:
+        headless (bool): Run browser in headless mode
+        target_date (str): Date in YYYY-MM-DD format (default: previous business day)
+        output_directory (str): Directory to save the report
+        resume (bool): Reuse the scraped routes of the last failed run for the same date
+        
+    Returns:
+        dict: Results dictionary with success status and details
+    """
+    from web_automation.browser_daemon import get_warm_browser
+    
+    warm_browser = get_warm_browser()
+    if warm_browser and headless:
+        return warm_browser.run(lambda pool: run_inventory_confirmation_async(
+            headless=headless, pool=pool, target_date=target_date, output_directory=output_directory, resume=resume
+        ))
+    return asyncio.run(run_inventory_confirmation_async(
+        headless=headless, target_date=target_date, output_directory=output_directory, resume=resume
+    ))
+
+def get_business_days(start_date: str, end_date: str) -> List[str]:
+    """
+    Weekdays from start_date to end_date inclusive
+    
+    Args:
+        start_date: First date in YYYY-MM-DD format
+        end_date: Last date in YYYY-MM-DD format
+        
+    Returns:
+        List of YYYY-MM-DD dates (Saturday and Sunday skipped)
+    """
+    current = datetime.strptime(start_date, "%Y-%m-%d")
+    last = datetime.strptime(end_date, "%Y-%m-%d")
+    dates = []
+    while current <= last:
+        if current.weekday() < 5:
+            dates.append(current.strftime("%Y-%m-%d"))
+        current += timedelta(days=1)
+    return dates
+
+async def run_inventory_confirmation_sweep_async(start_date: str, end_date: str, headless: bool = True,
+                                                 combined: bool = True, concurrency: int = SWEEP_DATE_CONCURRENCY,
+                                                 scrape_mode: str = INVENTORY_SCRAPE_MODE,
+                                                 output_directory: str = "downloads/daily") -> Dict[str, Any]:
+    """
+    Scrape RoutesSummary for every business day in a date range through one SEED session
+    
+    Args:
+        start_date: First date in YYYY-MM-DD format
+        end_date: Last date in YYYY-MM-DD format
+        headless: Run browser in headless mode
+        combined: One workbook with a date column, else one workbook per day
+        concurrency: Dates scraped at the same time
+        scrape_mode: "http" or "browser" (see run_inventory_confirmation_async)
+        output_directory: Directory to save the workbooks
+        
+    Returns:
+        Results dictionary with success status, output paths, per-date results and throughput
+    """
+    start_time = time.time()
+    dates = get_business_days(start_date, end_date)
+    if not dates:
+        return {'success': False, 'error': f"No business days between {start_date} and {end_date}", 'elapsed_time': 0}
+    
+    print(f"🚀 Sweeping inventory confirmation for {len(dates)} days ({dates[0]} to {dates[-1]})...")
+    
+    # One Firefox process; every scraper leases a context with the saved session
+    pool = BrowserPool(headless=headless, max_pages=concurrency)
+    date_slots = asyncio.Semaphore(concurrency)
+    
+    async def scrape_date(target_date: str) -> Dict[str, Any]:
+        async with date_slots:
+            scraper = InventoryConfirmationScraper(headless=headless, pool=pool)
+            date_start = time.time()
+            try:
+                route_data = await scrape_route_data(scraper, target_date, scrape_mode)
+                print(f"📅 {target_date}: {len(route_data.routes)} routes in {time.time() - date_start:.1f}s")
+                return {'date': target_date, 'success': True, 'routes': route_data}
+            except Exception as e:
+                print(f"❌ {target_date}: {str(e)}")
+                return {'date': target_date, 'success': False, 'error': str(e), 'routes': AssetBatch()}
+            finally:
+                await scraper.cleanup_browser()
+    
+    try:
+        # Log in once up front so the parallel scrapers all start from a saved session
+        if scrape_mode == "browser" or not SeedSessionCache().load():
+            seed = InventoryConfirmationScraper(headless=headless, pool=pool)
+            try:
+                if not await seed.setup_and_login():
+                    raise Exception("Failed to setup browser and login to SEED")
+            finally:
+                await seed.cleanup_browser()
+        
+        date_results = await asyncio.gather(*(scrape_date(target_date) for target_date in dates))
+    except Exception as e:
+        print(f"❌ Inventory confirmation sweep failed: {str(e)}")
+        return {'success': False, 'error': str(e), 'elapsed_time': time.time() - start_time}
+    finally:
+        await pool.close()
+    
+    scrape_seconds = time.time() - start_time
+    total_routes = sum(len(result['routes'].routes) for result in date_results)
+    routes_per_minute = total_routes / (scrape_seconds / 60) if scrape_seconds else 0
+    print(f"⚡ Throughput: {total_routes} routes in {scrape_seconds:.1f}s ({routes_per_minute:.1f} routes/min)")
+    
+    # Workbooks are written one at a time (Excel automation is not parallel)
+    scraped = [result for result in date_results if result['success']]
+    output_paths = []
+    if combined and scraped:
+        all_routes = AssetBatch()
+        for result in scraped:
+            all_routes.extend(result['routes'])
+        date_label = f"{format_date_label(scraped[0]['date'])}-{format_date_label(scraped[-1]['date'])}"
+        output_paths.append(generate_inventory_confirmation_report(
+            all_routes, include_date_column=True, date_label=date_label, output_directory=output_directory
+        ))
+    elif scraped:
+        for result in scraped:
+            output_paths.append(generate_inventory_confirmation_report(
+                result['routes'], date_label=format_date_label(result['date']), output_directory=output_directory
+            ))
+    
+    failed_dates = [result['date'] for result in date_results if not result['success']]
+    elapsed_time = time.time() - start_time
+    print(f"✅ Sweep completed in {elapsed_time:.1f} seconds ({len(scraped)}/{len(dates)} days)")
+    
+    return {
+        'success': not failed_dates,
+        'error': f"Failed dates: {', '.join(failed_dates)}" if failed_dates else None,
+        'output_paths': output_paths,
+        'dates': {result['date']: len(result['routes'].routes) for result in date_results},
+        'failed_dates': failed_dates,
+        'routes_processed': total_routes,
+        'routes_per_minute': routes_per_minute,
+        'elapsed_time': elapsed_time
+    }
+
+def format_date_label(target_date: str) -> str:
+    """YYYY-MM-DD to the MM.DD.YY style used in report filenames"""
+    return datetime.strptime(target_date, "%Y-%m-%d").strftime("%m.%d.%y")
+
+def process_inventory_confirmation_sweep(start_date, end_date, headless=True, combined=True,
+                                         concurrency=SWEEP_DATE_CONCURRENCY, output_directory="downloads/daily"):
+    """
+    Multi-day inventory confirmation sweep
+    Synchronous wrapper for menu system integration
     
     Args:
+        start_date (str): First date in YYYY-MM-DD format
+        end_date (str): Last date in YYYY-MM-DD format
         headless (bool): Run browser in headless mode
+        combined (bool): One workbook with a date column, else one workbook per day
+        concurrency (int): Dates scraped at the same time
+        output_directory (str): Directory to save the workbooks
         
     Returns:
         dict: Results dictionary with success status and details
     """
-    return asyncio.run(run_inventory_confirmation_async(headless=headless))
\ No newline at end of file
+    return asyncio.run(run_inventory_confirmation_sweep_async(
+        start_date, end_date, headless, combined, concurrency, output_directory=output_directory
+    ))
@@ -2,27 +2,55 @@
 Fresh Food Tracker Report Workflow
 ==================================
 
-TODO: Implement fresh food inventory and sales tracking reports.
+Fresh food rows of the SEED Product Activity Weekly export with totals
+per category. Shares its source with the Spoilage/Shrink report, so the
+two download it once when run together. Runs on the weekly report engine
+(report_engine.py).
 
-When ready to implement:
-1. Add SEED API download calls for fresh food data
-2. Add fresh food analysis (expiration tracking, sales velocity)
-3. Add Excel template for fresh food reporting
-4. Add freshness alerts and recommendations
+Draft: not ready until the business confirms the definition (SPEC.pending).
 """
 
-def process_fresh_food_tracker_report():
+from config.report_config import WEEKLY_REPORT_SETTINGS
+from report_workflows.weekly.report_spec import ReportSpec, SheetMapping
+from report_workflows.weekly.report_engine import process_report_spec, get_report_spec_status
+from report_workflows.weekly.sources import PRODUCT_ACTIVITY_WEEKLY, clean_seed_frame, find_column
+
+# Category names that count as fresh food (case-insensitive substrings)
+FRESH_FOOD_KEYWORDS = ["fresh", "sandwich", "salad", "wrap", "fruit", "dairy", "meal"]
+
+def select_fresh_food(frames):
+    """Fresh food rows and their numeric totals per category"""
+    activity = clean_seed_frame(frames['activity'])
+    category = find_column(activity, "category")
+    if category is None:
+        raise ValueError("Product Activity Weekly has no Category column to find fresh food by")
+    pattern = "|".join(FRESH_FOOD_KEYWORDS)
+    fresh_food = activity[activity[category].astype(str).str.contains(pattern, case=False, na=False)]
+    categories = fresh_food.groupby(category).sum(numeric_only=True)
+    categories.insert(0, 'Products', fresh_food.groupby(category).size())
+    return {'fresh_food': fresh_food, 'categories': categories.reset_index()}
+
+SPEC = ReportSpec(
+    "fresh_food_tracker", "Fresh Food Tracker Report",
+    sources={'activity': PRODUCT_ACTIVITY_WEEKLY},
+    transforms=[select_fresh_food],
+    sheets=[SheetMapping("categories", "Category Totals"), SheetMapping("fresh_food", "Fresh Food")],
+    pending="the fresh food categories (FRESH_FOOD_KEYWORDS) and the Category column"
+)
+
+def process_fresh_food_tracker_report(week_ending=None, output_directory=WEEKLY_REPORT_SETTINGS["output_directory"]):
     """
     Main function to process fresh food tracker report
-    
-    TODO: Implement the actual workflow:
-    - Download fresh food data from SEED API
-    - Analyze freshness and sales patterns
-    - Generate Excel report with fresh food tracking
+
+    Args:
+        week_ending (str): Last day of the report week YYYY-MM-DD (default: last completed week)
+        output_directory (str): Directory to save the report
+
+    Returns:
+        dict: Results dictionary with success status and details
     """
-    print("📋 Fresh Food Tracker Report - Ready for implementation")
-    return {'success': False, 'error': 'Not implemented yet'}
+    return process_report_spec(SPEC, week_ending, output_directory)
 
 def get_fresh_food_tracker_status():
     """Check if fresh food tracker report is ready to process"""
-    return {'ready_for_processing': False, 'status': 'Not implemented'}
\ No newline at end of file
+    return get_report_spec_status(SPEC)
@@ -2,27 +2,50 @@
 Market Inventory Report Workflow
 ================================
 
-TODO: Implement market-level inventory analysis reports.
+Market fills per visit by section from the SEED export of the report
+week, with the section totals. Runs on the weekly report engine
+(report_engine.py).
 
-When ready to implement:
-1. Add SEED API download calls for market inventory data
-2. Add market-specific analysis (by location, region)
-3. Add Excel template for market inventory reporting
-4. Add inventory optimization recommendations
+Draft: not ready until the business confirms the definition (SPEC.pending).
 """
 
-def process_market_inventory_report():
+from config.report_config import WEEKLY_REPORT_SETTINGS
+from report_workflows.weekly.report_spec import ReportSpec, SheetMapping
+from report_workflows.weekly.report_engine import process_report_spec, get_report_spec_status
+from report_workflows.weekly.sources import MARKET_FILLS_BY_SECTION, clean_seed_frame, find_column
+
+def summarize_sections(frames):
+    """Cleaned fills export and the numeric totals per section"""
+    fills = clean_seed_frame(frames['fills'])
+    section = find_column(fills, "section")
+    if section is None:
+        print("⚠️ MKT Fills Per Visit By Section has no Section column - section totals skipped")
+        return {'fills': fills}
+    sections = fills.groupby(section).sum(numeric_only=True)
+    sections.insert(0, 'Rows', fills.groupby(section).size())
+    return {'fills': fills, 'sections': sections.reset_index()}
+
+SPEC = ReportSpec(
+    "market_inventory", "Market Inventory Report",
+    sources={'fills': MARKET_FILLS_BY_SECTION},
+    transforms=[summarize_sections],
+    sheets=[SheetMapping("sections", "Section Totals"), SheetMapping("fills", "Fills Per Visit")],
+    pending="that MKT Fills Per Visit By Section is the market inventory source and its Section column"
+)
+
+def process_market_inventory_report(week_ending=None, output_directory=WEEKLY_REPORT_SETTINGS["output_directory"]):
     """
     Main function to process market inventory report
-    
-    TODO: Implement the actual workflow:
-    - Download market inventory data from SEED API
-    - Analyze inventory levels by market/location
-    - Generate Excel report with market inventory analysis
+
+    Args:
+        week_ending (str): Last day of the report week YYYY-MM-DD (default: last completed week)
+        output_directory (str): Directory to save the report
+
+    Returns:
+        dict: Results dictionary with success status and details
     """
-    print("📋 Market Inventory Report - Ready for implementation")
-    return {'success': False, 'error': 'Not implemented yet'}
+    return process_report_spec(SPEC, week_ending, output_directory)
 
 def get_market_inventory_status():
     """Check if market inventory report is ready to process"""
-    return {'ready_for_processing': False, 'status': 'Not implemented'}
\ No newline at end of file
+    return get_report_spec_status(SPEC)
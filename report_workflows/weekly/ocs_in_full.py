@@ -2,27 +2,60 @@
 OCS in Full Report Workflow
 ===========================
 
-TODO: Implement office coffee service full analysis reports.
+Office Coffee Service orders delivered in full during the report week:
+in-full rate per customer and the OCS lines that were shorted.
+Runs on the weekly report engine (report_engine.py).
 
-When ready to implement:
-1. Add SEED API download calls for OCS data
-2. Add OCS-specific analysis (office locations, usage patterns)
-3. Add Excel template for OCS reporting
-4. Add OCS performance metrics
+Draft: not ready until the business confirms the definition (SPEC.pending).
 """
 
-def process_ocs_in_full_report():
+from config.report_config import WEEKLY_REPORT_SETTINGS
+from report_workflows.weekly.report_spec import ReportSpec, SheetMapping
+from report_workflows.weekly.report_engine import process_report_spec, get_report_spec_status
+from report_workflows.weekly.sources import WEEKLY_ITEM_LINES, get_short_units
+
+def summarize_in_full(frames):
+    """In-full rate per OCS customer (lowest first) and the shorted OCS lines"""
+    lines = frames['lines']
+    ocs = lines[lines['isOCS'] == 1]
+
+    customers = ocs.groupby(['vendsysName', 'seedName']).agg(
+        orderDays=('orderDate', 'nunique'),
+        lines=('lines', 'sum'),
+        shortLines=('shortLines', 'sum')
+    )
+    customers['inFullLines'] = customers['lines'] - customers['shortLines']
+    customers['inFullRate'] = (customers['inFullLines'] / customers['lines']).round(4)
+    customers = customers.reset_index().sort_values(['inFullRate', 'vendsysName'])
+
+    shorted = ocs[ocs['shortLines'] > 0]
+    shorts = shorted.join(get_short_units(shorted))[[
+        'orderDate', 'vendsysName', 'seedName', 'product', 'singlesOrdered', 'singlesPicked',
+        'singlesShort', 'casesOrdered', 'casesPicked', 'casesShort'
+    ]].sort_values(['vendsysName', 'orderDate', 'product'])
+    return {'customers': customers, 'shorts': shorts}
+
+SPEC = ReportSpec(
+    "ocs_in_full", "OCS in Full Report",
+    sources={'lines': WEEKLY_ITEM_LINES},
+    transforms=[summarize_in_full],
+    sheets=[SheetMapping("customers", "In Full by Customer"), SheetMapping("shorts", "Short Lines")],
+    pending="how OCS orders are identified (locID or barcode prefix 'OCS') and what counts as in full"
+)
+
+def process_ocs_in_full_report(week_ending=None, output_directory=WEEKLY_REPORT_SETTINGS["output_directory"]):
     """
     Main function to process OCS in full report
-    
-    TODO: Implement the actual workflow:
-    - Download OCS data from SEED API
-    - Process office coffee service data
-    - Generate Excel report with OCS analysis
+
+    Args:
+        week_ending (str): Last day of the report week YYYY-MM-DD (default: last completed week)
+        output_directory (str): Directory to save the report
+
+    Returns:
+        dict: Results dictionary with success status and details
     """
-    print("📋 OCS in Full Report - Ready for implementation")
-    return {'success': False, 'error': 'Not implemented yet'}
+    return process_report_spec(SPEC, week_ending, output_directory)
 
 def get_ocs_in_full_status():
     """Check if OCS in full report is ready to process"""
-    return {'ready_for_processing': False, 'status': 'Not implemented'}
\ No newline at end of file
+    return get_report_spec_status(SPEC)
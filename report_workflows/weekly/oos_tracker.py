@@ -2,27 +2,66 @@
 OOS Tracker Report Workflow
 ===========================
 
-TODO: Implement out-of-stock tracking reports.
+Products shorted during the report week: on how many days and for how
+many accounts, units short and warehouse stock on hand, plus the daily
+short rate. Runs on the weekly report engine (report_engine.py).
 
-When ready to implement:
-1. Add SEED API download calls for OOS data
-2. Add OOS analysis logic (identify patterns, trends)
-3. Add Excel template for OOS tracking
-4. Add alerting for critical stockouts
+Draft: not ready until the business confirms the definition (SPEC.pending).
 """
 
-def process_oos_tracker_report():
+from config.report_config import WEEKLY_REPORT_SETTINGS
+from report_workflows.weekly.report_spec import ReportSpec, SheetMapping
+from report_workflows.weekly.report_engine import process_report_spec, get_report_spec_status
+from report_workflows.weekly.sources import WEEKLY_ITEM_LINES, WAREHOUSE_STOCK, get_short_units
+
+def summarize_shorts(frames):
+    """Shorted products of the week (worst first) and the short rate per day"""
+    lines = frames['lines'].join(get_short_units(frames['lines']))
+    shorted = lines[lines['shortLines'] > 0]
+
+    summary = shorted.groupby('product').agg(
+        daysShort=('orderDate', 'nunique'),
+        accountsShort=('vendsysName', 'nunique'),
+        shortLines=('shortLines', 'sum'),
+        singlesShort=('singlesShort', 'sum'),
+        casesShort=('casesShort', 'sum'),
+        ocsShortLines=('isOCS', 'sum')
+    )
+    summary = summary.join(lines.groupby('product')['lines'].sum().rename('totalLines'))
+    summary['shortRate'] = (summary['shortLines'] / summary['totalLines']).round(4)
+    summary = summary.reset_index().merge(frames['stock'], on='product', how='left')
+    summary = summary.sort_values(['shortLines', 'singlesShort'], ascending=False)
+
+    daily = lines.groupby('orderDate').agg(
+        lines=('lines', 'sum'),
+        shortLines=('shortLines', 'sum'),
+        singlesShort=('singlesShort', 'sum'),
+        casesShort=('casesShort', 'sum')
+    )
+    daily['shortRate'] = (daily['shortLines'] / daily['lines']).round(4)
+    return {'summary': summary, 'daily': daily.reset_index()}
+
+SPEC = ReportSpec(
+    "oos_tracker", "OOS Tracker Report",
+    sources={'lines': WEEKLY_ITEM_LINES, 'stock': WAREHOUSE_STOCK},
+    transforms=[summarize_shorts],
+    sheets=[SheetMapping("summary", "OOS Summary"), SheetMapping("daily", "Daily Trend")],
+    pending="out-of-stock definition (ItemView lines picked short, with Level stock on hand)"
+)
+
+def process_oos_tracker_report(week_ending=None, output_directory=WEEKLY_REPORT_SETTINGS["output_directory"]):
     """
     Main function to process OOS tracker report
-    
-    TODO: Implement the actual workflow:
-    - Download OOS data from SEED API
-    - Analyze stockout patterns and trends
-    - Generate Excel report with OOS tracking
+
+    Args:
+        week_ending (str): Last day of the report week YYYY-MM-DD (default: last completed week)
+        output_directory (str): Directory to save the report
+
+    Returns:
+        dict: Results dictionary with success status and details
     """
-    print("📋 OOS Tracker Report - Ready for implementation")
-    return {'success': False, 'error': 'Not implemented yet'}
+    return process_report_spec(SPEC, week_ending, output_directory)
 
 def get_oos_tracker_status():
     """Check if OOS tracker report is ready to process"""
-    return {'ready_for_processing': False, 'status': 'Not implemented'}
\ No newline at end of file
+    return get_report_spec_status(SPEC)
@@ -0,0 +1,403 @@
+"""
+Weekly Report Engine
+====================
+
+Runs weekly report specs (report_spec.py) as one dependency graph:
+
+1. Plan - sources shared by several reports are fetched once, each SEED
+   report is one download and all queries on a database share one connection
+2. Fetch - on the task graph under CONCURRENT_RESOURCE_LIMITS ("api", "db").
+   Fetched frames are kept in the download cache under the report week,
+   so reports run one after another, and reruns after a failure, reuse them
+3. Transform and render - each report starts as soon as its own sources
+   are in; workbooks are streamed with openpyxl's write-only mode
+"""
+
+import time
+import gzip
+import pickle
+import asyncio
+import importlib
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+import pandas as pd
+from config.report_config import CONCURRENT_RESOURCE_LIMITS, DOWNLOAD_PATHS, WEEKLY_REPORT_SETTINGS
+from utils.task_graph import TaskGraph, TaskStep
+from utils.run_history import RunRecorder, file_size
+from utils.download_cache import DownloadCache
+from utils.downloader import download_seed_report
+from utils.tracing import span
+from excel_processing.weekly_excel import WeeklyExcelProcessor, get_week_label
+from report_workflows.weekly.report_spec import ReportSpec
+
+BATCH_WORKFLOW = "weekly_reports"
+
+def get_report_week(week_ending: Optional[str] = None) -> Dict[str, str]:
+    """
+    First and last day of a report week
+
+    Args:
+        week_ending: Last day of the week YYYY-MM-DD (default: the last
+            WEEKLY_REPORT_SETTINGS["week_end_weekday"] before today)
+
+    Returns:
+        dict: {'week_start', 'week_end'} as YYYY-MM-DD
+    """
+    if week_ending:
+        week_end = datetime.strptime(week_ending, "%Y-%m-%d").date()
+    else:
+        today = date.today()
+        week_end = today - timedelta(days=(today.weekday() - WEEKLY_REPORT_SETTINGS["week_end_weekday"]) % 7 or 7)
+    week_start = week_end - timedelta(days=6)
+    return {'week_start': week_start.isoformat(), 'week_end': week_end.isoformat()}
+
+def plan_fetches(specs: List[ReportSpec]) -> Dict[str, List[Any]]:
+    """
+    Group the sources of several reports into fetch steps
+
+    Each SEED report gets its own step (one download); SQL sources are
+    grouped per database so they share one connection. A source used by
+    several reports is fetched once.
+
+    Returns:
+        dict: Fetch step name -> sources
+
+    Raises:
+        ValueError: When two different queries share a name
+    """
+    sources = {}
+    for spec in specs:
+        for source in spec.sources.values():
+            known = sources.setdefault(source.key, source)
+            if known.kind == "sql" and (known.query, known.params) != (source.query, source.params):
+                raise ValueError(f"Different queries are named {source.name} on {source.database}")
+
+    plan: Dict[str, List[Any]] = {}
+    for source in sources.values():
+        step_name = f"fetch.{source.key}" if source.kind == "seed" else f"fetch.{source.database}"
+        plan.setdefault(step_name, []).append(source)
+    return plan
+
+def _load_seed_source(source, week: Dict[str, str], use_cache: bool) -> pd.DataFrame:
+    # SEED returns the period the report is set up for, whatever week we ask for;
+    # never download (or cache) it as another week
+    seed_week = get_report_week()
+    if week['week_end'] != seed_week['week_end']:
+        raise ValueError(f"SEED {source.report_name} only covers the last completed week "
+                         f"(ending {seed_week['week_end']}), not the week ending {week['week_end']}")
+    filename = f"{source.key.split('.', 1)[1]}_{week['week_end']}.xlsx"
+    result = download_seed_report(source.report_id, filename, DOWNLOAD_PATHS["weekly"],
+                                  business_date=week['week_end'], use_cache=use_cache)
+    if not result['success']:
+        raise Exception(f"Failed to download {source.report_name}: {result['error']}")
+    return pd.read_excel(result['path'])
+
+def _load_sql_source(source, week: Dict[str, str], get_connection: Callable) -> pd.DataFrame:
+    from database.connection import execute_query
+    params = [week[param] for param in source.params]
+    with span("db.weekly_query", query=source.name, database=source.database):
+        return execute_query(get_connection(), source.query, params or None)
+
+def fetch_source(source, week: Dict[str, str], get_connection: Optional[Callable] = None,
+                 use_cache: bool = True) -> pd.DataFrame:
+    """
+    Fetch one source for a report week
+
+    Parsed frames are cached under the source's cache key (which changes
+    with the query or SEED report ID) and the week's last day, so a week is
+    only downloaded, parsed or queried once. SEED sources are only downloaded
+    for the last completed week; earlier weeks come from the cache or fail.
+
+    Args:
+        source: SeedSource or SqlSource
+        week: get_report_week() result
+        get_connection: Returns an open connection to the source's database (SQL sources)
+        use_cache: Reuse the cached frame for the same week
+
+    Returns:
+        pandas.DataFrame
+    """
+    def load():
+        if source.kind == "seed":
+            return _load_seed_source(source, week, use_cache)
+        return _load_sql_source(source, week, get_connection)
+
+    if not use_cache:
+        return load()
+
+    cache = DownloadCache()
+    object_path, cache_hit = cache.get_or_fetch(
+        source.cache_key, week['week_end'],
+        lambda: gzip.compress(pickle.dumps(load(), protocol=pickle.HIGHEST_PROTOCOL), compresslevel=1)
+    )
+    if cache_hit:
+        print(f"♻️ Using cached {source.describe()} for week ending {week['week_end']}")
+    with open(object_path, 'rb') as file:
+        return pickle.loads(gzip.decompress(file.read()))
+
+def fetch_database_sources(database: str, sources: List[Any], week: Dict[str, str],
+                           use_cache: bool = True) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch the SQL sources of one database over a single connection
+
+    The connection is only opened when a source is not cached.
+
+    Returns:
+        dict: Source key -> DataFrame
+    """
+    from database.connection import get_database_connection
+    connection = None
+
+    def get_connection():
+        nonlocal connection
+        if connection is None:
+            connection = get_database_connection(database)
+        return connection
+
+    try:
+        return {source.key: fetch_source(source, week, get_connection, use_cache) for source in sources}
+    finally:
+        if connection is not None:
+            connection.close()
+
+def apply_transforms(spec: ReportSpec, frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """
+    Run a report's transforms in order
+
+    Args:
+        spec: Report spec
+        frames: Source alias -> DataFrame
+
+    Returns:
+        dict: Source frames plus every transform output
+    """
+    frames = dict(frames)
+    for transform in spec.transforms:
+        with span(f"transform.{transform.__name__}", report=spec.name):
+            frames.update(transform(frames))
+    return frames
+
+def render_report(spec: ReportSpec, frames: Dict[str, pd.DataFrame], week: Dict[str, str],
+                  output_directory: str, chunk_rows: Optional[int] = None) -> str:
+    """
+    Write a report's mapped frames to its workbook
+
+    Returns:
+        str: Path to the generated Excel file
+    """
+    output_path = WeeklyExcelProcessor(spec.template).generate_report(
+        frames, spec.sheets, output_directory, spec.filename_prefix, get_week_label(week['week_end']), chunk_rows
+    )
+    print(f"💾 Saved: {output_path}")
+    return output_path
+
+def build_weekly_report_graph(specs: List[ReportSpec], week: Dict[str, str], output_directory: str,
+                              recorder: RunRecorder = None, use_cache: bool = True) -> TaskGraph:
+    """
+    Build the step graph for a set of weekly reports
+
+    Args:
+        specs: Reports to run
+        week: get_report_week() result
+        output_directory: Directory for the generated reports
+        recorder: Run recorder whose memory budget the render steps check
+        use_cache: Reuse cached source frames for the same week
+
+    Returns:
+        TaskGraph ready to run
+    """
+    graph = TaskGraph(CONCURRENT_RESOURCE_LIMITS)
+    source_steps = {}
+    for step_name, sources in plan_fetches(specs).items():
+        if sources[0].kind == "seed":
+            function = lambda inputs, source=sources[0]: {source.key: fetch_source(source, week, use_cache=use_cache)}
+            graph.add(TaskStep(step_name, function, resource="api"))
+        else:
+            function = lambda inputs, sources=sources: fetch_database_sources(sources[0].database, sources, week, use_cache)
+            graph.add(TaskStep(step_name, function, resource="db"))
+        source_steps.update({source.key: step_name for source in sources})
+
+    for spec in specs:
+        def transform(inputs, spec=spec):
+            fetched = {}
+            for frames in inputs.values():
+                fetched.update(frames)
+            return apply_transforms(spec, {alias: fetched[source.key] for alias, source in spec.sources.items()})
+
+        def render(inputs, spec=spec):
+            chunk_rows = None
+            if recorder:
+                recorder.check_memory(f"{spec.name}.excel")
+                chunk_rows = recorder.get_chunk_rows(f"{spec.name}.excel")
+            return render_report(spec, inputs[f"{spec.name}.transform"], week, output_directory, chunk_rows)
+
+        fetch_steps = sorted({source_steps[source.key] for source in spec.sources.values()})
+        graph.add(TaskStep(f"{spec.name}.transform", transform, fetch_steps))
+        graph.add(TaskStep(f"{spec.name}.excel", render, [f"{spec.name}.transform"]))
+    return graph
+
+async def run_report_specs_async(specs: List[ReportSpec], week_ending: Optional[str] = None,
+                                 output_directory: str = WEEKLY_REPORT_SETTINGS["output_directory"],
+                                 use_cache: bool = True, workflow: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run weekly reports with shared, batched fetches
+
+    Args:
+        specs: Reports to run
+        week_ending: Last day of the report week YYYY-MM-DD (default: last completed week;
+            earlier weeks only for SQL sources and cached SEED frames)
+        output_directory: Directory for the generated reports
+        use_cache: Reuse cached source frames for the same week
+        workflow: Run history name (default: the report name, or "weekly_reports" for several)
+
+    Returns:
+        dict: Results with success status, per-report results and the critical path
+    """
+    start_time = time.time()
+    week = get_report_week(week_ending)
+    recorder = RunRecorder(workflow or (specs[0].name if len(specs) == 1 else BATCH_WORKFLOW))
+    print(f"📅 Week {week['week_start']} to {week['week_end']}")
+    if week != get_report_week() and any(source.kind == "seed" for spec in specs for source in spec.sources.values()):
+        print("⚠️ SEED reports only cover the last completed week - "
+              "reports with SEED sources need this week's frames in the cache")
+
+    try:
+        graph = build_weekly_report_graph(specs, week, output_directory, recorder, use_cache)
+    except ValueError as e:
+        recorder.finish(success=False, error=str(e))
+        return {'success': False, 'error': str(e), 'week': week, 'processing_time': time.time() - start_time}
+    fetch_count = sum(1 for name in graph.steps if name.startswith("fetch."))
+    source_count = sum(len(spec.sources) for spec in specs)
+    print(f"📥 {source_count} report sources planned as {fetch_count} fetches")
+    steps = await graph.run()
+
+    print()
+    graph.print_summary()
+
+    # Steps were timed by the graph; completed ones go to the run history
+    for name, step in steps.items():
+        if step.status == "success":
+            if isinstance(step.result, dict):
+                rows = sum(len(frame) for frame in step.result.values() if isinstance(frame, pd.DataFrame))
+                recorder.add_stage(name, step.duration, rows=rows)
+            else:
+                recorder.add_stage(name, step.duration, size=file_size(step.result))
+
+    reports = {}
+    for spec in specs:
+        own_steps = [f"{spec.name}.transform", f"{spec.name}.excel"]
+        fetch_steps = steps[own_steps[0]].depends_on
+        errors = [f"{name}: {steps[name].error}" for name in fetch_steps + own_steps if steps[name].status == "failed"]
+        frames = steps[own_steps[0]].result or {}
+        reports[spec.name] = {
+            'success': steps[own_steps[1]].status == "success",
+            'output_path': steps[own_steps[1]].result,
+            'error': "; ".join(errors) or steps[own_steps[1]].error,
+            'data_summary': {mapping.sheet: len(frames[mapping.frame]) for mapping in spec.sheets if mapping.frame in frames}
+        }
+
+    failed = [f"{name}: {report['error']}" for name, report in reports.items() if not report['success']]
+    recorder.finish(success=not failed, error="; ".join(failed) or None)
+    return {
+        'success': not failed,
+        'week': week,
+        'reports': reports,
+        'output_paths': {name: report['output_path'] for name, report in reports.items() if report['success']},
+        'fetches': {name: {'status': step.status, 'seconds': step.duration} for name, step in steps.items()
+                    if name.startswith("fetch.")},
+        'critical_path': [step.name for step in graph.get_critical_path()],
+        'stage_timings': recorder.get_stage_timings(),
+        'processing_time': time.time() - start_time
+    }
+
+def process_report_spec(spec: ReportSpec, week_ending: Optional[str] = None,
+                        output_directory: str = WEEKLY_REPORT_SETTINGS["output_directory"],
+                        use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Run one weekly report
+    Synchronous wrapper for the workflow modules
+
+    Args:
+        spec: Report spec
+        week_ending: Last day of the report week YYYY-MM-DD (default: last completed week)
+        output_directory: Directory to save the report
+        use_cache: Reuse cached source frames for the same week
+
+    Returns:
+        dict: Results dictionary with success status and details
+    """
+    problems = spec.get_problems()
+    if problems:
+        print(f"⏭️ {spec.title}: {'; '.join(problems)}")
+        return {'success': False, 'error': "; ".join(problems)}
+
+    print(f"🚀 Starting {spec.title} processing...")
+    results = asyncio.run(run_report_specs_async([spec], week_ending, output_directory, use_cache))
+    report = results.get('reports', {}).get(spec.name, {'success': False, 'error': results.get('error')})
+    if report['success']:
+        print(f"✅ Report completed successfully ({results['processing_time']:.1f}s)")
+    else:
+        print(f"❌ {spec.title} failed: {report['error']}")
+    return {
+        'success': report['success'],
+        'output_path': report.get('output_path'),
+        'error': report.get('error'),
+        'week': results['week'],
+        'data_summary': report.get('data_summary', {}),
+        'processing_time': results['processing_time'],
+        'stage_timings': results.get('stage_timings', {})
+    }
+
+def load_weekly_specs(names: Optional[List[str]] = None) -> List[ReportSpec]:
+    """
+    Specs of weekly reports in the report registry
+
+    Args:
+        names: Report names (default: every weekly report)
+
+    Returns:
+        list: ReportSpec of each report, from its workflow module's SPEC
+    """
+    from reports.report_registry import GROUPS, REPORTS
+    return [importlib.import_module(REPORTS[name].module).SPEC for name in names or GROUPS['weekly']]
+
+def process_all_weekly_reports(week_ending: Optional[str] = None,
+                               output_directory: str = WEEKLY_REPORT_SETTINGS["output_directory"],
+                               use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Run every ready weekly report in one graph (shared sources fetched once)
+    Synchronous wrapper for menu system integration
+
+    Returns:
+        dict: run_report_specs_async() results
+    """
+    specs = []
+    for spec in load_weekly_specs():
+        problems = spec.get_problems()
+        if problems:
+            print(f"⏭️ {spec.title}: {'; '.join(problems)} - skipped")
+        else:
+            specs.append(spec)
+    if not specs:
+        return {'success': False, 'error': 'No weekly report is ready for processing'}
+
+    print("⚡ PROCESSING ALL WEEKLY REPORTS")
+    print("=" * 50)
+    return asyncio.run(run_report_specs_async(specs, week_ending, output_directory, use_cache, BATCH_WORKFLOW))
+
+def get_report_spec_status(spec: ReportSpec) -> Dict[str, Any]:
+    """
+    Check whether a weekly report is configured to run
+
+    Returns:
+        dict: Status information
+    """
+    problems = spec.get_problems()
+    return {
+        'ready_for_processing': not problems,
+        'status': "; ".join(problems) if problems else 'Ready',
+        'sources': [source.describe() for source in spec.sources.values()],
+        'sheets': [mapping.sheet for mapping in spec.sheets],
+        'template': spec.template or 'New workbook',
+        'last_checked': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
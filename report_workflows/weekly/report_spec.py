@@ -0,0 +1,183 @@
+"""
+Weekly Report Specs
+===================
+
+Declarative description of a weekly report: where its data comes from,
+how the fetched frames are transformed and which frame goes to which sheet.
+report_engine.py plans, fetches and renders any number of specs together,
+so adding a weekly report means writing a spec, not a workflow.
+
+Usage:
+    SPEC = ReportSpec(
+        "oos_tracker", "OOS Tracker Report",
+        sources={'lines': WEEKLY_ITEM_LINES},
+        transforms=[summarize_shorts],
+        sheets=[SheetMapping("summary", "OOS Summary")]
+    )
+"""
+
+import os
+import hashlib
+from typing import Callable, Dict, List, Optional, Sequence
+from config.report_config import SEED_REPORTS
+
+DATABASES = ("lightspeed", "level")
+
+# Report week values SQL sources can take as parameters
+WEEK_PARAMS = ("week_start", "week_end")
+
+def _slug(text: str) -> str:
+    return "".join(character if character.isalnum() else "_" for character in text.lower()).strip("_")
+
+class SeedSource:
+    """SEED report (a SEED_REPORTS name) downloaded for the report week"""
+
+    kind = "seed"
+
+    def __init__(self, report_name: str):
+        """
+        Initialize SEED source
+
+        Args:
+            report_name: Key of SEED_REPORTS, e.g. "Product Activity Weekly"
+        """
+        self.report_name = report_name
+        self.key = f"seed.{_slug(report_name)}"
+
+    @property
+    def cache_key(self) -> str:
+        """Download cache key: changes when the name points at another SEED report ID"""
+        return f"{self.key}.{self.report_id}"
+
+    @property
+    def report_id(self) -> Optional[str]:
+        """SEED report ID (None when the name is not configured)"""
+        return SEED_REPORTS.get(self.report_name)
+
+    def get_problems(self) -> List[str]:
+        """Configuration problems that keep the source from being fetched"""
+        if not self.report_id:
+            return [f"SEED report '{self.report_name}' is not in SEED_REPORTS"]
+        return []
+
+    def describe(self) -> str:
+        """Short description for the configuration screen"""
+        return f"SEED {self.report_name} ({self.report_id or 'no ID'})"
+
+class SqlSource:
+    """SQL query run once per report week"""
+
+    kind = "sql"
+
+    def __init__(self, name: str, database: str, query: str, params: Sequence[str] = ()):
+        """
+        Initialize SQL source
+
+        Args:
+            name: Query name, unique per database (reports sharing a source share its results)
+            database: "lightspeed" or "level"
+            query: SQL with ? placeholders
+            params: Report week values bound to the placeholders, from WEEK_PARAMS
+        """
+        self.name = name
+        self.database = database
+        self.query = query
+        self.params = tuple(params)
+        self.key = f"sql.{database}.{_slug(name)}"
+
+    @property
+    def cache_key(self) -> str:
+        """Download cache key: changes whenever the query or its parameters change"""
+        digest = hashlib.sha256(repr((self.query, self.params)).encode()).hexdigest()[:12]
+        return f"{self.key}.{digest}"
+
+    def get_problems(self) -> List[str]:
+        """Configuration problems that keep the source from being fetched"""
+        problems = []
+        if self.database not in DATABASES:
+            problems.append(f"Unknown database '{self.database}' for query {self.name}")
+        unknown = [param for param in self.params if param not in WEEK_PARAMS]
+        if unknown:
+            problems.append(f"Query {self.name} uses unknown parameters: {', '.join(unknown)}")
+        return problems
+
+    def describe(self) -> str:
+        """Short description for the configuration screen"""
+        return f"SQL {self.name} ({self.database})"
+
+class SheetMapping:
+    """Where one output frame is written"""
+
+    def __init__(self, frame: str, sheet: str, start_row: int = 1, start_col: int = 1, header: bool = True):
+        """
+        Initialize sheet mapping
+
+        Args:
+            frame: Name of a source or transform output frame
+            sheet: Worksheet name (created when the report has no template)
+            start_row: First row written (the header row when header is set)
+            start_col: First column written
+            header: Write column names above the data
+        """
+        self.frame = frame
+        self.sheet = sheet
+        self.start_row = start_row
+        self.start_col = start_col
+        self.header = header
+
+class ReportSpec:
+    """
+    One weekly report
+
+    Transforms receive a dict of frame name -> DataFrame (the sources under
+    their aliases plus earlier transform outputs) and return new or
+    replaced frames. Source frames are shared between reports in the same
+    run, so transforms must not modify them in place.
+    """
+
+    def __init__(self, name: str, title: str, sources: Dict[str, object],
+                 transforms: Sequence[Callable] = (), sheets: Sequence[SheetMapping] = (),
+                 template: Optional[str] = None, filename_prefix: Optional[str] = None,
+                 pending: Optional[str] = None):
+        """
+        Initialize report spec
+
+        Args:
+            name: Report name, as in reports/report_registry.py
+            title: Display title
+            sources: Alias -> SeedSource or SqlSource
+            transforms: Functions run in order, frames dict -> dict of output frames
+            sheets: Frames written to the workbook
+            template: Excel template to fill in (default: a new workbook with one sheet per mapping)
+            filename_prefix: Output file name before the week label (default: title)
+            pending: What the business still has to confirm about the report's
+                definition; the report is not ready while it is set
+        """
+        self.name = name
+        self.title = title
+        self.sources = dict(sources)
+        self.transforms = list(transforms)
+        self.sheets = list(sheets)
+        self.template = template
+        self.filename_prefix = filename_prefix or title
+        self.pending = pending
+
+    def get_problems(self) -> List[str]:
+        """
+        Configuration problems that keep the report from running
+
+        Checks configuration only (no database or SEED connection is made).
+
+        Returns:
+            list: Problem descriptions, empty when the report is ready
+        """
+        problems = []
+        if self.pending:
+            problems.append(f"Awaiting confirmation: {self.pending}")
+        for source in self.sources.values():
+            problems += source.get_problems()
+        if not self.sheets:
+            problems.append("No sheets mapped")
+        if self.template and not os.path.exists(self.template):
+            problems.append(f"Template not found: {self.template}")
+        return problems
@@ -0,0 +1,84 @@
+"""
+Weekly Report Sources
+=====================
+
+Data sources shared by several weekly report specs. Reports run together
+fetch a shared source once (see report_engine.plan_fetches).
+"""
+
+from typing import Optional
+import pandas as pd
+from report_workflows.weekly.report_spec import SeedSource, SqlSource
+
+# Order lines of the report week per day, customer and product (singles and cases kept apart)
+WEEKLY_ITEM_LINES = SqlSource("weekly_item_lines", "lightspeed", """
+    SELECT
+        iv.orderDate,
+        iv.cusDescription as vendsysName,
+        iv.locDescription as seedName,
+        LTRIM(RTRIM(iv.product)) as product,
+        CASE WHEN iv.locID = 'OCS' OR LEFT(iv.machineBarcode, 3) = 'OCS' THEN 1 ELSE 0 END as isOCS,
+        COUNT(*) as lines,
+        SUM(CASE WHEN iv.updatedQuantity < iv.quantity THEN 1 ELSE 0 END) as shortLines,
+        ISNULL(SUM(CASE WHEN iv.coil != 'DeliveryCase' THEN iv.quantity END), 0) as singlesOrdered,
+        ISNULL(SUM(CASE WHEN iv.coil != 'DeliveryCase' THEN iv.updatedQuantity END), 0) as singlesPicked,
+        ISNULL(SUM(CASE WHEN iv.coil = 'DeliveryCase' THEN iv.quantity END), 0) as casesOrdered,
+        ISNULL(SUM(CASE WHEN iv.coil = 'DeliveryCase' THEN iv.updatedQuantity END), 0) as casesPicked
+    FROM ItemView iv
+    WHERE iv.orderDate BETWEEN ? AND ?
+    GROUP BY
+        iv.orderDate,
+        iv.cusDescription,
+        iv.locDescription,
+        LTRIM(RTRIM(iv.product)),
+        CASE WHEN iv.locID = 'OCS' OR LEFT(iv.machineBarcode, 3) = 'OCS' THEN 1 ELSE 0 END
+    """, params=("week_start", "week_end"))
+
+# Warehouse quantity on hand of active items
+WAREHOUSE_STOCK = SqlSource("warehouse_stock", "level", """
+    SELECT
+        LTRIM(RTRIM(itemName)) as product,
+        currentQty
+    FROM dbo.AreaItemParView
+    WHERE itemActive = 1
+    """)
+
+WEEKLY_SALES_MARKET = SeedSource("Weekly Sales Reporting Market")
+WEEKLY_SALES_DELIVERY = SeedSource("Weekly Sales Reporting Delivery")
+MARKET_FILLS_BY_SECTION = SeedSource("MKT Fills Per Visit By Section")
+PRODUCT_ACTIVITY_WEEKLY = SeedSource("Product Activity Weekly")
+
+def clean_seed_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Tidy a SEED export: trimmed column names, no empty rows or columns
+
+    Returns:
+        pandas.DataFrame: New frame (the shared source frame is left as is)
+    """
+    frame = frame.dropna(how='all').dropna(axis=1, how='all')
+    return frame.rename(columns=lambda column: str(column).strip())
+
+def find_column(frame: pd.DataFrame, *keywords: str) -> Optional[str]:
+    """
+    First column whose name contains one of the keywords (case-insensitive)
+
+    Returns:
+        str or None: Column name
+    """
+    for keyword in keywords:
+        for column in frame.columns:
+            if keyword.lower() in str(column).lower():
+                return column
+    return None
+
+def get_short_units(lines: pd.DataFrame) -> pd.DataFrame:
+    """
+    Singles and cases ordered but not picked, per line group
+
+    Returns:
+        pandas.DataFrame: singlesShort and casesShort columns aligned with lines
+    """
+    return pd.DataFrame({
+        'singlesShort': (lines['singlesOrdered'] - lines['singlesPicked']).clip(lower=0),
+        'casesShort': (lines['casesOrdered'] - lines['casesPicked']).clip(lower=0)
+    }, index=lines.index)
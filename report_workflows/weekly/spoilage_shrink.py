@@ -2,27 +2,58 @@
 Spoilage/Shrink Report Workflow
 ===============================
 
-TODO: Implement product shrink and spoilage tracking reports.
+Products with spoilage or shrink in the SEED Product Activity Weekly
+export, largest first, with the week's totals. Shares its source with the
+Fresh Food Tracker. Runs on the weekly report engine (report_engine.py).
 
-When ready to implement:
-1. Add SEED API download calls for shrink/spoilage data
-2. Add shrink analysis (waste patterns, cost calculations)
-3. Add Excel template for spoilage reporting
-4. Add waste reduction recommendations
+Draft: not ready until the business confirms the definition (SPEC.pending).
 """
 
-def process_spoilage_shrink_report():
+import pandas as pd
+from config.report_config import WEEKLY_REPORT_SETTINGS
+from report_workflows.weekly.report_spec import ReportSpec, SheetMapping
+from report_workflows.weekly.report_engine import process_report_spec, get_report_spec_status
+from report_workflows.weekly.sources import PRODUCT_ACTIVITY_WEEKLY, clean_seed_frame
+
+# Numeric columns whose name contains one of these count as shrink (case-insensitive)
+SHRINK_KEYWORDS = ["spoil", "shrink", "waste", "damage", "expired"]
+
+def select_shrink(frames):
+    """Rows with any shrink, sorted by total shrink, and the total of each shrink column"""
+    activity = clean_seed_frame(frames['activity'])
+    shrink_columns = [column for column in activity.select_dtypes('number').columns
+                      if any(keyword in column.lower() for keyword in SHRINK_KEYWORDS)]
+    if not shrink_columns:
+        raise ValueError("Product Activity Weekly has no spoilage/shrink columns")
+
+    total_shrink = activity[shrink_columns].abs().sum(axis=1)
+    shrink = activity[total_shrink > 0].assign(totalShrink=total_shrink).sort_values('totalShrink', ascending=False)
+    totals = pd.DataFrame({'Measure': shrink_columns, 'Total': activity[shrink_columns].sum().values,
+                           'Products': (activity[shrink_columns] != 0).sum().values})
+    return {'shrink': shrink, 'totals': totals}
+
+SPEC = ReportSpec(
+    "spoilage_shrink", "Spoilage/Shrink Report",
+    sources={'activity': PRODUCT_ACTIVITY_WEEKLY},
+    transforms=[select_shrink],
+    sheets=[SheetMapping("totals", "Shrink Totals"), SheetMapping("shrink", "Shrink by Product")],
+    filename_prefix="Spoilage Shrink Report",
+    pending="which Product Activity Weekly columns are shrink (SHRINK_KEYWORDS)"
+)
+
+def process_spoilage_shrink_report(week_ending=None, output_directory=WEEKLY_REPORT_SETTINGS["output_directory"]):
     """
     Main function to process spoilage/shrink report
-    
-    TODO: Implement the actual workflow:
-    - Download spoilage/shrink data from SEED API
-    - Analyze waste patterns and costs
-    - Generate Excel report with shrink tracking
+
+    Args:
+        week_ending (str): Last day of the report week YYYY-MM-DD (default: last completed week)
+        output_directory (str): Directory to save the report
+
+    Returns:
+        dict: Results dictionary with success status and details
     """
-    print("📋 Spoilage/Shrink Report - Ready for implementation")
-    return {'success': False, 'error': 'Not implemented yet'}
+    return process_report_spec(SPEC, week_ending, output_directory)
 
 def get_spoilage_shrink_status():
     """Check if spoilage/shrink report is ready to process"""
-    return {'ready_for_processing': False, 'status': 'Not implemented'}
\ No newline at end of file
+    return get_report_spec_status(SPEC)
@@ -2,27 +2,64 @@
 Warehouse Inventory Report Workflow
 ===================================
 
-TODO: Implement warehouse inventory management reports.
+Warehouse stock on hand against the week's picks: weeks of cover per
+active item, items out of stock and items running low.
+Runs on the weekly report engine (report_engine.py).
 
-When ready to implement:
-1. Add SEED API download calls for warehouse data
-2. Add warehouse analysis (stock levels, turnover rates)
-3. Add Excel template for warehouse reporting
-4. Add restocking recommendations
+Draft: not ready until the business confirms the definition (SPEC.pending).
 """
 
-def process_warehouse_inventory_report():
+from config.report_config import WEEKLY_REPORT_SETTINGS
+from report_workflows.weekly.report_spec import ReportSpec, SheetMapping
+from report_workflows.weekly.report_engine import process_report_spec, get_report_spec_status
+from report_workflows.weekly.sources import WEEKLY_ITEM_LINES, WAREHOUSE_STOCK
+
+# Items with less than this many weeks of picks on hand are listed as low stock
+LOW_STOCK_WEEKS = 1.0
+
+def summarize_cover(frames):
+    """Weeks of cover per item, out-of-stock items and low-stock items"""
+    picks = frames['lines'].groupby('product').agg(
+        singlesPicked=('singlesPicked', 'sum'),
+        casesPicked=('casesPicked', 'sum'),
+        accounts=('vendsysName', 'nunique')
+    )
+    inventory = frames['stock'].merge(picks.reset_index(), on='product', how='left')
+    inventory[['singlesPicked', 'casesPicked', 'accounts']] = \
+        inventory[['singlesPicked', 'casesPicked', 'accounts']].fillna(0)
+    inventory['weeksOfCover'] = (inventory['currentQty'] /
+                                 inventory['singlesPicked'].where(inventory['singlesPicked'] > 0)).round(2)
+    inventory = inventory.sort_values('product')
+
+    out_of_stock = inventory[inventory['currentQty'] <= 0].sort_values('singlesPicked', ascending=False)
+    low_stock = inventory[(inventory['currentQty'] > 0) & (inventory['weeksOfCover'] < LOW_STOCK_WEEKS)]
+    return {'inventory': inventory, 'out_of_stock': out_of_stock, 'low_stock': low_stock.sort_values('weeksOfCover')}
+
+SPEC = ReportSpec(
+    "warehouse_inventory", "Warehouse Inventory Report",
+    sources={'stock': WAREHOUSE_STOCK, 'lines': WEEKLY_ITEM_LINES},
+    transforms=[summarize_cover],
+    sheets=[
+        SheetMapping("inventory", "Warehouse Inventory"),
+        SheetMapping("out_of_stock", "Out of Stock"),
+        SheetMapping("low_stock", "Low Stock")
+    ],
+    pending="weeks of cover (stock over singles picked) and the LOW_STOCK_WEEKS threshold"
+)
+
+def process_warehouse_inventory_report(week_ending=None, output_directory=WEEKLY_REPORT_SETTINGS["output_directory"]):
     """
     Main function to process warehouse inventory report
-    
-    TODO: Implement the actual workflow:
-    - Download warehouse inventory data from SEED API
-    - Analyze warehouse stock levels and turnover
-    - Generate Excel report with warehouse inventory
+
+    Args:
+        week_ending (str): Last day of the report week YYYY-MM-DD (default: last completed week)
+        output_directory (str): Directory to save the report
+
+    Returns:
+        dict: Results dictionary with success status and details
     """
-    print("📋 Warehouse Inventory Report - Ready for implementation")
-    return {'success': False, 'error': 'Not implemented yet'}
+    return process_report_spec(SPEC, week_ending, output_directory)
 
 def get_warehouse_inventory_status():
     """Check if warehouse inventory report is ready to process"""
-    return {'ready_for_processing': False, 'status': 'Not implemented'}
\ No newline at end of file
+    return get_report_spec_status(SPEC)
@@ -1,28 +1,53 @@
 """
 Weekly Sales Report Workflow
-===========================
+============================
 
-TODO: Implement weekly sales analysis reports.
+Market and delivery sales of the report week from the two SEED Weekly
+Sales Reporting exports, with the totals of each channel side by side.
+Runs on the weekly report engine (report_engine.py).
 
-When ready to implement:
-1. Add SEED API download calls for sales data
-2. Add data processing logic (pandas operations)
-3. Add Excel template handling (excel_processing module)
-4. Add proper error handling
+The summary totals whatever numeric columns the exports carry, so it
+follows the SEED report setup without naming columns.
 """
 
-def process_weekly_sales_report():
+import pandas as pd
+from config.report_config import WEEKLY_REPORT_SETTINGS
+from report_workflows.weekly.report_spec import ReportSpec, SheetMapping
+from report_workflows.weekly.report_engine import process_report_spec, get_report_spec_status
+from report_workflows.weekly.sources import WEEKLY_SALES_MARKET, WEEKLY_SALES_DELIVERY, clean_seed_frame
+
+def combine_channels(frames):
+    """Cleaned channel exports and the total of every numeric column per channel"""
+    channels = {'Market': clean_seed_frame(frames['market']), 'Delivery': clean_seed_frame(frames['delivery'])}
+    totals = pd.concat({name: frame.select_dtypes('number').sum() for name, frame in channels.items()},
+                       names=['Channel', 'Measure']).rename('Total').reset_index()
+    summary = totals.pivot_table(index='Measure', columns='Channel', values='Total', sort=False).reset_index()
+    return {'market': channels['Market'], 'delivery': channels['Delivery'], 'summary': summary}
+
+SPEC = ReportSpec(
+    "weekly_sales", "Weekly Sales Report",
+    sources={'market': WEEKLY_SALES_MARKET, 'delivery': WEEKLY_SALES_DELIVERY},
+    transforms=[combine_channels],
+    sheets=[
+        SheetMapping("summary", "Summary"),
+        SheetMapping("market", "Market"),
+        SheetMapping("delivery", "Delivery")
+    ]
+)
+
+def process_weekly_sales_report(week_ending=None, output_directory=WEEKLY_REPORT_SETTINGS["output_directory"]):
     """
     Main function to process weekly sales report
-    
-    TODO: Implement the actual workflow:
-    - Download sales data from SEED API
-    - Process and clean the data
-    - Generate Excel report with sales analysis
+
+    Args:
+        week_ending (str): Last day of the report week YYYY-MM-DD (default: last completed week)
+        output_directory (str): Directory to save the report
+
+    Returns:
+        dict: Results dictionary with success status and details
     """
-    print("📋 Weekly Sales Report - Ready for implementation")
-    return {'success': False, 'error': 'Not implemented yet'}
+    return process_report_spec(SPEC, week_ending, output_directory)
 
 def get_weekly_sales_status():
     """Check if weekly sales report is ready to process"""
-    return {'ready_for_processing': False, 'status': 'Not implemented'}
\ No newline at end of file
+    return get_report_spec_status(SPEC)
@@ -14,10 +14,28 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import MenuNavigator utility
 from utils.menu_navigator import MenuNavigator
+from utils.profiling import set_profiling, is_profiling_enabled
 
-from report_workflows.daily.daily_stockout import process_stockout_report
-from report_workflows.daily.inventory_adjustment import process_inventory_adjustment_summary
-from report_workflows.daily.inventory_confirmation import process_inventory_confirmation_report
+# Workflows are imported when their report runs: they pull in pandas,
+# pyodbc, openpyxl, xlwings and Playwright, which the menus don't need
+
+def ask_resume(workflow):
+    """
+    Offer to continue the last failed run of a workflow
+    
+    Args:
+        workflow (str): Run checkpoint workflow name
+        
+    Returns:
+        bool: True to resume
+    """
+    from utils.run_checkpoint import get_unfinished_run
+    
+    run = get_unfinished_run(workflow)
+    if not run:
+        return False
+    answer = input(f"🔁 Last run stopped after: {', '.join(run['stages'])}. Resume it? (Y/n): ").strip().lower()
+    return answer != 'n'
 
 class DailyReportsSystem:
     """Daily reports menu system with sub-navigation"""
@@ -29,9 +47,14 @@ class DailyReportsSystem:
             "🌐 Inventory Confirmation Report",
             "🎯 Process All Daily Reports (Sequential)",
             "⚡ Process All Daily Reports (Concurrent)",
+            self.get_profiling_label(),
             "🔙 Back to Main Menu"
         ]
     
+    def get_profiling_label(self):
+        """Menu label of the profiling switch"""
+        return f"🔬 Profiling: {'ON' if is_profiling_enabled() else 'OFF'}"
+    
     def stockout_submenu(self):
         """Daily Stockout Report sub-menu"""
         options = [
@@ -51,7 +74,8 @@ class DailyReportsSystem:
                 os.system('cls' if os.name == 'nt' else 'clear')
                 print("🚀 Processing Daily Stockout Report...")
                 try:
-                    results = process_stockout_report()
+                    from report_workflows.daily.daily_stockout import process_stockout_report
+                    results = process_stockout_report(resume=ask_resume("stockout"))
                     if not results['success']:
                         print(f"❌ Report failed: {results['error']}")
                 except Exception as e:
@@ -82,9 +106,14 @@ class DailyReportsSystem:
                 os.system('cls' if os.name == 'nt' else 'clear')
                 print(f"🚀 Processing Inventory Adjustment Summary ({mode})...")
                 try:
-                    results = process_inventory_adjustment_summary(headless=headless)
+                    from report_workflows.daily.inventory_adjustment import process_inventory_adjustment_summary
+                    results = process_inventory_adjustment_summary(
+                        headless=headless, resume=ask_resume("inventory_adjustment")
+                    )
                     if not results['success']:
                         print(f"❌ Report failed: {results['error']}")
+                    for stage, seconds in results.get('stage_timings', {}).items():
+                        print(f"   ⏱️ {stage}: {seconds:.1f}s")
                 except Exception as e:
                     print(f"❌ Error: {str(e)}")
                 input("\nPress Enter to continue...")
@@ -115,6 +144,7 @@ class DailyReportsSystem:
             "🌐 Run Web Scraper (Headless)",
             "👁️ Run Web Scraper (Visible)",
             "📅 Check Date Logic",
+            "📆 Sweep Date Range",
             "🔙 Back"
         ]
         
@@ -123,7 +153,7 @@ class DailyReportsSystem:
         while True:
             choice = navigator.navigate()
             
-            if choice == -1 or choice == 3:  # Quit or Back
+            if choice == -1 or choice == 4:  # Quit or Back
                 return
             
             elif choice in [0, 1]:  # Run scraper
@@ -133,7 +163,8 @@ class DailyReportsSystem:
                 os.system('cls' if os.name == 'nt' else 'clear')
                 print(f"🚀 Processing Inventory Confirmation Report ({mode})...")
                 try:
-                    process_inventory_confirmation_report(headless=headless)
+                    from report_workflows.daily.inventory_confirmation import process_inventory_confirmation_report
+                    process_inventory_confirmation_report(headless=headless, resume=ask_resume("inventory_confirmation"))
                 except Exception as e:
                     print(f"❌ Error: {str(e)}")
                 input("\nPress Enter to continue...")
@@ -159,10 +190,33 @@ class DailyReportsSystem:
                 print(f"🗓️ Target Date: {target_date.strftime('%Y-%m-%d')}")
                 
                 input("\nPress Enter to continue...")
+            
+            elif choice == 3:  # Sweep Date Range
+                os.system('cls' if os.name == 'nt' else 'clear')
+                print("📆 INVENTORY CONFIRMATION SWEEP")
+                print("=" * 40)
+                start_date = input("Start date (YYYY-MM-DD): ").strip()
+                end_date = input("End date (YYYY-MM-DD): ").strip()
+                per_day = input("One workbook per day? (y/N): ").strip().lower() == 'y'
+                try:
+                    from report_workflows.daily.inventory_confirmation import process_inventory_confirmation_sweep
+                    results = process_inventory_confirmation_sweep(start_date, end_date, headless=True, combined=not per_day)
+                    if results['success']:
+                        print(f"📈 {results['routes_processed']} routes, {results['routes_per_minute']:.1f} routes/min")
+                    else:
+                        print(f"❌ Sweep failed: {results['error']}")
+                except ValueError:
+                    print("❌ Dates must be in YYYY-MM-DD format")
+                except Exception as e:
+                    print(f"❌ Error: {str(e)}")
+                input("\nPress Enter to continue...")
     
     def process_all_daily_reports(self):
         """Process all daily reports sequentially"""
         os.system('cls' if os.name == 'nt' else 'clear')
+        from report_workflows.daily.daily_stockout import process_stockout_report
+        from report_workflows.daily.inventory_adjustment import process_inventory_adjustment_summary
+        from report_workflows.daily.inventory_confirmation import process_inventory_confirmation_report
         
         reports = [
             ("Daily Stockout Report", lambda: process_stockout_report()),
@@ -216,7 +270,7 @@ class DailyReportsSystem:
         while True:
             choice = navigator.navigate()
             
-            if choice == -1 or choice == 5:  # Quit or Back
+            if choice == -1 or choice == 6:  # Quit or Back
                 return
             
             elif choice == 0:  # Daily Stockout Report
@@ -233,12 +287,19 @@ class DailyReportsSystem:
             
             elif choice == 4:  # Process All Daily Reports (Concurrent)
                 os.system('cls' if os.name == 'nt' else 'clear')
-                print("⚡ CONCURRENT PROCESSING")
-                print("=" * 40)
-                print("🚧 This feature is not yet implemented.")
-                print("📋 It will run all daily reports concurrently for faster processing.")
+                try:
+                    from report_workflows.daily.concurrent_daily import process_all_daily_reports_concurrent
+                    results = process_all_daily_reports_concurrent(headless=True)
+                    if results['success']:
+                        print("🎉 All reports completed successfully!")
+                except Exception as e:
+                    print(f"❌ Error: {str(e)}")
                 print()
                 input("Press Enter to continue...")
+            
+            elif choice == 5:  # Profiling switch (applies to the reports run next)
+                set_profiling(not is_profiling_enabled())
+                self.main_options[5] = self.get_profiling_label()
 
 def main():
     """Entry point for daily reports system"""
@@ -0,0 +1,145 @@
+"""
+Report Registry
+===============
+
+Every report the command-line runner can start, with the workflow function
+behind it and the options it accepts. Workflow modules are only imported
+when their report runs, so `--list` and usage errors stay fast.
+"""
+
+import importlib
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+class ReportEntry:
+    """One runnable report"""
+
+    def __init__(self, name: str, title: str, group: str, module: str, function: str,
+                 options: Optional[Dict[str, str]] = None, status_function: Optional[str] = None,
+                 resources: Tuple[str, ...] = (), template: Optional[str] = None):
+        """
+        Initialize report entry
+
+        Args:
+            name: Command-line name (e.g. "stockout")
+            title: Display title
+            group: "daily", "weekly" or "sweep" (run by name only)
+            module: Workflow module path
+            function: Workflow function returning a results dict
+            options: Runner option -> workflow keyword argument (date, output_directory, headless, resume)
+            status_function: Function returning {'ready_for_processing': bool}, checked before running
+            resources: What the report connects to ("db", "seed"), for pre-warming
+            template: Excel template the report fills in
+        """
+        self.name = name
+        self.title = title
+        self.group = group
+        self.module = module
+        self.function = function
+        self.options = options or {}
+        self.status_function = status_function
+        self.resources = resources
+        self.template = template
+
+    def _load(self, function_name: str) -> Callable:
+        return getattr(importlib.import_module(self.module), function_name)
+
+    def accepts(self, option: str) -> bool:
+        """Check whether the workflow takes a runner option"""
+        return option in self.options
+
+    def is_ready(self) -> bool:
+        """Ask the workflow whether it can run (True when it has no status check)"""
+        if not self.status_function:
+            return True
+        return bool(self._load(self.status_function)().get('ready_for_processing'))
+
+    def run(self, **options) -> Dict[str, Any]:
+        """
+        Run the workflow with the options it accepts
+
+        Args:
+            **options: Runner options; None values and options the workflow does not take are dropped
+
+        Returns:
+            dict: The workflow's results dictionary
+        """
+        kwargs = {self.options[option]: value for option, value in options.items()
+                  if value is not None and option in self.options}
+        return self._load(self.function)(**kwargs)
+
+_DAILY = "report_workflows.daily"
+_WEEKLY = "report_workflows.weekly"
+_WEEKLY_OPTIONS = {'date': 'week_ending', 'output_directory': 'output_directory'}
+
+REPORTS: Dict[str, ReportEntry] = {entry.name: entry for entry in [
+    ReportEntry("stockout", "Daily Stockout Report", "daily",
+                f"{_DAILY}.daily_stockout", "process_stockout_report",
+                {'output_directory': 'output_directory', 'resume': 'resume'},
+                resources=("db",), template="templates/Daily Stockout Report.xlsx"),
+    ReportEntry("inventory_adjustment", "Inventory Adjustment Summary", "daily",
+                f"{_DAILY}.inventory_adjustment", "process_inventory_adjustment_summary",
+                {'output_directory': 'output_directory', 'headless': 'headless', 'resume': 'resume'},
+                resources=("seed",), template="templates/Inventory Adjustment Summary.xlsx"),
+    ReportEntry("inventory_confirmation", "Inventory Confirmation Report", "daily",
+                f"{_DAILY}.inventory_confirmation", "process_inventory_confirmation_report",
+                {'date': 'target_date', 'output_directory': 'output_directory', 'headless': 'headless',
+                 'resume': 'resume'},
+                resources=("seed",), template="templates/Daily Inventory Confirmation.xlsx"),
+    ReportEntry("inventory_confirmation_sweep", "Inventory Confirmation Sweep", "sweep",
+                f"{_DAILY}.inventory_confirmation", "process_inventory_confirmation_sweep",
+                {'date': 'start_date', 'end_date': 'end_date', 'output_directory': 'output_directory',
+                 'headless': 'headless'},
+                resources=("seed",), template="templates/Daily Inventory Confirmation.xlsx"),
+    ReportEntry("weekly_sales", "Weekly Sales Report", "weekly",
+                f"{_WEEKLY}.weekly_sales", "process_weekly_sales_report",
+                _WEEKLY_OPTIONS, status_function="get_weekly_sales_status"),
+    ReportEntry("ocs_in_full", "OCS in Full Report", "weekly",
+                f"{_WEEKLY}.ocs_in_full", "process_ocs_in_full_report",
+                _WEEKLY_OPTIONS, status_function="get_ocs_in_full_status", resources=("db",)),
+    ReportEntry("market_inventory", "Market Inventory Report", "weekly",
+                f"{_WEEKLY}.market_inventory", "process_market_inventory_report",
+                _WEEKLY_OPTIONS, status_function="get_market_inventory_status"),
+    ReportEntry("warehouse_inventory", "Warehouse Inventory Report", "weekly",
+                f"{_WEEKLY}.warehouse_inventory", "process_warehouse_inventory_report",
+                _WEEKLY_OPTIONS, status_function="get_warehouse_inventory_status", resources=("db",)),
+    ReportEntry("spoilage_shrink", "Spoilage/Shrink Report", "weekly",
+                f"{_WEEKLY}.spoilage_shrink", "process_spoilage_shrink_report",
+                _WEEKLY_OPTIONS, status_function="get_spoilage_shrink_status"),
+    ReportEntry("fresh_food_tracker", "Fresh Food Tracker Report", "weekly",
+                f"{_WEEKLY}.fresh_food_tracker", "process_fresh_food_tracker_report",
+                _WEEKLY_OPTIONS, status_function="get_fresh_food_tracker_status"),
+    ReportEntry("oos_tracker", "OOS Tracker Report", "weekly",
+                f"{_WEEKLY}.oos_tracker", "process_oos_tracker_report",
+                _WEEKLY_OPTIONS, status_function="get_oos_tracker_status", resources=("db",)),
+]}
+
+# The sweep only runs when asked for by name
+GROUPS: Dict[str, List[str]] = {
+    'daily': [name for name, entry in REPORTS.items() if entry.group == "daily"],
+    'weekly': [name for name, entry in REPORTS.items() if entry.group == "weekly"],
+}
+GROUPS['all'] = GROUPS['daily'] + GROUPS['weekly']
+
+def resolve_reports(names: List[str]) -> List[ReportEntry]:
+    """
+    Expand report and group names into report entries
+
+    Args:
+        names: Report names and/or group names, in run order
+
+    Returns:
+        list: ReportEntry objects without duplicates
+
+    Raises:
+        KeyError: For an unknown name
+    """
+    entries = []
+    for name in names:
+        if name in GROUPS:
+            expanded = GROUPS[name]
+        elif name in REPORTS:
+            expanded = [name]
+        else:
+            raise KeyError(name)
+        entries.extend(REPORTS[report] for report in expanded if REPORTS[report] not in entries)
+    return entries
@@ -3,6 +3,8 @@ Weekly Reports System - Expandable Menu with Sub-navigation
 ==========================================================
 
 Comprehensive weekly reports system with individual workflows.
+Every weekly report runs on the report spec engine
+(report_workflows/weekly/report_engine.py).
 """
 
 import sys
@@ -12,6 +14,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.menu_navigator import MenuNavigator
+from reports.report_registry import REPORTS, GROUPS
 
 class WeeklyReportsSystem:
     """Weekly reports menu system with sub-navigation for each report"""
@@ -28,214 +31,27 @@ class WeeklyReportsSystem:
             "🎯 Process All Weekly Reports",
             "🔙 Back to Main Menu"
         ]
-    
-    def weekly_sales_submenu(self):
-        """Weekly Sales Report sub-menu"""
-        options = [
-            "🔄 Process Report",
-            "📋 Check Configuration", 
-            "🔙 Back"
+        # Registry names of the reports above, in menu order
+        self.report_names = [
+            "weekly_sales", "oos_tracker", "ocs_in_full", "fresh_food_tracker",
+            "market_inventory", "spoilage_shrink", "warehouse_inventory"
         ]
-        
-        navigator = MenuNavigator(options, "Weekly Sales Report")
-        
-        while True:
-            choice = navigator.navigate()
-            
-            if choice == -1 or choice == 2:  # Quit or Back
-                return
-            
-            elif choice == 0:  # Process Report
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("🚀 Processing Weekly Sales Report...")
-                print("📋 This feature will be implemented soon!")
-                print("🔄 Workflow: Download → Process → Excel Generation")
-                input("\nPress Enter to continue...")
-            
-            elif choice == 1:  # Check Configuration
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("📋 WEEKLY SALES CONFIGURATION")
-                print("=" * 40)
-                print("📊 Report Type: Weekly Sales Analysis")
-                print("📥 Data Sources: SEED API + Database")
-                print("📄 Excel Template: To be configured")
-                print("🔄 Status: Ready for implementation")
-                input("\nPress Enter to continue...")
     
-    def oos_tracker_submenu(self):
-        """OOS Tracker Report sub-menu"""
-        options = [
-            "🔄 Process Report",
-            "📋 Check Configuration",
-            "🔙 Back"
-        ]
-        
-        navigator = MenuNavigator(options, "OOS Tracker Report")
-        
-        while True:
-            choice = navigator.navigate()
-            
-            if choice == -1 or choice == 2:  # Quit or Back
-                return
-            
-            elif choice == 0:  # Process Report
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("🚀 Processing OOS Tracker Report...")
-                print("📋 This feature will be implemented soon!")
-                print("🔄 Workflow: Download → Analysis → Excel Generation")
-                input("\nPress Enter to continue...")
-            
-            elif choice == 1:  # Check Configuration
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("📋 OOS TRACKER CONFIGURATION")
-                print("=" * 40)
-                print("📊 Report Type: Out of Stock Tracking")
-                print("📥 Data Sources: SEED API + Database")
-                print("📄 Excel Template: To be configured")
-                print("🔄 Status: Ready for implementation")
-                input("\nPress Enter to continue...")
-    
-    def ocs_in_full_submenu(self):
-        """OCS in Full Report sub-menu"""
-        options = [
-            "🔄 Process Report",
-            "📋 Check Configuration",
-            "🔙 Back"
-        ]
-        
-        navigator = MenuNavigator(options, "OCS in Full Report")
-        
-        while True:
-            choice = navigator.navigate()
-            
-            if choice == -1 or choice == 2:  # Quit or Back
-                return
-            
-            elif choice == 0:  # Process Report
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("🚀 Processing OCS in Full Report...")
-                print("📋 This feature will be implemented soon!")
-                print("🔄 Workflow: Download → OCS Analysis → Excel Generation")
-                input("\nPress Enter to continue...")
-            
-            elif choice == 1:  # Check Configuration
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("📋 OCS IN FULL CONFIGURATION")
-                print("=" * 40)
-                print("📊 Report Type: Office Coffee Service Analysis")
-                print("📥 Data Sources: SEED API + Database")
-                print("📄 Excel Template: To be configured")
-                print("🔄 Status: Ready for implementation")
-                input("\nPress Enter to continue...")
-    
-    def fresh_food_tracker_submenu(self):
-        """Fresh Food Tracker Report sub-menu"""
-        options = [
-            "🔄 Process Report",
-            "📋 Check Configuration",
-            "🔙 Back"
-        ]
-        
-        navigator = MenuNavigator(options, "Fresh Food Tracker Report")
-        
-        while True:
-            choice = navigator.navigate()
-            
-            if choice == -1 or choice == 2:  # Quit or Back
-                return
-            
-            elif choice == 0:  # Process Report
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("🚀 Processing Fresh Food Tracker Report...")
-                print("📋 This feature will be implemented soon!")
-                print("🔄 Workflow: Download → Fresh Food Analysis → Excel Generation")
-                input("\nPress Enter to continue...")
-            
-            elif choice == 1:  # Check Configuration
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("📋 FRESH FOOD TRACKER CONFIGURATION")
-                print("=" * 40)
-                print("📊 Report Type: Fresh Food Inventory & Sales")
-                print("📥 Data Sources: SEED API + Database")
-                print("📄 Excel Template: To be configured")
-                print("🔄 Status: Ready for implementation")
-                input("\nPress Enter to continue...")
-    
-    def market_inventory_submenu(self):
-        """Market Inventory Report sub-menu"""
-        options = [
-            "🔄 Process Report",
-            "📋 Check Configuration",
-            "🔙 Back"
-        ]
-        
-        navigator = MenuNavigator(options, "Market Inventory Report")
-        
-        while True:
-            choice = navigator.navigate()
-            
-            if choice == -1 or choice == 2:  # Quit or Back
-                return
-            
-            elif choice == 0:  # Process Report
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("🚀 Processing Market Inventory Report...")
-                print("📋 This feature will be implemented soon!")
-                print("🔄 Workflow: Download → Inventory Analysis → Excel Generation")
-                input("\nPress Enter to continue...")
-            
-            elif choice == 1:  # Check Configuration
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("📋 MARKET INVENTORY CONFIGURATION")
-                print("=" * 40)
-                print("📊 Report Type: Market-level Inventory Analysis")
-                print("📥 Data Sources: SEED API + Database")
-                print("📄 Excel Template: To be configured")
-                print("🔄 Status: Ready for implementation")
-                input("\nPress Enter to continue...")
-    
-    def spoilage_shrink_submenu(self):
-        """Spoilage/Shrink Report sub-menu"""
-        options = [
-            "🔄 Process Report",
-            "📋 Check Configuration",
-            "🔙 Back"
-        ]
-        
-        navigator = MenuNavigator(options, "Spoilage/Shrink Report")
-        
-        while True:
-            choice = navigator.navigate()
-            
-            if choice == -1 or choice == 2:  # Quit or Back
-                return
-            
-            elif choice == 0:  # Process Report
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("🚀 Processing Spoilage/Shrink Report...")
-                print("📋 This feature will be implemented soon!")
-                print("🔄 Workflow: Download → Shrink Analysis → Excel Generation")
-                input("\nPress Enter to continue...")
-            
-            elif choice == 1:  # Check Configuration
-                os.system('cls' if os.name == 'nt' else 'clear')
-                print("📋 SPOILAGE/SHRINK CONFIGURATION")
-                print("=" * 40)
-                print("📊 Report Type: Product Shrink & Spoilage Tracking")
-                print("📥 Data Sources: SEED API + Database")
-                print("📄 Excel Template: To be configured")
-                print("🔄 Status: Ready for implementation")
-                input("\nPress Enter to continue...")
-    
-    def warehouse_inventory_submenu(self):
-        """Warehouse Inventory Report sub-menu"""
+    def report_submenu(self, report_name):
+        """
+        Process/configuration sub-menu of one weekly report
+
+        Args:
+            report_name: Report name in reports/report_registry.py
+        """
+        entry = REPORTS[report_name]
         options = [
             "🔄 Process Report",
             "📋 Check Configuration",
             "🔙 Back"
         ]
         
-        navigator = MenuNavigator(options, "Warehouse Inventory Report")
+        navigator = MenuNavigator(options, entry.title)
         
         while True:
             choice = navigator.navigate()
@@ -245,42 +61,63 @@ class WeeklyReportsSystem:
             
             elif choice == 0:  # Process Report
                 os.system('cls' if os.name == 'nt' else 'clear')
-                print("🚀 Processing Warehouse Inventory Report...")
-                print("📋 This feature will be implemented soon!")
-                print("🔄 Workflow: Download → Warehouse Analysis → Excel Generation")
+                print(f"🚀 Processing {entry.title}...")
+                print("=" * 50)
+                
+                try:
+                    results = entry.run()
+                    if results['success']:
+                        print(f"\n✅ {entry.title} completed")
+                        print(f"📁 File: {results['output_path']}")
+                        for sheet, rows in results['data_summary'].items():
+                            print(f"   • {sheet}: {rows} rows")
+                    else:
+                        print(f"\n❌ Failed: {results.get('error', 'Unknown error')}")
+                except Exception as e:
+                    print(f"\n❌ Error: {str(e)}")
+                
                 input("\nPress Enter to continue...")
             
             elif choice == 1:  # Check Configuration
                 os.system('cls' if os.name == 'nt' else 'clear')
-                print("📋 WAREHOUSE INVENTORY CONFIGURATION")
+                from report_workflows.weekly.report_engine import load_weekly_specs, get_report_spec_status
+                status = get_report_spec_status(load_weekly_specs([report_name])[0])
+                print(f"📋 {entry.title.upper()} CONFIGURATION")
                 print("=" * 40)
-                print("📊 Report Type: Warehouse Inventory Management")
-                print("📥 Data Sources: SEED API + Database")
-                print("📄 Excel Template: To be configured")
-                print("🔄 Status: Ready for implementation")
+                print(f"📥 Data Sources: {', '.join(status['sources'])}")
+                print(f"📄 Sheets: {', '.join(status['sheets'])}")
+                print(f"📄 Excel Template: {status['template']}")
+                print(f"🔄 Status: {status['status']}")
                 input("\nPress Enter to continue...")
     
     def process_all_weekly_reports(self):
-        """Process all weekly reports"""
+        """Process all weekly reports (sources shared between reports are fetched once)"""
         os.system('cls' if os.name == 'nt' else 'clear')
         print("🎯 PROCESSING ALL WEEKLY REPORTS")
         print("=" * 50)
         print("This will process:")
-        print("  • Weekly Sales")
-        print("  • OOS Tracker")
-        print("  • OCS in Full")
-        print("  • Fresh Food Tracker")
-        print("  • Market Inventory")
-        print("  • Spoilage/Shrink")
-        print("  • Warehouse Inventory")
+        for name in GROUPS['weekly']:
+            print(f"  • {REPORTS[name].title}")
         print()
         
         confirm = input("Continue? (y/n): ").lower()
         if confirm != 'y':
             return
         
-        print("\n📋 Individual report processing will be implemented when each report is ready.")
-        print("⚠️ Currently, each report is a skeleton waiting for implementation.")
+        try:
+            from report_workflows.weekly.report_engine import process_all_weekly_reports
+            results = process_all_weekly_reports()
+            if results.get('reports'):
+                print()
+                for name, report in results['reports'].items():
+                    if report['success']:
+                        print(f"✅ {REPORTS[name].title}: {report['output_path']}")
+                    else:
+                        print(f"❌ {REPORTS[name].title}: {report['error']}")
+            elif not results['success']:
+                print(f"\n❌ Failed: {results.get('error', 'Unknown error')}")
+        except Exception as e:
+            print(f"\n❌ Error: {str(e)}")
         
         input("\nPress Enter to continue...")
     
@@ -294,26 +131,8 @@ class WeeklyReportsSystem:
             if choice == -1 or choice == 8:  # Quit or Back
                 return
             
-            elif choice == 0:  # Weekly Sales
-                self.weekly_sales_submenu()
-            
-            elif choice == 1:  # OOS Tracker
-                self.oos_tracker_submenu()
-            
-            elif choice == 2:  # OCS in Full
-                self.ocs_in_full_submenu()
-            
-            elif choice == 3:  # Fresh Food Tracker
-                self.fresh_food_tracker_submenu()
-            
-            elif choice == 4:  # Market Inventory
-                self.market_inventory_submenu()
-            
-            elif choice == 5:  # Spoilage/Shrink
-                self.spoilage_shrink_submenu()
-            
-            elif choice == 6:  # Warehouse Inventory
-                self.warehouse_inventory_submenu()
+            elif 0 <= choice < len(self.report_names):
+                self.report_submenu(self.report_names[choice])
             
             elif choice == 7:  # Process All Weekly Reports
                 self.process_all_weekly_reports()
@@ -0,0 +1,78 @@
+"""
+Tests for the weekly report engine: in-memory source frames through a
+spec's transforms into its workbook (no SEED or database connection)
+"""
+
+import asyncio
+import pandas as pd
+from openpyxl import load_workbook
+
+from report_workflows.weekly import report_engine
+from report_workflows.weekly.weekly_sales import SPEC as WEEKLY_SALES_SPEC
+
+WEEK_ENDING = "2026-10-10"
+
+SOURCE_FRAMES = {
+    "Weekly Sales Reporting Market": pd.DataFrame({
+        " Location ": ["Lobby", "Gym", None],
+        "Units": [10, 5, None],
+        "Sales": [25.0, 12.5, None]
+    }),
+    "Weekly Sales Reporting Delivery": pd.DataFrame({
+        "Customer": ["Acme", "Globex"],
+        "Units": [3, 4],
+        "Sales": [9.0, 11.0]
+    })
+}
+
+
+def _load_seed_source(source, week, use_cache):
+    assert week["week_end"] == WEEK_ENDING
+    return SOURCE_FRAMES[source.report_name]
+
+
+def _run(specs, output_directory):
+    return asyncio.run(report_engine.run_report_specs_async(
+        specs, WEEK_ENDING, str(output_directory), use_cache=False
+    ))
+
+
+def test_weekly_sales_is_ready():
+    assert WEEKLY_SALES_SPEC.get_problems() == []
+
+
+def test_weekly_sales_transforms_and_renders(monkeypatch, tmp_path):
+    # Run history and run directories use relative paths; keep them in tmp_path
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(report_engine, "_load_seed_source", _load_seed_source)
+
+    results = _run([WEEKLY_SALES_SPEC], tmp_path / "out")
+
+    assert results["success"], results
+    report = results["reports"]["weekly_sales"]
+    assert report["data_summary"] == {"Summary": 2, "Market": 2, "Delivery": 2}
+
+    workbook = load_workbook(report["output_path"], read_only=True)
+    assert workbook.sheetnames == ["Summary", "Market", "Delivery"]
+
+    summary = list(workbook["Summary"].iter_rows(values_only=True))
+    assert summary[0] == ("Measure", "Market", "Delivery")
+    assert summary[1:] == [("Units", 15, 7), ("Sales", 37.5, 20)]
+
+    market = list(workbook["Market"].iter_rows(values_only=True))
+    assert market == [("Location", "Units", "Sales"), ("Lobby", 10, 25), ("Gym", 5, 12.5)]
+    workbook.close()
+
+
+def test_failed_source_fails_its_report(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+    def failing_source(source, week, use_cache):
+        raise Exception("SEED is down")
+    monkeypatch.setattr(report_engine, "_load_seed_source", failing_source)
+
+    results = _run([WEEKLY_SALES_SPEC], tmp_path / "out")
+
+    assert not results["success"]
+    assert "SEED is down" in results["reports"]["weekly_sales"]["error"]
+    assert results["output_paths"] == {}
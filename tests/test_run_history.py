@@ -0,0 +1,28 @@
+"""
+Tests for the nearest-rank percentile used by the Performance History view
+"""
+
+from utils.run_history import percentile
+
+
+def test_percentile_empty():
+    assert percentile([], 50) is None
+
+
+def test_percentile_odd_length():
+    assert percentile([1, 2, 3, 4, 5], 50) == 3
+    assert percentile([1, 2, 3, 4, 5], 95) == 5
+    assert percentile(list(range(1, 10)), 50) == 5
+    assert percentile(list(range(1, 14)), 50) == 7
+    assert percentile(list(range(1, 14)), 95) == 13
+
+
+def test_percentile_even_length():
+    assert percentile([1, 2, 3, 4], 50) == 2
+    assert percentile([1, 2, 3, 4], 95) == 4
+    assert percentile(list(range(1, 21)), 50) == 10
+    assert percentile(list(range(1, 21)), 95) == 19
+
+
+def test_percentile_unsorted_input():
+    assert percentile([5, 1, 4, 2, 3], 50) == 3
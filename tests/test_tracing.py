@@ -0,0 +1,57 @@
+"""
+Tests for finding the run trace from threads and overlapping runs
+"""
+
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import tracing
+from utils.tracing import current_trace, set_current_trace, start_trace, finish_trace
+
+
+def _in_new_thread(function):
+    """Run function on a fresh thread (which starts with an empty context)"""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(function()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+def test_single_run_is_found_without_its_context(monkeypatch, tmp_path):
+    monkeypatch.setattr(tracing, "_enabled", True)
+    trace = start_trace("one")
+    try:
+        assert _in_new_thread(current_trace) is trace
+    finally:
+        finish_trace(trace, str(tmp_path))
+
+
+def test_overlapping_runs_are_not_guessed(monkeypatch, tmp_path):
+    monkeypatch.setattr(tracing, "_enabled", True)
+    first_context = contextvars.copy_context()
+    first = first_context.run(start_trace, "first")
+    second = start_trace("second")
+    try:
+        assert _in_new_thread(current_trace) is None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(contextvars.copy_context().run, current_trace).result() is second
+            assert executor.submit(first_context.copy().run, current_trace).result() is first
+    finally:
+        finish_trace(second, str(tmp_path))
+        first_context.run(finish_trace, first, str(tmp_path))
+
+
+def test_set_current_trace_carries_a_trace_across(monkeypatch, tmp_path):
+    monkeypatch.setattr(tracing, "_enabled", True)
+    first = contextvars.copy_context().run(start_trace, "first")
+    second = start_trace("second")
+    try:
+        def carried():
+            set_current_trace(first)
+            return current_trace()
+        assert _in_new_thread(carried) is first
+    finally:
+        finish_trace(second, str(tmp_path))
+        finish_trace(first, str(tmp_path))
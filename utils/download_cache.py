@@ -0,0 +1,244 @@
+"""
+SEED Download Cache
+===================
+
+Content-addressed cache for SEED report downloads.
+Entries are keyed by report ID and business date, bytes are stored by SHA-256.
+Past business dates are kept permanently, today's reports use a short TTL.
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+from datetime import datetime
+from config.report_config import SEED_REPORTS, DOWNLOAD_PATHS, DOWNLOAD_CACHE_TTL
+from utils.file_io import write_atomic
+
+# Seconds to wait for another process that is already downloading the same key
+LOCK_WAIT_SECONDS = 120
+LOCK_STALE_SECONDS = 300
+
+_key_locks = {}
+_key_locks_guard = threading.Lock()
+
+def _get_key_lock(key):
+    """Get the in-process lock for a cache key (single download per key)"""
+    with _key_locks_guard:
+        if key not in _key_locks:
+            _key_locks[key] = threading.Lock()
+        return _key_locks[key]
+
+class DownloadCache:
+    """
+    Content-addressed store for downloaded report bytes
+    """
+
+    def __init__(self, cache_directory=None, ttl_settings=None):
+        """
+        Initialize the download cache
+
+        Args:
+            cache_directory (str): Root directory of the cache
+            ttl_settings (dict): TTL in seconds per report name, plus "default"
+        """
+        self.cache_directory = cache_directory or DOWNLOAD_PATHS["cache"]
+        self.ttl_settings = ttl_settings or DOWNLOAD_CACHE_TTL
+        self.objects_directory = os.path.join(self.cache_directory, "objects")
+        self.index_directory = os.path.join(self.cache_directory, "index")
+        self.report_names = {report_id: name for name, report_id in SEED_REPORTS.items()}
+
+    def make_key(self, report_id, business_date):
+        """Build the cache key for a report and business date (YYYY-MM-DD)"""
+        return f"{report_id}_{business_date}"
+
+    def get_ttl(self, report_id, business_date):
+        """
+        Get the freshness window for a report
+
+        Args:
+            report_id (str): SEED report ID
+            business_date (str): Business date in YYYY-MM-DD format
+
+        Returns:
+            int or None: TTL in seconds, None if the entry never expires
+        """
+        if business_date < datetime.now().strftime("%Y-%m-%d"):
+            return None
+        report_name = self.report_names.get(str(report_id))
+        # Without a "default" entry unlisted reports are always refetched for open dates
+        return self.ttl_settings.get(report_name, self.ttl_settings.get("default", 0))
+
+    def _index_path(self, key):
+        return os.path.join(self.index_directory, f"{key}.json")
+
+    def _object_path(self, content_hash):
+        return os.path.join(self.objects_directory, content_hash[:2], content_hash)
+
+    def lookup(self, report_id, business_date):
+        """
+        Find a fresh cached copy of a report
+
+        Args:
+            report_id (str): SEED report ID
+            business_date (str): Business date in YYYY-MM-DD format
+
+        Returns:
+            str or None: Path to cached bytes, None on miss or expired entry
+        """
+        index_path = self._index_path(self.make_key(report_id, business_date))
+        try:
+            with open(index_path, 'r') as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        ttl = self.get_ttl(report_id, business_date)
+        if ttl is not None and time.time() - entry['fetched_at'] > ttl:
+            return None
+
+        object_path = self._object_path(entry['sha256'])
+        if not os.path.exists(object_path):
+            return None
+        return object_path
+
+    def store(self, report_id, business_date, content):
+        """
+        Store downloaded bytes and point the report/date key at them
+
+        Args:
+            report_id (str): SEED report ID
+            business_date (str): Business date in YYYY-MM-DD format
+            content (bytes): Downloaded report bytes
+
+        Returns:
+            str: Path to cached bytes
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(content_hash)
+        if not os.path.exists(object_path):
+            write_atomic(object_path, content)
+
+        entry = {
+            'report_id': str(report_id),
+            'business_date': business_date,
+            'sha256': content_hash,
+            'size': len(content),
+            'fetched_at': time.time()
+        }
+        write_atomic(self._index_path(self.make_key(report_id, business_date)), json.dumps(entry).encode())
+        return object_path
+
+    def materialize(self, object_path, target_path):
+        """Copy cached bytes to the path a workflow expects"""
+        target_directory = os.path.dirname(target_path)
+        if target_directory:
+            os.makedirs(target_directory, exist_ok=True)
+        shutil.copyfile(object_path, target_path)
+        return target_path
+
+    def get_or_fetch(self, report_id, business_date, fetch_function):
+        """
+        Return cached bytes for a report, downloading them at most once
+
+        Concurrent callers in this process share one download per key; other
+        processes wait on a lock file while the first one downloads.
+
+        Args:
+            report_id (str): SEED report ID
+            business_date (str): Business date in YYYY-MM-DD format
+            fetch_function (callable): Returns report bytes, raises on failure
+
+        Returns:
+            tuple: (object_path, cache_hit)
+        """
+        cached_path = self.lookup(report_id, business_date)
+        if cached_path:
+            return cached_path, True
+
+        key = self.make_key(report_id, business_date)
+        with _get_key_lock(key):
+            cached_path = self.lookup(report_id, business_date)
+            if cached_path:
+                return cached_path, True
+
+            lock_path = os.path.join(self.index_directory, f"{key}.lock")
+            locked = self._acquire_file_lock(lock_path)
+            try:
+                # Another process may have finished the download while we waited
+                cached_path = self.lookup(report_id, business_date)
+                if cached_path:
+                    return cached_path, True
+                content = fetch_function()
+                return self.store(report_id, business_date, content), False
+            finally:
+                if locked:
+                    self._release_file_lock(lock_path)
+
+    def _acquire_file_lock(self, lock_path):
+        """
+        Acquire a cross-process lock file
+
+        Returns:
+            bool: True if the lock is held, False if waiting timed out
+        """
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        deadline = time.time() + LOCK_WAIT_SECONDS
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.close(fd)
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(lock_path) > LOCK_STALE_SECONDS:
+                        os.remove(lock_path)
+                        continue
+                except OSError:
+                    continue
+                if time.time() > deadline:
+                    # Give up on the other process and download ourselves
+                    return False
+                time.sleep(0.5)
+
+    def _release_file_lock(self, lock_path):
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+    def prune_expired(self):
+        """
+        Remove expired index entries and unreferenced objects
+
+        Returns:
+            int: Number of removed files
+        """
+        removed = 0
+        referenced = set()
+        if os.path.isdir(self.index_directory):
+            for name in os.listdir(self.index_directory):
+                if not name.endswith(".json"):
+                    continue
+                index_path = os.path.join(self.index_directory, name)
+                try:
+                    with open(index_path, 'r') as file:
+                        entry = json.load(file)
+                except (OSError, ValueError):
+                    continue
+                ttl = self.get_ttl(entry['report_id'], entry['business_date'])
+                if ttl is not None and time.time() - entry['fetched_at'] > ttl:
+                    os.remove(index_path)
+                    removed += 1
+                else:
+                    referenced.add(entry['sha256'])
+
+        if os.path.isdir(self.objects_directory):
+            for root, _, files in os.walk(self.objects_directory):
+                for name in files:
+                    if name not in referenced:
+                        os.remove(os.path.join(root, name))
+                        removed += 1
+        return removed
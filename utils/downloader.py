@@ -11,7 +11,10 @@ from base64 import b64encode
 import os
 import asyncio
 from dotenv import load_dotenv
-from config.report_config import SEED_API_HOST, SEED_API_ENDPOINT
+from config.report_config import SEED_API_HOST, SEED_API_ENDPOINT, PRODUCT_LIST_DOWNLOAD_MODE
+from utils.download_cache import DownloadCache
+from utils.seed_http import SeedHttpClient, SeedSessionExpired
+from utils.tracing import span, traced, annotate
 
 load_dotenv()
 
@@ -23,40 +26,149 @@ def get_seed_credentials():
         raise ValueError("SEED_USERNAME and SEED_PASSWORD must be set in .env file")
     return username, password
 
-def download_seed_report(report_id, filename, download_path=""):
-    """Download report from SEED API"""
-    full_path = os.path.join(download_path, filename) if download_path else filename
+def _fetch_seed_report_bytes(report_id):
+    """Fetch raw report bytes from the SEED API (raises on failure)"""
     username, password = get_seed_credentials()
     
     # Basic auth header
     credentials = f"{username}:{password}"
     auth_header = "Basic " + b64encode(credentials.encode()).decode()
     
-    try:
+    with span("http.seed_report", report_id=report_id) as current:
         response = requests.get(
             f"{SEED_API_HOST}{SEED_API_ENDPOINT}?ReportId={report_id}",
             headers={'Authorization': auth_header}
         )
+        current.set(status=response.status_code, bytes=len(response.content))
+    
+    if response.status_code != 200:
+        raise Exception(f"Status code: {response.status_code}")
+    return response.content
+
+@traced("download.seed_report")
+def download_seed_report(report_id, filename, download_path="", business_date=None, use_cache=True):
+    """
+    Download report from SEED API
+    
+    Args:
+        report_id (str): SEED report ID
+        filename (str): Output filename
+        download_path (str): Output directory
+        business_date (str): Business date (YYYY-MM-DD) the report covers; enables the download cache
+        use_cache (bool): Reuse cached bytes for the same report and business date
         
-        if response.status_code == 200:
-            if download_path:
-                os.makedirs(download_path, exist_ok=True)
-            
-            with open(full_path, 'wb') as file:
-                file.write(response.content)
-            return {"success": True, "filename": filename, "path": full_path}
-        else:
-            return {"success": False, "error": f"Status code: {response.status_code}"}
+    Returns:
+        dict: Result with success status, path and whether the cache was hit
+    """
+    full_path = os.path.join(download_path, filename) if download_path else filename
+    
+    try:
+        if download_path:
+            os.makedirs(download_path, exist_ok=True)
+        
+        if use_cache and business_date:
+            cache = DownloadCache()
+            object_path, cache_hit = cache.get_or_fetch(
+                report_id, business_date, lambda: _fetch_seed_report_bytes(report_id)
+            )
+            cache.materialize(object_path, full_path)
+            annotate(report_id=report_id, cached=cache_hit)
+            if cache_hit:
+                print(f"♻️ Using cached report {report_id} for {business_date}")
+            return {"success": True, "filename": filename, "path": full_path, "cached": cache_hit}
+        
+        content = _fetch_seed_report_bytes(report_id)
+        with open(full_path, 'wb') as file:
+            file.write(content)
+        return {"success": True, "filename": filename, "path": full_path, "cached": False}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
-async def download_items_async(temp_directory="downloads/temp", headless=True):
+@traced("browser.refresh_session")
+async def refresh_seed_session(headless=True, force_login=False, pool=None):
+    """
+    Make sure a valid SEED session is saved, logging in through the browser if needed
+    
+    Args:
+        headless (bool): Run browser in headless mode
+        force_login (bool): Ignore the saved session (e.g. after SEED rejected it)
+        pool (BrowserPool): Optional warm browser pool to log in with
+    """
+    from web_automation.seed_browser import SeedBrowser
+    
+    seed = SeedBrowser(headless=headless, pool=pool)
+    try:
+        if not await seed.setup_and_login(force_login=force_login):
+            raise Exception("Failed to setup browser and login to SEED")
+    finally:
+        await seed.cleanup_browser()
+
+@traced("download.product_list_http")
+async def download_items_http_async(temp_directory="downloads/temp", headless=True, pool=None):
+    """
+    Download items list straight from the export endpoint over HTTP
+    Uses the saved SEED session, logging in through the browser only when it has expired
+    
+    Args:
+        temp_directory (str): Directory to save downloaded file
+        headless (bool): Run browser in headless mode if a login is needed
+        pool (BrowserPool): Optional warm browser pool for that login
+        
+    Returns:
+        str: Path to downloaded file
+    """
+    print("📥 Downloading items list over HTTP...")
+    
+    target_path = os.path.join(temp_directory, "ItemImportExample.xlsx")
+    client = SeedHttpClient.from_session_cache()
+    
+    for attempt in range(2):
+        if not client:
+            await refresh_seed_session(headless, force_login=attempt > 0, pool=pool)
+            client = SeedHttpClient.from_session_cache()
+        
+        try:
+            result = await asyncio.to_thread(client.download_product_list, target_path)
+            print(f"✅ Items list downloaded: {result}")
+            return result
+        except SeedSessionExpired:
+            if attempt == 1:
+                raise
+            print("⚠️ Saved SEED session expired, logging in again...")
+        finally:
+            client.close()
+        client = None
+
+async def download_items_async(temp_directory="downloads/temp", headless=True, mode=PRODUCT_LIST_DOWNLOAD_MODE, pool=None):
+    """
+    Download items list, over HTTP when possible with the browser as fallback
+    
+    Args:
+        temp_directory (str): Directory to save downloaded file
+        headless (bool): Run browser in headless mode
+        mode (str): "http" for the browserless export, "browser" for the export button
+        pool (BrowserPool): Optional warm browser pool instead of launching Firefox
+        
+    Returns:
+        str: Path to downloaded file
+    """
+    if mode == "http":
+        try:
+            return await download_items_http_async(temp_directory, headless, pool)
+        except Exception as e:
+            print(f"⚠️ HTTP export failed ({str(e)}), falling back to browser download")
+    
+    return await download_items_browser_async(temp_directory, headless, pool)
+
+@traced("download.product_list_browser")
+async def download_items_browser_async(temp_directory="downloads/temp", headless=True, pool=None):
     """
     Download items list using async browser automation
     
     Args:
         temp_directory (str): Directory to save downloaded file
         headless (bool): Run browser in headless mode
+        pool (BrowserPool): Optional warm browser pool instead of launching Firefox
         
     Returns:
         str: Path to downloaded file
@@ -68,7 +180,7 @@ async def download_items_async(temp_directory="downloads/temp", headless=True):
     scraper = None
     try:
         # Initialize product scraper
-        scraper = ItemsScraper(headless=headless)
+        scraper = ItemsScraper(headless=headless, pool=pool)
         
         # Setup browser and login
         if not await scraper.setup_and_login():
@@ -87,15 +199,22 @@ async def download_items_async(temp_directory="downloads/temp", headless=True):
         if scraper:
             await scraper.cleanup_browser()
 
-def download_items(temp_directory="downloads/temp", headless=True):
+def download_items(temp_directory="downloads/temp", headless=True, mode=PRODUCT_LIST_DOWNLOAD_MODE):
     """
     Download items list (synchronous wrapper)
+    Runs on the warm browser when it is running and the browser is headless
     
     Args:
         temp_directory (str): Directory to save downloaded file
         headless (bool): Run browser in headless mode
+        mode (str): "http" or "browser"
         
     Returns:
         str: Path to downloaded file
     """
-    return asyncio.run(download_items_async(temp_directory, headless))
\ No newline at end of file
+    from web_automation.browser_daemon import get_warm_browser
+    
+    warm_browser = get_warm_browser()
+    if warm_browser and headless:
+        return warm_browser.run(lambda pool: download_items_async(temp_directory, headless, mode, pool))
+    return asyncio.run(download_items_async(temp_directory, headless, mode))
\ No newline at end of file
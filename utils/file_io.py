@@ -0,0 +1,33 @@
+"""
+File I/O Helpers
+================
+
+Small file helpers shared by the caches, checkpoints and schedulers.
+"""
+
+import os
+import tempfile
+
+def write_atomic(path, data):
+    """
+    Write bytes to path atomically (temp file + rename)
+
+    Readers see the old file or the new one, never a partial write; every
+    writer gets its own temp file, so concurrent writers don't collide.
+
+    Args:
+        path (str): Destination file (its directory is created)
+        data (bytes): File content
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
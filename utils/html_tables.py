@@ -0,0 +1,115 @@
+"""
+HTML Table Parsing
+==================
+
+Parses SEED HTML tables into the same row format as
+SeedBrowser.extract_table_rows() without rendering the page.
+Uses lxml when installed, falling back to the standard library parser.
+"""
+
+from html.parser import HTMLParser
+
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+def parse_table_rows(html):
+    """
+    Parse every table row in an HTML document
+
+    Args:
+        html (str): Page HTML
+
+    Returns:
+        list: Rows as {'cells': [trimmed td text], 'hrefs': [first link href per td or None]}
+    """
+    if not html or not html.strip():
+        return []
+    if HAS_LXML:
+        return _parse_with_lxml(html)
+    parser = _TableRowParser()
+    parser.feed(html)
+    parser.close()
+    return parser.rows
+
+def _parse_with_lxml(html):
+    document = lxml.html.fromstring(html)
+    rows = []
+    for row in document.iter('tr'):
+        cells = []
+        hrefs = []
+        for cell in row.iter('td'):
+            cells.append(cell.text_content().strip())
+            links = cell.xpath('.//a[@href]')
+            hrefs.append(links[0].get('href') if links else None)
+        rows.append({'cells': cells, 'hrefs': hrefs})
+    return rows
+
+class _TableRowParser(HTMLParser):
+    """Standard library fallback collecting td text and hrefs per tr"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self._table_depth = 0
+        self._row_stack = []     # open rows: (row, table depth)
+        self._cell_stack = []    # open cells: [text parts, href, row, index]
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table':
+            self._table_depth += 1
+        elif tag == 'tr':
+            # A new row in the same table implicitly closes the previous one
+            if self._row_stack and self._row_stack[-1][1] == self._table_depth:
+                self._close_row()
+            row = {'cells': [], 'hrefs': []}
+            self.rows.append(row)
+            self._row_stack.append((row, self._table_depth))
+        elif tag == 'td' and self._row_stack:
+            row = self._row_stack[-1][0]
+            # A new cell in the same row implicitly closes the previous one
+            if self._cell_stack and self._cell_stack[-1][2] is row:
+                self._close_cell()
+            self._cell_stack.append([[], None, row, len(row['cells'])])
+            row['cells'].append('')
+            row['hrefs'].append(None)
+        elif tag == 'a':
+            href = dict(attrs).get('href')
+            if href is not None:
+                for cell in self._cell_stack:
+                    if cell[1] is None:
+                        cell[1] = href
+
+    def handle_endtag(self, tag):
+        if tag == 'td':
+            if self._cell_stack and self._row_stack and self._cell_stack[-1][2] is self._row_stack[-1][0]:
+                self._close_cell()
+        elif tag == 'tr':
+            if self._row_stack and self._row_stack[-1][1] == self._table_depth:
+                self._close_row()
+        elif tag == 'table' and self._table_depth:
+            while self._row_stack and self._row_stack[-1][1] == self._table_depth:
+                self._close_row()
+            self._table_depth -= 1
+
+    def handle_data(self, data):
+        # textContent includes text of nested cells, so feed every open cell
+        for cell in self._cell_stack:
+            cell[0].append(data)
+
+    def close(self):
+        super().close()
+        while self._row_stack:
+            self._close_row()
+
+    def _close_row(self):
+        row, _ = self._row_stack.pop()
+        while self._cell_stack and self._cell_stack[-1][2] is row:
+            self._close_cell()
+
+    def _close_cell(self):
+        parts, href, row, index = self._cell_stack.pop()
+        row['cells'][index] = ''.join(parts).strip()
+        row['hrefs'][index] = href
@@ -0,0 +1,129 @@
+"""
+Import Time Measurement
+=======================
+
+Measures how long each module takes to import in a fresh interpreter
+(`python -X importtime`), and which packages account for it, so startup
+regressions are easy to spot.
+
+Usage:
+    python -m utils.import_timer                      # Startup and workflow modules
+    python -m utils.import_timer main reports.daily_reports
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+from typing import Dict, Any, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# What the menu and CLI load at startup, then what each report loads when it runs
+STARTUP_MODULES = [
+    "main",
+    "cli",
+    "reports.daily_reports",
+    "reports.weekly_reports",
+    "config.database_config",
+    "report_workflows.daily.daily_stockout",
+    "report_workflows.daily.inventory_adjustment",
+    "report_workflows.daily.inventory_confirmation",
+    "report_workflows.daily.concurrent_daily",
+]
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """
+    Parse `-X importtime` output
+
+    Args:
+        output: stderr of the interpreter
+
+    Returns:
+        list: {'name', 'depth', 'self', 'cumulative'} per imported module, times in seconds
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        name = parts[2].rstrip()
+        entries.append({
+            'name': name.strip(),
+            'depth': (len(name) - len(name.lstrip())) // 2,
+            'self': int(parts[0]) / 1_000_000,
+            'cumulative': int(parts[1]) / 1_000_000
+        })
+    return entries
+
+def measure_import(module: str, top: int = 5) -> Dict[str, Any]:
+    """
+    Import one module in a fresh interpreter and time it
+
+    Args:
+        module: Dotted module name, importable from the project root
+        top: Number of heaviest packages to report
+
+    Returns:
+        dict: {'module', 'success', 'seconds', 'heaviest': [(package, seconds)], 'error'}
+    """
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120
+        )
+    except subprocess.TimeoutExpired:
+        return {'module': module, 'success': False, 'seconds': None, 'heaviest': [], 'error': 'Timed out'}
+
+    entries = parse_importtime(completed.stderr)
+    # Interpreter startup (site, encodings, ...) finishes before the measured import begins
+    site_positions = [position for position, entry in enumerate(entries) if entry['name'] == "site"]
+    if site_positions:
+        entries = entries[site_positions[-1] + 1:]
+    own_entry = next((entry for entry in entries if entry['name'] == module), None)
+    # Heaviest top-level packages pulled in (pandas, playwright, ...), excluding the project's own
+    project_packages = {name for name in os.listdir(PROJECT_ROOT) if os.path.isdir(os.path.join(PROJECT_ROOT, name))}
+    packages = {}
+    for entry in entries:
+        if "." not in entry['name'] and entry['name'] != module and entry['name'] not in project_packages:
+            packages[entry['name']] = max(packages.get(entry['name'], 0.0), entry['cumulative'])
+    heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+
+    result = {
+        'module': module,
+        'success': completed.returncode == 0,
+        'seconds': own_entry['cumulative'] if own_entry and completed.returncode == 0 else None,
+        'heaviest': heaviest,
+        'error': None
+    }
+    if completed.returncode != 0:
+        errors = [line for line in completed.stderr.splitlines() if line and not line.startswith("import time:")]
+        result['error'] = errors[-1] if errors else f"exit code {completed.returncode}"
+    return result
+
+def print_import_report(results: List[Dict[str, Any]]):
+    """Print one line per module with its heaviest packages"""
+    print("⏱️ IMPORT TIMES (fresh interpreter)")
+    print("=" * 60)
+    for result in results:
+        seconds = f"{result['seconds'] * 1000:8.0f} ms" if result['seconds'] is not None else "     n/a   "
+        status = "✅" if result['success'] else "❌"
+        print(f"{status} {seconds}  {result['module']}")
+        if result['heaviest']:
+            print("      " + ", ".join(f"{name} {value * 1000:.0f} ms" for name, value in result['heaviest']))
+        if result['error']:
+            print(f"      ⚠️ {result['error']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure module import times")
+    parser.add_argument("modules", nargs="*", help="Modules to time (default: startup and workflow modules)")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest packages listed per module")
+    args = parser.parse_args()
+
+    results = [measure_import(module, args.top) for module in args.modules or STARTUP_MODULES]
+    print_import_report(results)
+
+if __name__ == "__main__":
+    main()
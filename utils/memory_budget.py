@@ -0,0 +1,166 @@
+"""
+Memory Budgets
+==============
+
+Per-workflow limits on process memory (MEMORY_BUDGETS_MB). Before a stage
+starts, current RSS plus the growth the stage showed in past runs is
+compared to the budget: near the budget, stages with a chunked mode
+switch to it; over the budget, the run fails early with a report of where
+the memory went instead of pushing the machine into swap.
+
+RSS is measured for the whole process, so while several runs overlap in it
+(--parallel, scheduled jobs) each is held to their combined budget instead
+of its own.
+"""
+
+import threading
+import weakref
+from typing import Dict, Iterable, Optional, Tuple
+from config.report_config import MEMORY_BUDGETS_MB, MEMORY_BUDGET_SETTINGS
+from utils.process_memory import get_process_rss_mb
+
+# Budgets of the runs currently active in this process
+_active_budgets = weakref.WeakSet()
+_active_lock = threading.Lock()
+
+class MemoryBudgetExceeded(Exception):
+    """Raised when a run is over, or about to go over, its memory budget"""
+
+class MemoryBudget:
+    """Memory budget of one workflow run"""
+
+    def __init__(self, workflow: str, limit_mb: Optional[float] = None,
+                 expected_growth: Optional[Dict[str, float]] = None):
+        """
+        Initialize memory budget
+
+        Args:
+            workflow: Workflow name
+            limit_mb: Budget in MB (default: MEMORY_BUDGETS_MB[workflow]; None disables it)
+            expected_growth: Stage -> MB the stage usually adds to RSS (from the run history)
+        """
+        self.workflow = workflow
+        self.limit_mb = limit_mb if limit_mb is not None else MEMORY_BUDGETS_MB.get(workflow)
+        self.expected_growth = expected_growth or {}
+
+    @property
+    def enabled(self) -> bool:
+        """A budget is set and memory can be measured (psutil)"""
+        return self.limit_mb is not None and get_process_rss_mb() is not None
+
+    def activate(self):
+        """Register the run as active, so overlapping runs share one process budget"""
+        with _active_lock:
+            _active_budgets.add(self)
+
+    def release(self):
+        """Unregister the run when it finishes"""
+        with _active_lock:
+            _active_budgets.discard(self)
+
+    def get_limit(self) -> Tuple[Optional[float], int]:
+        """
+        Budget that applies right now
+
+        Alone in the process a run has its own budget; overlapping runs share
+        the sum of theirs, and an overlapping run without a budget disables it.
+
+        Returns:
+            tuple: (limit_mb or None, number of active runs sharing the process)
+        """
+        with _active_lock:
+            others = [budget for budget in _active_budgets if budget is not self]
+        if self.limit_mb is None or not others:
+            return self.limit_mb, len(others) + 1
+        if any(budget.limit_mb is None for budget in others):
+            return None, len(others) + 1
+        return self.limit_mb + sum(budget.limit_mb for budget in others), len(others) + 1
+
+    def get_projection(self, stage: Optional[str] = None) -> Optional[tuple]:
+        """
+        Current RSS, what a stage is expected to add to it and the budget that applies
+
+        Returns:
+            tuple or None: (rss_mb, expected_growth_mb, limit_mb, runs); None without a budget or psutil
+        """
+        limit_mb, runs = self.get_limit()
+        if limit_mb is None:
+            return None
+        rss = get_process_rss_mb()
+        if rss is None:
+            return None
+        return rss, self.expected_growth.get(stage, 0.0) if stage else 0.0, limit_mb, runs
+
+    def _describe_limit(self, limit_mb: float, runs: int) -> str:
+        if runs > 1:
+            return f"{limit_mb:.0f} MB budget shared by {runs} overlapping runs"
+        return f"{limit_mb:.0f} MB budget"
+
+    def is_under_pressure(self, stage: Optional[str] = None) -> bool:
+        """Check whether a stage is expected to end near the budget"""
+        projection = self.get_projection(stage)
+        if projection is None:
+            return False
+        rss, growth, limit_mb, _ = projection
+        return rss + growth >= limit_mb * MEMORY_BUDGET_SETTINGS["pressure_fraction"]
+
+    def get_chunk_rows(self, stage: str) -> Optional[int]:
+        """
+        Rows per write for a stage with a chunked mode
+
+        Returns:
+            int or None: Chunk size when the stage should run chunked, otherwise None
+        """
+        if not self.is_under_pressure(stage):
+            return None
+        rss, growth, limit_mb, runs = self.get_projection(stage)
+        chunk_rows = MEMORY_BUDGET_SETTINGS["chunk_rows"]
+        print(f"🧠 {self.workflow}.{stage}: {rss:.0f} MB + ~{growth:.0f} MB expected is near the "
+              f"{self._describe_limit(limit_mb, runs)} - writing in chunks of {chunk_rows} rows")
+        return chunk_rows
+
+    def check(self, stage: Optional[str] = None, projected: bool = False, stages: Iterable = (),
+              warn_only: bool = False):
+        """
+        Fail when the run is over its budget
+
+        Args:
+            stage: Stage about to start (or just finished)
+            projected: Also fail when the stage's expected growth would exceed the budget
+            stages: StageRecords so far, listed in the report
+            warn_only: Print the summary instead of failing (after a stage, when its work is done)
+
+        Raises:
+            MemoryBudgetExceeded: With a one-line summary; the stage breakdown is printed
+        """
+        projection = self.get_projection(stage)
+        if projection is None:
+            return
+        rss, growth, limit_mb, runs = projection
+        if not projected:
+            growth = 0.0
+        if rss + growth <= limit_mb:
+            return
+
+        if growth:
+            summary = (f"{self.workflow} memory budget: {stage} would need ~{rss + growth:.0f} MB "
+                       f"({rss:.0f} MB now + {growth:.0f} MB in past runs), {self._describe_limit(limit_mb, runs)}")
+        else:
+            summary = (f"{self.workflow} memory budget: {rss:.0f} MB in use at {stage or 'run'}, "
+                       f"{self._describe_limit(limit_mb, runs)}")
+        if warn_only:
+            print(f"⚠️ {summary}")
+            return
+        print(f"🧠 {summary}")
+        self.print_stage_memory(stages)
+        raise MemoryBudgetExceeded(summary)
+
+    def print_stage_memory(self, stages: Iterable):
+        """Print peak RSS, RSS growth and Python allocations of each stage"""
+        for record in stages:
+            if record.peak_memory_mb is None:
+                continue
+            growth = f", +{record.memory_growth_mb:.0f} MB" if record.memory_growth_mb is not None else ""
+            blocks = (f", {record.allocated_blocks_delta:+,} Python blocks"
+                      if record.allocated_blocks_delta is not None else "")
+            print(f"   • {record.stage}: peak {record.peak_memory_mb:.0f} MB{growth}{blocks}")
@@ -0,0 +1,54 @@
+"""
+Process Memory Utilities
+=======================
+
+Resident memory of this process and of the browser processes it started.
+Uses psutil when installed; every function returns None without it.
+"""
+
+import os
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+BYTES_PER_MB = 1024 * 1024
+
+def get_process_rss_mb():
+    """
+    Resident memory of the current Python process
+
+    Returns:
+        float or None: RSS in MB
+    """
+    if not psutil:
+        return None
+    return psutil.Process(os.getpid()).memory_info().rss / BYTES_PER_MB
+
+def get_browser_memory_mb(process_name="firefox"):
+    """
+    Resident memory of browser processes started by this process
+
+    Playwright runs its driver as a child process, which launches the browser,
+    so browser processes are found among all descendants.
+
+    Args:
+        process_name (str): Substring of the browser process name
+
+    Returns:
+        dict or None: {'rss_mb': total RSS in MB, 'processes': process count}
+    """
+    if not psutil:
+        return None
+
+    total_rss = 0
+    count = 0
+    for child in psutil.Process(os.getpid()).children(recursive=True):
+        try:
+            if process_name in child.name().lower():
+                total_rss += child.memory_info().rss
+                count += 1
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return {'rss_mb': total_rss / BYTES_PER_MB, 'processes': count}
@@ -0,0 +1,289 @@
+"""
+Run Profiling
+=============
+
+On-demand CPU and allocation profiling of one workflow run. A background
+thread samples every thread's Python stack (so database, Excel and
+Playwright event-loop code are all covered) and tracemalloc snapshots are
+compared at the start and end of each stage. Written to the run directory:
+
+    profile/cpu_all.folded      folded stacks of the whole run, stage as the root frame
+    profile/cpu_<stage>.folded  folded stacks per stage
+    profile/alloc_<stage>.txt   top allocation sites per stage
+
+Folded stacks open in https://www.speedscope.app or flamegraph.pl.
+Profiling is off unless PROFILING_SETTINGS["enabled"] (MONUMATOR_PROFILE=1),
+--profile or the Daily Reports menu switch turns it on.
+"""
+
+import os
+import sys
+import time
+import threading
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from config.report_config import PROFILING_SETTINGS
+
+_enabled = PROFILING_SETTINGS["enabled"]
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROFILE_DIRECTORY = "profile"
+NO_STAGE = "(no stage)"
+
+# Helper threads that are never profiled
+IGNORED_THREADS = ("run-profiler", "run-memory")
+
+# Innermost frames of a thread that is blocked rather than running
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+    ("windows_events.py", "_poll"),  # Proactor event loop (the Windows default) waiting on IOCP
+    ("queue.py", "get"),
+    ("base_events.py", "_run_once"),
+}
+
+# tracemalloc is process-wide; it runs while any profiler needs it
+_tracemalloc_users = 0
+_tracemalloc_lock = threading.Lock()
+
+def set_profiling(enabled: bool):
+    """Turn profiling on or off for runs started from now on"""
+    global _enabled
+    _enabled = enabled
+
+def is_profiling_enabled() -> bool:
+    """Check whether new runs are profiled"""
+    return _enabled
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{getattr(code, 'co_qualname', code.co_name)}"
+
+def _get_project_files() -> set:
+    # File names of the project's own modules (labels only keep the base name)
+    project_files = set()
+    for root, directories, files in os.walk(PROJECT_ROOT):
+        directories[:] = [name for name in directories if not name.startswith((".", "__")) and name != "downloads"]
+        project_files.update(name for name in files if name.endswith(".py"))
+    return project_files
+
+def _safe_file_name(stage: str) -> str:
+    return "".join(character if character.isalnum() or character in "-_." else "_" for character in stage)
+
+class RunProfiler:
+    """
+    Sampling CPU profiler and per-stage allocation tracking for one run
+
+    Usage:
+        profiler = RunProfiler("stockout")
+        profiler.start()
+        profiler.stage_started("fetch")
+        ...
+        profiler.stage_finished("fetch")
+        profiler.stop()
+        profiler.write(run_directory)
+    """
+
+    def __init__(self, workflow: str, settings: Optional[Dict[str, Any]] = None):
+        """
+        Initialize run profiler
+
+        Args:
+            workflow: Workflow name
+            settings: Profiling settings (default: PROFILING_SETTINGS)
+        """
+        self.workflow = workflow
+        self.settings = {**PROFILING_SETTINGS, **(settings or {})}
+        self.samples: Dict[str, Counter] = {}
+        self.run_samples = Counter()
+        self.allocations: Dict[str, List[str]] = {}
+        self.sample_count = 0
+        self._open_stages: List[str] = []
+        self._snapshots: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._thread_names: Dict[int, str] = {}
+
+    def start(self):
+        """Start sampling and allocation tracking"""
+        global _tracemalloc_users
+        with _tracemalloc_lock:
+            if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start(self.settings["allocation_frames"])
+            _tracemalloc_users += 1
+        self._thread = threading.Thread(target=self._sample_loop, name="run-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and release tracemalloc"""
+        global _tracemalloc_users
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        for stage in list(self._snapshots):
+            self.stage_finished(stage)
+        with _tracemalloc_lock:
+            _tracemalloc_users -= 1
+            if _tracemalloc_users == 0:
+                tracemalloc.stop()
+
+    def _sample_loop(self):
+        interval = self.settings["sample_interval_ms"] / 1000
+        own_thread = threading.get_ident()
+        while not self._stop.wait(interval):
+            frames = sys._current_frames()
+            if any(thread_id not in self._thread_names for thread_id in frames):
+                self._thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            with self._lock:
+                stages = list(self._open_stages) or [NO_STAGE]
+            for thread_id, frame in frames.items():
+                thread_name = self._thread_names.get(thread_id, str(thread_id))
+                if thread_id == own_thread or thread_name.startswith(IGNORED_THREADS):
+                    continue
+                stack = self._fold(frame, thread_name)
+                if stack is None:
+                    continue
+                self.sample_count += 1
+                self.run_samples[stack] += 1
+                for stage in stages:
+                    self.samples.setdefault(stage, Counter())[stack] += 1
+
+    def _fold(self, frame, thread_name: str) -> Optional[str]:
+        code = frame.f_code
+        if not self.settings["include_idle"] and (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+            return None
+        labels = []
+        while frame is not None and len(labels) < 200:
+            if frame.f_code.co_filename == __file__:
+                return None  # The profiler's own snapshots and bookkeeping
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        labels.append(thread_name)
+        return ";".join(reversed(labels))
+
+    def stage_started(self, stage: str):
+        """Attribute samples to a stage and take its starting allocation snapshot"""
+        with self._lock:
+            self._open_stages.append(stage)
+        if tracemalloc.is_tracing():
+            self._snapshots[stage] = tracemalloc.take_snapshot()
+
+    def stage_finished(self, stage: str):
+        """Stop attributing samples to a stage and record its top allocation sites"""
+        with self._lock:
+            if stage in self._open_stages:
+                self._open_stages.remove(stage)
+        start_snapshot = self._snapshots.pop(stage, None)
+        if start_snapshot is None or not tracemalloc.is_tracing():
+            return
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")]
+        end_snapshot = tracemalloc.take_snapshot().filter_traces(filters)
+        differences = end_snapshot.compare_to(start_snapshot.filter_traces(filters), "lineno")
+        top = self.settings["top_allocations"]
+        lines = [f"Top {top} allocation sites in {self.workflow}.{stage} (net change while the stage ran)", ""]
+        for difference in differences[:top]:
+            frame = difference.traceback[0]
+            lines.append(f"{difference.size_diff / 1024:+12.1f} KiB {difference.count_diff:+9d} blocks  "
+                         f"{frame.filename}:{frame.lineno}")
+        total = sum(difference.size_diff for difference in differences)
+        lines += ["", f"Net allocated: {total / 1024 / 1024:+.1f} MiB"]
+        self.allocations[stage] = lines
+
+    def get_hot_functions(self, limit: Optional[int] = None) -> List[tuple]:
+        """
+        Project functions by share of samples they were on the stack for
+
+        Returns:
+            list: (function label, fraction of samples)
+        """
+        project_files = _get_project_files()
+        inclusive = Counter()
+        for stack, count in self.run_samples.items():
+            # Skip the thread name; count recursive functions once per sample
+            for label in set(stack.split(";")[1:]):
+                if label.split(":", 1)[0] in project_files:
+                    inclusive[label] += count
+        if not self.sample_count:
+            return []
+        return [(label, count / self.sample_count)
+                for label, count in inclusive.most_common(limit or self.settings["top_functions"])]
+
+    def write(self, directory: str) -> List[str]:
+        """
+        Write folded stacks and allocation reports to <directory>/profile
+
+        Returns:
+            list: Paths written
+        """
+        profile_directory = os.path.join(directory, PROFILE_DIRECTORY)
+        os.makedirs(profile_directory, exist_ok=True)
+        paths = []
+
+        def write_lines(file_name: str, lines: List[str]):
+            path = os.path.join(profile_directory, file_name)
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write("\n".join(lines) + "\n")
+            paths.append(path)
+
+        all_stages = []
+        for stage, counter in self.samples.items():
+            stage_lines = [f"{stack} {count}" for stack, count in counter.most_common()]
+            write_lines(f"cpu_{_safe_file_name(stage)}.folded", stage_lines)
+            all_stages += [f"{stage};{line}" for line in stage_lines]
+        if all_stages:
+            write_lines("cpu_all.folded", all_stages)
+        for stage, lines in self.allocations.items():
+            write_lines(f"alloc_{_safe_file_name(stage)}.txt", lines)
+        return paths
+
+    def print_hot_functions(self):
+        """Print the hottest project functions of the run"""
+        hot_functions = self.get_hot_functions()
+        if not hot_functions:
+            return
+        print(f"🔥 Hottest functions ({self.sample_count} samples):")
+        for label, share in hot_functions:
+            print(f"   {share * 100:5.1f}%  {label}")
+
+def start_profiler(workflow: str) -> Optional[RunProfiler]:
+    """
+    Start profiling a run
+
+    Returns:
+        RunProfiler or None: None while profiling is off
+    """
+    if not _enabled:
+        return None
+    profiler = RunProfiler(workflow)
+    profiler.start()
+    return profiler
+
+def finish_profiler(profiler: Optional[RunProfiler], directory: str) -> List[str]:
+    """
+    Stop profiling a run and write its profile files
+
+    Args:
+        profiler: start_profiler() result
+        directory: Run directory
+
+    Returns:
+        list: Paths written
+    """
+    if profiler is None:
+        return []
+    start_time = time.time()
+    profiler.stop()
+    try:
+        paths = profiler.write(directory)
+    except OSError as e:
+        print(f"⚠️ Could not write profile: {str(e)}")
+        return []
+    profiler.print_hot_functions()
+    print(f"🔬 Profile written to {os.path.join(directory, PROFILE_DIRECTORY)} "
+          f"({len(paths)} files, {time.time() - start_time:.1f}s) - open .folded files in https://www.speedscope.app")
+    return paths
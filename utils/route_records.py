@@ -0,0 +1,166 @@
+"""
+Inventory Confirmation Records
+==============================
+
+Compact records for scraped routes and assets. Scrapers build one
+RouteRecord per route and append it to an AssetBatch, which stores the
+assets column by column for the Excel writer and the route cache.
+"""
+
+from typing import List, Dict, Any, Iterator, Iterable, Optional, Tuple
+
+class AssetRecord:
+    """One incomplete asset row from a route detail page"""
+
+    __slots__ = ('asset_id', 'location', 'asset_type', 'restock_time', 'inventory_taken')
+
+    def __init__(self, asset_id: str, location: str, asset_type: str, restock_time: str, inventory_taken: str):
+        self.asset_id = asset_id
+        self.location = location
+        self.asset_type = asset_type
+        self.restock_time = restock_time
+        self.inventory_taken = inventory_taken
+
+    def __repr__(self):
+        return f"AssetRecord({self.asset_id!r}, {self.asset_type!r})"
+
+class RouteRecord:
+    """
+    One route from the routes summary
+
+    `assets` holds the route's assets until the record is added to an
+    AssetBatch, which moves them into its columns and keeps `asset_count`.
+    """
+
+    __slots__ = ('route', 'date', 'status', 'missing_count', 'asset_count', 'assets')
+
+    def __init__(self, route: str, date: str, missing_count: int, status: str = 'Incomplete',
+                 assets: Optional[List[AssetRecord]] = None):
+        self.route = route
+        self.date = date
+        self.status = status
+        self.missing_count = missing_count
+        self.assets = assets or []
+        self.asset_count = len(self.assets)
+
+    def __repr__(self):
+        return f"RouteRecord({self.route!r}, {self.date!r}, {self.status!r}, {self.asset_count} assets)"
+
+class AssetBatch:
+    """
+    Column-oriented store of routes and their incomplete assets
+
+    Each asset column is a plain list; `route_index` maps every asset row
+    back to its RouteRecord in `routes`.
+    """
+
+    ASSET_COLUMNS = AssetRecord.__slots__
+
+    def __init__(self):
+        self.routes: List[RouteRecord] = []
+        self.route_index: List[int] = []
+        self.columns: Dict[str, List[str]] = {column: [] for column in self.ASSET_COLUMNS}
+
+    @property
+    def asset_count(self) -> int:
+        """Total assets across all routes"""
+        return len(self.route_index)
+
+    def add_route(self, record: RouteRecord) -> int:
+        """
+        Append a route, moving its assets into the columns
+
+        Args:
+            record: Route with its scraped assets
+
+        Returns:
+            Index of the route in `routes`
+        """
+        index = len(self.routes)
+        self.routes.append(record)
+        for asset in record.assets:
+            self.route_index.append(index)
+            for column in self.ASSET_COLUMNS:
+                self.columns[column].append(getattr(asset, column))
+        record.asset_count = len(record.assets)
+        record.assets = []
+        return index
+
+    def extend(self, other: "AssetBatch"):
+        """Append every route and asset of another batch"""
+        offset = len(self.routes)
+        self.routes.extend(other.routes)
+        self.route_index.extend(index + offset for index in other.route_index)
+        for column in self.ASSET_COLUMNS:
+            self.columns[column].extend(other.columns[column])
+
+    def iter_rows(self, include_date: bool = False) -> Iterator[Tuple]:
+        """
+        Asset rows in template column order
+
+        Args:
+            include_date: Append the route date to each row
+
+        Returns:
+            Iterator of (asset_id, location, asset_type, restock_time, inventory_taken[, date])
+        """
+        column_values = [self.columns[column] for column in self.ASSET_COLUMNS]
+        if include_date:
+            dates = [self.routes[index].date for index in self.route_index]
+            return zip(*column_values, dates)
+        return zip(*column_values)
+
+    def select_routes(self, keep) -> "AssetBatch":
+        """
+        New batch with only the routes (and their assets) matching a predicate
+
+        Args:
+            keep: Called with each RouteRecord, True to keep it
+        """
+        selected = AssetBatch()
+        positions = {}
+        for position, route in enumerate(self.routes):
+            if keep(route):
+                positions[position] = len(selected.routes)
+                selected.routes.append(route)
+        for row, index in enumerate(self.route_index):
+            if index in positions:
+                selected.route_index.append(positions[index])
+                for column in self.ASSET_COLUMNS:
+                    selected.columns[column].append(self.columns[column][row])
+        return selected
+
+    def route_assets(self, route_position: int) -> List[AssetRecord]:
+        """Rebuild the AssetRecords of one route (for caches and debugging)"""
+        return [
+            AssetRecord(*(self.columns[column][row] for column in self.ASSET_COLUMNS))
+            for row, index in enumerate(self.route_index) if index == route_position
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Column-oriented JSON-serializable form"""
+        return {
+            'routes': [[route.route, route.date, route.status, route.missing_count, route.asset_count] for route in self.routes],
+            'route_index': self.route_index,
+            'columns': self.columns
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AssetBatch":
+        """Rebuild a batch saved with to_dict()"""
+        batch = cls()
+        for route, date, status, missing_count, asset_count in data['routes']:
+            record = RouteRecord(route, date, missing_count, status)
+            record.asset_count = asset_count
+            batch.routes.append(record)
+        batch.route_index = list(data['route_index'])
+        batch.columns = {column: list(data['columns'][column]) for column in cls.ASSET_COLUMNS}
+        return batch
+
+    @classmethod
+    def from_routes(cls, records: Iterable[RouteRecord]) -> "AssetBatch":
+        """Build a batch from route records in order"""
+        batch = cls()
+        for record in records:
+            batch.add_route(record)
+        return batch
@@ -0,0 +1,165 @@
+"""
+Inventory Confirmation Route Cache
+==================================
+
+Extracted route and asset records per target date, so reruns only fetch
+routes that can still change. Dates older than a cutoff are closed:
+their cached routes are reused as they are. Open dates are reused for a
+short TTL (ROUTE_CACHE_OPEN_DATE_TTL), like today's reports in the
+download cache.
+"""
+
+import os
+import json
+import time
+from datetime import datetime
+from config.report_config import DOWNLOAD_PATHS, ROUTE_CACHE_IMMUTABLE_AFTER_DAYS, ROUTE_CACHE_OPEN_DATE_TTL
+from utils.file_io import write_atomic
+from utils.route_records import AssetBatch
+
+class RouteResultCache:
+    """
+    JSON file per target date holding the column-oriented AssetBatch of its routes
+    """
+
+    def __init__(self, cache_directory=None, immutable_after_days=ROUTE_CACHE_IMMUTABLE_AFTER_DAYS,
+                 open_date_ttl=ROUTE_CACHE_OPEN_DATE_TTL):
+        """
+        Initialize the route cache
+
+        Args:
+            cache_directory (str): Directory of the per-date files
+            immutable_after_days (int): Dates older than this many days never change
+            open_date_ttl (int): Seconds an open date's entry is reused
+        """
+        self.cache_directory = cache_directory or os.path.join(DOWNLOAD_PATHS["cache"], "routes")
+        self.immutable_after_days = immutable_after_days
+        self.open_date_ttl = open_date_ttl
+
+    def _entry_path(self, target_date):
+        return os.path.join(self.cache_directory, f"routes_{target_date}.json")
+
+    def is_immutable_date(self, target_date):
+        """
+        Check whether a date is old enough that SEED no longer changes it
+
+        Args:
+            target_date (str): Date in YYYY-MM-DD format
+
+        Returns:
+            bool: True for closed dates
+        """
+        age = datetime.now() - datetime.strptime(target_date, "%Y-%m-%d")
+        return age.days > self.immutable_after_days
+
+    def load(self, target_date):
+        """
+        Load the cached entry for a date
+
+        Returns:
+            dict or None: {'date', 'route_order', 'batch', 'completed_routes', 'complete', 'saved_at'}
+        """
+        try:
+            with open(self._entry_path(target_date), 'r') as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        # Entries from before the column-oriented format are refetched
+        return entry if 'batch' in entry else None
+
+    def get_final_routes(self, target_date):
+        """
+        Cached result for a date that was scraped without errors
+
+        Closed dates are reused for good, open dates while the entry is
+        younger than open_date_ttl.
+
+        Args:
+            target_date (str): Date in YYYY-MM-DD format
+
+        Returns:
+            AssetBatch or None: Routes in summary order, None if the date must be scraped
+        """
+        entry = self.load(target_date)
+        if not entry or not entry.get('complete'):
+            return None
+        if not self.is_immutable_date(target_date) and time.time() - entry.get('saved_at', 0) > self.open_date_ttl:
+            return None
+        return AssetBatch.from_dict(entry['batch'])
+
+    def split_routes(self, target_date, routes_with_missing):
+        """
+        Separate summary routes into reusable cached records and routes to fetch
+
+        Routes still showing missing inventory on an open date are always fetched
+        (a fresh complete entry is returned whole by get_final_routes instead);
+        on a closed date a cached record with the same missing count is reused.
+
+        Args:
+            target_date (str): Date in YYYY-MM-DD format
+            routes_with_missing (list): (route_name, missing_count, href) from the summary
+
+        Returns:
+            tuple: (dict of route_name -> cached RouteRecord with assets, list of summary routes to fetch)
+        """
+        entry = self.load(target_date) if self.is_immutable_date(target_date) else None
+        cached_batch = AssetBatch.from_dict(entry['batch']) if entry else AssetBatch()
+        cached_positions = {record.route: position for position, record in enumerate(cached_batch.routes)}
+
+        reusable = {}
+        to_fetch = []
+        for route in routes_with_missing:
+            route_name, missing_count, _ = route
+            position = cached_positions.get(route_name)
+            if position is not None and cached_batch.routes[position].missing_count == missing_count:
+                record = cached_batch.routes[position]
+                record.assets = cached_batch.route_assets(position)
+                reusable[route_name] = record
+            else:
+                to_fetch.append(route)
+        return reusable, to_fetch
+
+    def store(self, target_date, routes_with_missing, route_data):
+        """
+        Save the routes of one scrape
+
+        Routes that errored are left out so the next run fetches them again.
+        Routes cached earlier but no longer missing inventory are recorded as complete.
+
+        Args:
+            target_date (str): Date in YYYY-MM-DD format
+            routes_with_missing (list): (route_name, missing_count, href) from the summary
+            route_data (AssetBatch): Routes in summary order
+        """
+        previous = self.load(target_date) or {}
+        missing_names = [route_name for route_name, _, _ in routes_with_missing]
+        previous_names = [route[0] for route in previous.get('batch', {}).get('routes', [])]
+        newly_completed = [route_name for route_name in previous_names if route_name not in missing_names]
+        scraped = route_data.select_routes(lambda record: record.status not in ('Error', 'NeedsBrowser'))
+
+        entry = {
+            'date': target_date,
+            'route_order': missing_names,
+            'batch': scraped.to_dict(),
+            'completed_routes': sorted(set(previous.get('completed_routes', [])) | set(newly_completed)),
+            'complete': len(scraped.routes) == len(missing_names),
+            'saved_at': time.time()
+        }
+        write_atomic(self._entry_path(target_date), json.dumps(entry).encode())
+
+    def merge(self, routes_with_missing, reusable, fetched):
+        """
+        Combine cached and freshly fetched records in summary order
+
+        Args:
+            routes_with_missing (list): (route_name, missing_count, href) from the summary
+            reusable (dict): route_name -> cached RouteRecord from split_routes()
+            fetched (list): RouteRecords for the routes that were fetched
+
+        Returns:
+            AssetBatch: Routes in summary order
+        """
+        fetched_by_name = {record.route: record for record in fetched}
+        return AssetBatch.from_routes(
+            reusable.get(route_name) or fetched_by_name[route_name] for route_name, _, _ in routes_with_missing
+        )
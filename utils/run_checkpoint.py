@@ -0,0 +1,268 @@
+"""
+Workflow Run Checkpoints
+========================
+
+Each workflow run gets a directory (downloads/runs/<workflow>/<run id>/)
+where stages save their output as they finish: query results, downloaded
+files and scraped records. A failed run keeps its directory, and the next
+run started with resume=True continues after the last completed stage
+instead of starting over.
+"""
+
+import os
+import json
+import gzip
+import time
+import shutil
+import pickle
+from datetime import datetime
+from typing import Any, Dict, Optional
+from config.report_config import DOWNLOAD_PATHS, RUN_RETENTION_DAYS
+from utils.file_io import write_atomic
+from utils.route_records import AssetBatch
+
+MANIFEST_FILE = "manifest.json"
+
+class RunCheckpoint:
+    """
+    Stage outputs of one workflow run
+
+    Usage:
+        checkpoint = RunCheckpoint.start("stockout", {'date': today}, resume=True)
+        if checkpoint.has("fetch"):
+            raw_data = checkpoint.load("fetch")
+        else:
+            raw_data = fetch()
+            checkpoint.save("fetch", raw_data)
+        ...
+        checkpoint.complete()
+    """
+
+    def __init__(self, workflow: str, params: Optional[Dict[str, Any]] = None,
+                 run_directory: str = DOWNLOAD_PATHS["runs"], run_id: Optional[str] = None):
+        """
+        Open (or create) a run directory
+
+        Args:
+            workflow: Workflow name, e.g. "inventory_confirmation"
+            params: Inputs that define the run (dates, ...); only runs with the same params are resumed
+            run_directory: Parent directory of all runs
+            run_id: Existing run to open (default: a new run named after the current time)
+        """
+        self.workflow = workflow
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.directory = os.path.join(run_directory, workflow, self.run_id)
+        self._manifest_path = os.path.join(self.directory, MANIFEST_FILE)
+        try:
+            with open(self._manifest_path, 'r') as file:
+                self.manifest = json.load(file)
+        except (OSError, ValueError):
+            self.manifest = {
+                'workflow': workflow,
+                'run_id': self.run_id,
+                'params': params or {},
+                'status': 'running',
+                'started_at': time.time(),
+                'stages': {}
+            }
+            os.makedirs(self.directory, exist_ok=True)
+            self._save_manifest()
+
+    @classmethod
+    def find_resumable(cls, workflow: str, params: Optional[Dict[str, Any]] = None,
+                       run_directory: str = DOWNLOAD_PATHS["runs"]) -> Optional["RunCheckpoint"]:
+        """
+        Latest unfinished run of a workflow with the same params
+
+        Returns:
+            RunCheckpoint or None: The run, if it has at least one completed stage
+        """
+        for manifest in list_runs(workflow, run_directory):
+            if manifest.get('params') != (params or {}):
+                continue
+            if manifest.get('status') == 'complete':
+                return None  # A later run already finished the same work
+            if manifest.get('stages'):
+                return cls(workflow, run_directory=run_directory, run_id=manifest['run_id'])
+        return None
+
+    @classmethod
+    def start(cls, workflow: str, params: Optional[Dict[str, Any]] = None, resume: bool = False,
+              run_directory: str = DOWNLOAD_PATHS["runs"]) -> "RunCheckpoint":
+        """
+        Begin a run, continuing the latest unfinished one when resume is set
+
+        Runs older than RUN_RETENTION_DAYS are removed first.
+
+        Args:
+            workflow: Workflow name
+            params: Inputs that define the run
+            resume: Continue a matching unfinished run if there is one
+
+        Returns:
+            RunCheckpoint
+        """
+        prune_runs(run_directory)
+        if resume:
+            checkpoint = cls.find_resumable(workflow, params, run_directory)
+            if checkpoint:
+                checkpoint.manifest['status'] = 'running'
+                checkpoint.manifest.pop('error', None)
+                checkpoint._save_manifest()
+                print(f"🔁 Resuming {workflow} run {checkpoint.run_id} "
+                      f"(done: {', '.join(checkpoint.manifest['stages'])})")
+                return checkpoint
+            print(f"ℹ️ No unfinished {workflow} run to resume, starting fresh")
+        return cls(workflow, params, run_directory)
+
+    def _save_manifest(self):
+        write_atomic(self._manifest_path, json.dumps(self.manifest, default=str).encode())
+
+    def has(self, stage: str) -> bool:
+        """Check whether a stage already completed in this run"""
+        return stage in self.manifest['stages']
+
+    @property
+    def completed_stages(self):
+        """Names of completed stages in completion order"""
+        return list(self.manifest['stages'])
+
+    def save(self, stage: str, value: Any):
+        """
+        Save a stage's output
+
+        AssetBatch is stored in its column JSON form; anything else
+        (DataFrames, dicts of DataFrames) as gzip-compressed pickle.
+
+        Args:
+            stage: Stage name
+            value: Stage output
+        """
+        start_time = time.time()
+        if isinstance(value, AssetBatch):
+            file_name, kind = f"{stage}.json.gz", "batch"
+            data = gzip.compress(json.dumps(value.to_dict()).encode(), compresslevel=1)
+        else:
+            file_name, kind = f"{stage}.pkl.gz", "pickle"
+            data = gzip.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), compresslevel=1)
+        write_atomic(os.path.join(self.directory, file_name), data)
+        self._record_stage(stage, file_name, kind, len(data), time.time() - start_time)
+
+    def save_file(self, stage: str, file_path: str) -> str:
+        """
+        Keep a downloaded file as a stage's output
+
+        Files outside the run directory are moved into it.
+
+        Args:
+            stage: Stage name
+            file_path: Downloaded file
+
+        Returns:
+            str: Path of the file inside the run directory
+        """
+        target_path = os.path.join(self.directory, os.path.basename(file_path))
+        if os.path.abspath(file_path) != os.path.abspath(target_path):
+            shutil.move(file_path, target_path)
+        self._record_stage(stage, os.path.basename(target_path), "file", os.path.getsize(target_path), 0.0)
+        return target_path
+
+    def _record_stage(self, stage: str, file_name: str, kind: str, size: int, seconds: float):
+        self.manifest['stages'][stage] = {
+            'file': file_name,
+            'kind': kind,
+            'bytes': size,
+            'save_seconds': round(seconds, 3),
+            'saved_at': time.time()
+        }
+        self._save_manifest()
+
+    def load(self, stage: str) -> Any:
+        """
+        Load a completed stage's output
+
+        Returns:
+            The saved value, or the file path for save_file() stages
+        """
+        entry = self.manifest['stages'][stage]
+        path = os.path.join(self.directory, entry['file'])
+        if entry['kind'] == "file":
+            return path
+        with open(path, 'rb') as file:
+            data = gzip.decompress(file.read())
+        if entry['kind'] == "batch":
+            return AssetBatch.from_dict(json.loads(data))
+        return pickle.loads(data)
+
+    def fail(self, error: str):
+        """Mark the run failed; its stage outputs are kept for resuming"""
+        self.manifest['status'] = 'failed'
+        self.manifest['error'] = error
+        self._save_manifest()
+        if self.manifest['stages']:
+            print(f"💾 Completed stages saved in {self.directory} - run again with resume to continue")
+
+    def complete(self):
+        """Mark the run complete and delete its stage outputs (the manifest is kept)"""
+        for entry in self.manifest['stages'].values():
+            path = os.path.join(self.directory, entry['file'])
+            if os.path.exists(path):
+                os.remove(path)
+        self.manifest['status'] = 'complete'
+        self.manifest['finished_at'] = time.time()
+        self._save_manifest()
+
+def list_runs(workflow: str, run_directory: str = DOWNLOAD_PATHS["runs"]):
+    """
+    Manifests of a workflow's runs, newest first
+
+    Args:
+        workflow: Workflow name
+        run_directory: Parent directory of all runs
+
+    Returns:
+        Iterator of manifest dicts
+    """
+    workflow_directory = os.path.join(run_directory, workflow)
+    if not os.path.isdir(workflow_directory):
+        return
+    for run_id in sorted(os.listdir(workflow_directory), reverse=True):
+        try:
+            with open(os.path.join(workflow_directory, run_id, MANIFEST_FILE), 'r') as file:
+                yield json.load(file)
+        except (OSError, ValueError):
+            continue
+
+def get_unfinished_run(workflow: str, run_directory: str = DOWNLOAD_PATHS["runs"]) -> Optional[Dict[str, Any]]:
+    """
+    Manifest of the latest run that stopped with completed stages, whatever its params
+
+    Returns:
+        dict or None: None when the latest finished run came after it
+    """
+    for manifest in list_runs(workflow, run_directory):
+        if manifest.get('status') == 'complete':
+            return None
+        if manifest.get('stages'):
+            return manifest
+    return None
+
+def prune_runs(run_directory: str = DOWNLOAD_PATHS["runs"], retention_days: int = RUN_RETENTION_DAYS):
+    """
+    Delete run directories older than the retention period
+
+    Args:
+        run_directory: Parent directory of all runs
+        retention_days: Days runs are kept
+    """
+    if not os.path.isdir(run_directory):
+        return
+    cutoff = time.time() - retention_days * 24 * 60 * 60
+    for workflow in os.listdir(run_directory):
+        workflow_directory = os.path.join(run_directory, workflow)
+        if not os.path.isdir(workflow_directory):
+            continue
+        for run_id in os.listdir(workflow_directory):
+            path = os.path.join(workflow_directory, run_id)
+            if os.path.isdir(path) and os.path.getmtime(path) < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
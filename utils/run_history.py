@@ -0,0 +1,500 @@
+"""
+Run History
+===========
+
+Local SQLite store of every workflow run: per-stage timings, row counts,
+bytes moved, peak memory and allocations. Used for the Performance History view (p50/p95
+per stage over time) and to flag stages that got much slower than their
+baseline. When tracing or profiling is on, a recorded run also writes its
+trace file and CPU/allocation profile to its run directory.
+"""
+
+import os
+import sys
+import math
+import time
+import sqlite3
+import tracemalloc
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+from config.report_config import (RUN_HISTORY_DB, PERFORMANCE_HISTORY_SETTINGS, MEMORY_BUDGETS_MB,
+                                  MEMORY_BUDGET_SETTINGS, DOWNLOAD_PATHS)
+from utils.process_memory import get_process_rss_mb
+from utils.tracing import span, start_trace, finish_trace
+from utils.profiling import start_profiler, finish_profiler
+from utils.memory_budget import MemoryBudget
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    workflow TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    success INTEGER NOT NULL,
+    error TEXT,
+    peak_memory_mb REAL
+);
+CREATE TABLE IF NOT EXISTS stages (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    stage TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    rows INTEGER,
+    bytes INTEGER,
+    peak_memory_mb REAL,
+    memory_growth_mb REAL,
+    allocated_blocks_delta INTEGER,
+    python_alloc_mb REAL
+);
+CREATE INDEX IF NOT EXISTS runs_workflow ON runs(workflow, started_at);
+CREATE INDEX IF NOT EXISTS stages_run ON stages(run_id);
+"""
+
+# Stage columns added after the first release: name -> type
+STAGE_MEMORY_COLUMNS = {
+    'memory_growth_mb': "REAL",
+    'allocated_blocks_delta': "INTEGER",
+    'python_alloc_mb': "REAL"
+}
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (None for no values)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+class RunHistory:
+    """
+    SQLite run history
+    """
+
+    def __init__(self, db_path: str = RUN_HISTORY_DB):
+        """
+        Initialize run history (creates the database on first use)
+
+        Args:
+            db_path: SQLite file
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(SCHEMA)
+            existing = {row[1] for row in connection.execute("PRAGMA table_info(stages)")}
+            for column, column_type in STAGE_MEMORY_COLUMNS.items():
+                if column not in existing:
+                    connection.execute(f"ALTER TABLE stages ADD COLUMN {column} {column_type}")
+
+    @contextmanager
+    def _connect(self):
+        # Commit on success and always close (sqlite3's own context manager only commits)
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def record_run(self, workflow: str, started_at: float, duration: float, success: bool,
+                   stages: List[Dict[str, Any]], error: Optional[str] = None,
+                   peak_memory_mb: Optional[float] = None) -> int:
+        """
+        Save one run and its stages
+
+        Args:
+            workflow: Workflow name
+            started_at: Start timestamp
+            duration: Wall time in seconds
+            success: Whether the run succeeded
+            stages: {'stage', 'seconds', 'rows', 'bytes', 'peak_memory_mb', 'memory_growth_mb',
+                'allocated_blocks_delta', 'python_alloc_mb'} per stage
+            error: Error message of a failed run
+            peak_memory_mb: Peak process RSS during the run
+
+        Returns:
+            int: Run id
+        """
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (workflow, started_at, duration, success, error, peak_memory_mb) VALUES (?, ?, ?, ?, ?, ?)",
+                (workflow, started_at, duration, int(success), error, peak_memory_mb)
+            )
+            run_id = cursor.lastrowid
+            connection.executemany(
+                "INSERT INTO stages (run_id, stage, seconds, rows, bytes, peak_memory_mb, memory_growth_mb, "
+                "allocated_blocks_delta, python_alloc_mb) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, stage['stage'], stage['seconds'], stage.get('rows'), stage.get('bytes'), stage.get('peak_memory_mb'),
+                  stage.get('memory_growth_mb'), stage.get('allocated_blocks_delta'), stage.get('python_alloc_mb'))
+                 for stage in stages]
+            )
+        return run_id
+
+    def get_stage_durations(self, workflow: Optional[str] = None, days: int = PERFORMANCE_HISTORY_SETTINGS["days"],
+                            successful_only: bool = True) -> Dict[tuple, List[tuple]]:
+        """
+        Stage durations per (workflow, stage), oldest first
+
+        Returns:
+            dict: (workflow, stage) -> [(started_at, seconds, run_id), ...]
+        """
+        query = ("SELECT runs.workflow, stages.stage, runs.started_at, stages.seconds, runs.id "
+                 "FROM stages JOIN runs ON runs.id = stages.run_id WHERE runs.started_at >= ?")
+        params: List[Any] = [time.time() - days * 24 * 60 * 60]
+        if workflow:
+            query += " AND runs.workflow = ?"
+            params.append(workflow)
+        if successful_only:
+            query += " AND runs.success = 1"
+        query += " ORDER BY runs.started_at"
+
+        durations: Dict[tuple, List[tuple]] = {}
+        with self._connect() as connection:
+            for workflow_name, stage, started_at, seconds, run_id in connection.execute(query, params):
+                durations.setdefault((workflow_name, stage), []).append((started_at, seconds, run_id))
+        return durations
+
+    def get_stage_stats(self, workflow: Optional[str] = None,
+                        days: int = PERFORMANCE_HISTORY_SETTINGS["days"]) -> List[Dict[str, Any]]:
+        """
+        p50/p95 per stage, weekly p50 trend and regression flag
+
+        A stage is flagged when its latest run is more than regression_factor
+        times the median of the runs before it (and at least
+        min_regression_seconds slower).
+
+        Returns:
+            list: {'workflow', 'stage', 'runs', 'p50', 'p95', 'last', 'baseline', 'weekly_p50', 'regressed'}
+        """
+        settings = PERFORMANCE_HISTORY_SETTINGS
+        stats = []
+        for (workflow_name, stage), samples in self.get_stage_durations(workflow, days).items():
+            seconds = [sample[1] for sample in samples]
+            previous = seconds[:-1][-settings["baseline_runs"]:]
+            baseline = percentile(previous, 50) if len(previous) >= settings["min_baseline_runs"] else None
+            last = seconds[-1]
+
+            weeks: Dict[str, List[float]] = {}
+            for started_at, value, _ in samples:
+                weeks.setdefault(datetime.fromtimestamp(started_at).strftime("%G-W%V"), []).append(value)
+
+            stats.append({
+                'workflow': workflow_name,
+                'stage': stage,
+                'runs': len(seconds),
+                'p50': percentile(seconds, 50),
+                'p95': percentile(seconds, 95),
+                'last': last,
+                'baseline': baseline,
+                'weekly_p50': [(week, percentile(values, 50)) for week, values in sorted(weeks.items())],
+                'regressed': baseline is not None and last > baseline * settings["regression_factor"]
+                             and last - baseline >= settings["min_regression_seconds"]
+            })
+        return sorted(stats, key=lambda entry: (entry['workflow'], entry['stage']))
+
+    def get_memory_growth(self, workflow: str, pct: float = MEMORY_BUDGET_SETTINGS["growth_percentile"],
+                          runs: int = PERFORMANCE_HISTORY_SETTINGS["baseline_runs"]) -> Dict[str, float]:
+        """
+        How much each stage usually adds to process memory
+
+        Args:
+            workflow: Workflow name
+            pct: Percentile of the recent growths to use
+            runs: Recent successful runs per stage to consider
+
+        Returns:
+            dict: Stage -> MB of RSS growth
+        """
+        query = ("SELECT stages.stage, stages.memory_growth_mb FROM stages JOIN runs ON runs.id = stages.run_id "
+                 "WHERE runs.workflow = ? AND runs.success = 1 AND stages.memory_growth_mb IS NOT NULL "
+                 "ORDER BY runs.started_at DESC")
+        growths: Dict[str, List[float]] = {}
+        with self._connect() as connection:
+            for stage, growth in connection.execute(query, (workflow,)):
+                values = growths.setdefault(stage, [])
+                if len(values) < runs:
+                    values.append(growth)
+        return {stage: percentile(values, pct) for stage, values in growths.items()}
+
+    def get_recent_runs(self, workflow: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Latest runs, newest first"""
+        query = "SELECT id, workflow, started_at, duration, success, error, peak_memory_mb FROM runs"
+        params: List[Any] = []
+        if workflow:
+            query += " WHERE workflow = ?"
+            params.append(workflow)
+        query += " ORDER BY started_at DESC LIMIT ?"
+        params.append(limit)
+        with self._connect() as connection:
+            columns = ('id', 'workflow', 'started_at', 'duration', 'success', 'error', 'peak_memory_mb')
+            return [dict(zip(columns, row)) for row in connection.execute(query, params)]
+
+class StageRecord:
+    """Measurements of one stage; `rows` and `bytes` are filled in by the workflow"""
+
+    __slots__ = ('stage', 'seconds', 'rows', 'bytes', 'peak_memory_mb', 'memory_growth_mb',
+                 'allocated_blocks_delta', 'python_alloc_mb')
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.seconds = 0.0
+        self.rows = None
+        self.bytes = None
+        self.peak_memory_mb = None
+        self.memory_growth_mb = None        # Peak RSS during the stage minus RSS at its start
+        self.allocated_blocks_delta = None  # Python object blocks allocated and not freed
+        self.python_alloc_mb = None         # Same in MB, measured only while tracemalloc runs (profiling)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+class RunRecorder:
+    """
+    Collects stage measurements for one workflow run and saves them to the run history
+
+    Usage:
+        recorder = RunRecorder("stockout")
+        with recorder.stage("fetch") as stage:
+            raw_data = fetch()
+            stage.rows = len(raw_data)
+        chunk_rows = recorder.get_chunk_rows("generate_excel")  # None unless near the memory budget
+        with recorder.stage("generate_excel", chunked=chunk_rows is not None):
+            ...
+        recorder.finish(success=True)
+
+    Stages check the workflow's memory budget as they start and raise
+    MemoryBudgetExceeded when it is (or is about to be) exceeded; a stage
+    that ends over the budget only warns, since its work is already done.
+    """
+
+    def __init__(self, workflow: str, history: Optional[RunHistory] = None, run_directory: Optional[str] = None):
+        """
+        Initialize run recorder (and start the run's trace and profiler when they are on)
+
+        Args:
+            workflow: Workflow name
+            history: Run history to save to (default: RUN_HISTORY_DB)
+            run_directory: Where the trace and profile are written (default: a new directory under DOWNLOAD_PATHS["runs"];
+                workflows with a checkpoint set it to the checkpoint's directory)
+        """
+        self.workflow = workflow
+        self.history = history
+        self.run_directory = run_directory
+        self.started_at = time.time()
+        self.trace = start_trace(workflow)
+        self.profiler = start_profiler(workflow)
+        self.stages: List[StageRecord] = []
+        self.peak_memory_mb = None
+        self._open_stages: List[StageRecord] = []
+        self._lock = threading.Lock()
+        self._stop_sampling = threading.Event()
+        self._sampler = None
+        if get_process_rss_mb() is not None:
+            self._sampler = threading.Thread(target=self._sample_memory, name="run-memory", daemon=True)
+            self._sampler.start()
+        self.budget = MemoryBudget(workflow)
+        self.budget.activate()
+        if self.budget.enabled:
+            self._load_expected_growth()
+
+    def _load_expected_growth(self):
+        try:
+            self.budget.expected_growth = (self.history or RunHistory()).get_memory_growth(self.workflow)
+        except Exception as e:
+            print(f"⚠️ Could not read memory history: {str(e)}")
+
+    def _sample_memory(self):
+        # One sampler for the whole run; every open stage keeps its own peak
+        interval = PERFORMANCE_HISTORY_SETTINGS["sample_interval"]
+        while not self._stop_sampling.wait(interval):
+            self._update_peaks()
+
+    def _update_peaks(self):
+        rss = get_process_rss_mb()
+        if rss is None:
+            return
+        with self._lock:
+            self.peak_memory_mb = max(self.peak_memory_mb or 0.0, rss)
+            for record in self._open_stages:
+                record.peak_memory_mb = max(record.peak_memory_mb or 0.0, rss)
+
+    @contextmanager
+    def stage(self, name: str, chunked: bool = False):
+        """
+        Time a stage (also usable around awaits; stages may overlap)
+
+        Args:
+            name: Stage name
+            chunked: The stage runs in its chunked mode, so its past growth doesn't apply
+
+        Yields:
+            StageRecord: set `rows` / `bytes` on it
+
+        Raises:
+            MemoryBudgetExceeded: Before the stage if it would exceed the budget (over it afterwards only warns)
+        """
+        self.check_memory(name, projected=not chunked)
+        record = StageRecord(name)
+        with self._lock:
+            self._open_stages.append(record)
+        self._update_peaks()
+        start_rss = record.peak_memory_mb
+        start_blocks = sys.getallocatedblocks()
+        start_traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        if self.profiler:
+            self.profiler.stage_started(name)
+        start_time = time.time()
+        try:
+            with span(name, category="stage"):
+                yield record
+        finally:
+            record.seconds = time.time() - start_time
+            if self.profiler:
+                self.profiler.stage_finished(name)
+            self._update_peaks()
+            record.allocated_blocks_delta = sys.getallocatedblocks() - start_blocks
+            if start_rss is not None:
+                record.memory_growth_mb = record.peak_memory_mb - start_rss
+            if start_traced is not None and tracemalloc.is_tracing():
+                record.python_alloc_mb = (tracemalloc.get_traced_memory()[0] - start_traced) / 1024 / 1024
+            with self._lock:
+                self._open_stages.remove(record)
+                self.stages.append(record)
+        # The stage's work is done; the next stage's check decides whether the run stops
+        self.check_memory(name, warn_only=True)
+
+    def check_memory(self, stage: Optional[str] = None, projected: bool = False, warn_only: bool = False):
+        """
+        Fail early when the run is over its memory budget
+
+        Args:
+            stage: Stage about to start or just finished
+            projected: Include the stage's usual growth from past runs
+            warn_only: Only warn (after a stage has finished)
+
+        Raises:
+            MemoryBudgetExceeded
+        """
+        with self._lock:
+            stages = self.stages + self._open_stages
+        self.budget.check(stage, projected, stages, warn_only)
+
+    def get_chunk_rows(self, stage: str) -> Optional[int]:
+        """Rows per write when a stage with a chunked mode should use it (None otherwise)"""
+        return self.budget.get_chunk_rows(stage)
+
+    def add_stage(self, name: str, seconds: float, rows: Optional[int] = None, size: Optional[int] = None) -> StageRecord:
+        """Record a stage timed elsewhere (e.g. by the task graph)"""
+        record = StageRecord(name)
+        record.seconds = seconds
+        record.rows = rows
+        record.bytes = size
+        with self._lock:
+            self.stages.append(record)
+        return record
+
+    def get_stage_timings(self) -> Dict[str, float]:
+        """Stage name -> seconds"""
+        return {record.stage: record.seconds for record in self.stages}
+
+    def finish(self, success: bool, error: Optional[str] = None) -> Optional[int]:
+        """
+        Save the run and warn about stages much slower than their baseline
+
+        History problems never fail the workflow.
+
+        Returns:
+            int or None: Run id
+        """
+        self._stop_sampling.set()
+        duration = time.time() - self.started_at
+        limit_mb, runs = self.budget.get_limit()
+        self.budget.release()
+        if limit_mb and self.peak_memory_mb and \
+                self.peak_memory_mb >= limit_mb * MEMORY_BUDGET_SETTINGS["pressure_fraction"]:
+            shared = f" (shared by {runs} overlapping runs)" if runs > 1 else ""
+            print(f"🧠 {self.workflow} peaked at {self.peak_memory_mb:.0f} MB of its {limit_mb:.0f} MB budget{shared}:")
+            self.budget.print_stage_memory(self.stages)
+        if self.trace or self.profiler:
+            run_directory = self.run_directory or os.path.join(
+                DOWNLOAD_PATHS["runs"], self.workflow, datetime.fromtimestamp(self.started_at).strftime("%Y%m%d_%H%M%S_%f")
+            )
+            finish_trace(self.trace, run_directory)
+            finish_profiler(self.profiler, run_directory)
+            self.trace = self.profiler = None
+        try:
+            history = self.history or RunHistory()
+            run_id = history.record_run(
+                self.workflow, self.started_at, duration, success,
+                [record.to_dict() for record in self.stages], error, self.peak_memory_mb
+            )
+            if success:
+                stage_names = {record.stage for record in self.stages}
+                for entry in history.get_stage_stats(self.workflow):
+                    if entry['regressed'] and entry['stage'] in stage_names:
+                        print(f"🐢 {self.workflow}.{entry['stage']} took {entry['last']:.1f}s "
+                              f"(baseline {entry['baseline']:.1f}s)")
+            return run_id
+        except Exception as e:
+            print(f"⚠️ Could not save run history: {str(e)}")
+            return None
+
+def file_size(path: Optional[str]) -> Optional[int]:
+    """Size of a file in bytes (None if missing)"""
+    try:
+        return os.path.getsize(path) if path else None
+    except OSError:
+        return None
+
+def print_performance_history(workflow: Optional[str] = None, days: int = PERFORMANCE_HISTORY_SETTINGS["days"]):
+    """
+    Print p50/p95 per stage, the weekly p50 trend and regressions
+
+    Args:
+        workflow: Only this workflow (default: all)
+        days: Days of history to include
+    """
+    history = RunHistory()
+    stats = history.get_stage_stats(workflow, days)
+
+    print(f"📈 PERFORMANCE HISTORY (last {days} days)")
+    print("=" * 72)
+    if not stats:
+        print("ℹ️ No runs recorded yet")
+        return
+
+    current_workflow = None
+    memory_growth = {}
+    for entry in stats:
+        if entry['workflow'] != current_workflow:
+            current_workflow = entry['workflow']
+            memory_growth = history.get_memory_growth(current_workflow)
+            print(f"\n📊 {current_workflow}")
+            print(f"   {'stage':<26}{'runs':>5}{'p50':>9}{'p95':>9}{'last':>9}{'mem':>10}  trend (weekly p50)")
+        flag = "  🐢 REGRESSION" if entry['regressed'] else ""
+        trend = " → ".join(f"{value:.1f}" for _, value in entry['weekly_p50'][-4:])
+        growth = memory_growth.get(entry['stage'])
+        memory = f"+{growth:.0f} MB" if growth is not None else "n/a"
+        print(f"   {entry['stage']:<26}{entry['runs']:>5}{entry['p50']:>8.1f}s{entry['p95']:>8.1f}s"
+              f"{entry['last']:>8.1f}s{memory:>10}  {trend}{flag}")
+
+    regressions = [entry for entry in stats if entry['regressed']]
+    print()
+    if regressions:
+        print(f"🐢 {len(regressions)} stage(s) slower than {PERFORMANCE_HISTORY_SETTINGS['regression_factor']:.1f}x baseline:")
+        for entry in regressions:
+            print(f"   • {entry['workflow']}.{entry['stage']}: {entry['last']:.1f}s vs {entry['baseline']:.1f}s")
+    else:
+        print("✅ No stage regressions")
+
+    print("\n🕒 Recent runs")
+    for run in history.get_recent_runs(workflow, limit=5):
+        status = "✅" if run['success'] else "❌"
+        memory = f", peak {run['peak_memory_mb']:.0f} MB" if run['peak_memory_mb'] else ""
+        budget = MEMORY_BUDGETS_MB.get(run['workflow'])
+        if budget and run['peak_memory_mb']:
+            memory += f" / {budget} MB budget"
+        print(f"   {status} {datetime.fromtimestamp(run['started_at']):%Y-%m-%d %H:%M} {run['workflow']}: "
+              f"{run['duration']:.1f}s{memory}")
@@ -0,0 +1,356 @@
+"""
+Report Scheduler
+================
+
+Runs scheduled report jobs so they are ready by a deadline. Each job's
+duration is learned from its past runs, the job starts that long (plus a
+safety margin) before its deadline, and the database and SEED session it
+needs are warmed up (and its templates checked) a few minutes before that. Every warm-up
+and run is appended to a JSON-lines log with its lead time or miss.
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import importlib
+from datetime import datetime, date, timedelta
+from typing import Dict, List, Any, Optional, Iterable
+from config.report_config import SCHEDULED_JOBS, SCHEDULER_SETTINGS
+from utils.file_io import write_atomic
+from reports.report_registry import resolve_reports
+
+class DurationHistory:
+    """
+    Recent successful durations per job, saved as JSON
+    """
+
+    def __init__(self, durations_file: str = SCHEDULER_SETTINGS["durations_file"],
+                 max_entries: int = SCHEDULER_SETTINGS["duration_history"]):
+        """
+        Initialize duration history
+
+        Args:
+            durations_file: JSON file of job name -> list of durations in seconds
+            max_entries: Durations kept per job
+        """
+        self.durations_file = durations_file
+        self.max_entries = max_entries
+        try:
+            with open(durations_file, 'r') as file:
+                self.durations: Dict[str, List[float]] = json.load(file)
+        except (OSError, ValueError):
+            self.durations = {}
+
+    def record(self, job_name: str, seconds: float):
+        """Add a successful run's duration and save"""
+        history = self.durations.setdefault(job_name, [])
+        history.append(round(seconds, 1))
+        del history[:-self.max_entries]
+        write_atomic(self.durations_file, json.dumps(self.durations).encode())
+
+    def expected(self, job_name: str, default: float) -> float:
+        """
+        Expected duration of a job
+
+        Uses the 90th percentile of recent runs, so one fast morning doesn't
+        pull the start time too late.
+
+        Args:
+            job_name: Job name
+            default: Seconds to assume before the job has any history
+
+        Returns:
+            float: Seconds
+        """
+        history = sorted(self.durations.get(job_name, []))
+        if not history:
+            return default
+        return history[min(len(history) - 1, int(0.9 * len(history)))]
+
+    def count(self, job_name: str) -> int:
+        """Number of recorded runs for a job"""
+        return len(self.durations.get(job_name, []))
+
+class ScheduledJob:
+    """One set of reports that must be ready by a time of day"""
+
+    def __init__(self, name: str, reports: List[str], deadline: str, weekdays: Iterable[int] = range(5),
+                 parallel: int = 1, output_directory: Optional[str] = None):
+        """
+        Initialize scheduled job
+
+        Args:
+            name: Job name used in logs and duration history
+            reports: Report or group names (see reports/report_registry.py)
+            deadline: "HH:MM" the reports must be finished by
+            weekdays: Days the job runs (0=Monday ... 6=Sunday)
+            parallel: Reports run at the same time
+            output_directory: Directory for the reports (default: each report's own)
+
+        Raises:
+            KeyError: For an unknown report name
+            ValueError: For a malformed deadline
+        """
+        self.name = name
+        self.entries = resolve_reports(reports)
+        self.deadline = datetime.strptime(deadline, "%H:%M").time()
+        self.weekdays = set(weekdays)
+        self.parallel = parallel
+        self.output_directory = output_directory
+
+    def runs_on(self, day: date) -> bool:
+        """Check whether the job is scheduled on a day"""
+        return day.weekday() in self.weekdays
+
+    def deadline_on(self, day: date) -> datetime:
+        """Deadline on a given day"""
+        return datetime.combine(day, self.deadline)
+
+class ReportScheduler:
+    """
+    Starts each job early enough to meet its deadline
+
+    Usage:
+        scheduler = ReportScheduler()
+        scheduler.print_plan()
+        scheduler.run_forever()
+    """
+
+    def __init__(self, jobs: Optional[List[Dict[str, Any]]] = None, settings: Optional[Dict[str, Any]] = None):
+        """
+        Initialize scheduler
+
+        Args:
+            jobs: Job definitions (default: SCHEDULED_JOBS)
+            settings: Scheduler settings (default: SCHEDULER_SETTINGS)
+        """
+        self.settings = {**SCHEDULER_SETTINGS, **(settings or {})}
+        self.jobs = [ScheduledJob(**job) for job in (SCHEDULED_JOBS if jobs is None else jobs)]
+        self.history = DurationHistory(self.settings["durations_file"], self.settings["duration_history"])
+        self.started_at = datetime.now()
+        # (job name, day) -> "prewarmed" / "finished"
+        self._state: Dict[tuple, str] = {}
+
+    def get_timing(self, job: ScheduledJob, day: date) -> Dict[str, Any]:
+        """
+        Planned times for one job on one day
+
+        Returns:
+            dict: {'deadline', 'expected_seconds', 'start', 'prewarm'}
+        """
+        expected = self.history.expected(job.name, self.settings["default_duration_minutes"] * 60)
+        deadline = job.deadline_on(day)
+        start = deadline - timedelta(seconds=expected * (1 + self.settings["safety_margin"]))
+        return {
+            'deadline': deadline,
+            'expected_seconds': expected,
+            'start': start,
+            'prewarm': start - timedelta(minutes=self.settings["prewarm_minutes"])
+        }
+
+    def get_plan(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Next run of every job
+
+        Returns:
+            list: Timing dicts with 'job' and 'history_runs', soonest first
+        """
+        now = now or datetime.now()
+        plan = []
+        for job in self.jobs:
+            for offset in range(8):
+                day = now.date() + timedelta(days=offset)
+                if job.runs_on(day) and job.deadline_on(day) > now:
+                    plan.append({'job': job.name, 'history_runs': self.history.count(job.name), **self.get_timing(job, day)})
+                    break
+        return sorted(plan, key=lambda entry: entry['start'])
+
+    def print_plan(self):
+        """Print the next run of every job"""
+        print("⏰ SCHEDULE")
+        print("=" * 50)
+        for entry in self.get_plan():
+            source = f"learned from {entry['history_runs']} runs" if entry['history_runs'] else "default"
+            print(f"📋 {entry['job']}: ready by {entry['deadline']:%a %H:%M}")
+            print(f"   ⏱️ Expected {entry['expected_seconds'] / 60:.1f} min ({source})")
+            print(f"   🔥 Pre-warm {entry['prewarm']:%H:%M}, start {entry['start']:%H:%M}")
+
+    def log(self, event: str, **fields):
+        """Append one event to the scheduler log"""
+        log_file = self.settings["log_file"]
+        record = {'event': event, 'timestamp': datetime.now().isoformat(timespec='seconds'), **fields}
+        try:
+            directory = os.path.dirname(log_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(log_file, 'a') as file:
+                file.write(json.dumps(record, default=str) + "\n")
+        except OSError as e:
+            print(f"⚠️ Could not write scheduler log: {str(e)}")
+
+    def prewarm(self, job: ScheduledJob) -> Dict[str, Any]:
+        """
+        Warm up what a job's reports need
+
+        Imports the workflow modules, opens test connections to both databases,
+        makes sure a SEED session is saved (or waits until the warm browser has
+        logged in) and checks that each template opens. Problems are reported
+        here, minutes before the run, instead of during it.
+
+        Args:
+            job: Job about to run
+
+        Returns:
+            dict: resource -> True/False (or error message)
+        """
+        start_time = time.time()
+        resources = {resource for entry in job.entries for resource in entry.resources}
+        results = {}
+        print(f"🔥 Pre-warming {job.name}...")
+
+        try:
+            for module in sorted({entry.module for entry in job.entries}):
+                importlib.import_module(module)
+            results['modules'] = True
+        except Exception as e:
+            results['modules'] = str(e)
+
+        if "db" in resources:
+            try:
+                from database.connection import test_lightspeed_connection, test_level_connection
+                results['db'] = test_lightspeed_connection() and test_level_connection()
+            except Exception as e:
+                results['db'] = str(e)
+
+        if "seed" in resources:
+            try:
+                from config.report_config import WARM_BROWSER_ENABLED
+                if WARM_BROWSER_ENABLED:
+                    from web_automation.browser_daemon import start_warm_browser
+                    daemon = start_warm_browser(headless=True, wait=True)
+                    results['seed'] = daemon.is_ready or f"warm browser not ready: {daemon.last_error or 'still starting'}"
+                else:
+                    from utils.downloader import refresh_seed_session
+                    asyncio.run(refresh_seed_session(headless=True))
+                    results['seed'] = True
+            except Exception as e:
+                results['seed'] = str(e)
+
+        templates = sorted({entry.template for entry in job.entries if entry.template})
+        if templates:
+            # Only checks that each template opens; the run loads its own copy
+            try:
+                from openpyxl import load_workbook
+                for template in templates:
+                    load_workbook(template, read_only=True).close()
+                results['templates'] = True
+            except Exception as e:
+                results['templates'] = str(e)
+
+        elapsed = time.time() - start_time
+        for resource, result in results.items():
+            print(f"   {'✅' if result is True else '⚠️'} {resource}" + ("" if result is True else f": {result}"))
+        self.log('prewarm', job=job.name, results=results, seconds=round(elapsed, 1))
+        return results
+
+    def run_job(self, job: ScheduledJob, timing: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a job's reports and log how it did against its deadline
+
+        Args:
+            job: Job to run
+            timing: get_timing() result for today
+
+        Returns:
+            dict: {'success', 'duration', 'lead_seconds', 'missed', 'reports'}
+        """
+        from cli import run_reports
+
+        started = datetime.now()
+        late_start = max(0.0, (started - timing['start']).total_seconds())
+        print(f"🚀 Starting {job.name} (ready by {timing['deadline']:%H:%M})")
+        if late_start > 60:
+            print(f"⚠️ Starting {late_start / 60:.1f} min later than planned")
+
+        # A job restarted after a crash continues from the failed run's checkpoints
+        options = {'date': None, 'end_date': None, 'output_directory': job.output_directory, 'headless': True, 'resume': True}
+        outcomes = run_reports(job.entries, options, job.parallel)
+
+        finished = datetime.now()
+        duration = (finished - started).total_seconds()
+        lead_seconds = (timing['deadline'] - finished).total_seconds()
+        success = all(outcome['status'] != 'failed' for outcome in outcomes)
+        # Runs where every report was skipped say nothing about the job's duration
+        if success and any(outcome['status'] == 'success' for outcome in outcomes):
+            self.history.record(job.name, duration)
+
+        if lead_seconds >= 0:
+            print(f"✅ {job.name} finished {lead_seconds / 60:.1f} min before the {timing['deadline']:%H:%M} deadline")
+        else:
+            print(f"❌ {job.name} missed the {timing['deadline']:%H:%M} deadline by {-lead_seconds / 60:.1f} min")
+        if not success:
+            failed = [outcome['report'] for outcome in outcomes if outcome['status'] == 'failed']
+            print(f"❌ Failed reports: {', '.join(failed)}")
+
+        result = {
+            'success': success,
+            'duration': round(duration, 1),
+            'expected': round(timing['expected_seconds'], 1),
+            'lead_seconds': round(lead_seconds, 1),
+            'missed': lead_seconds < 0,
+            'late_start_seconds': round(late_start, 1),
+            'reports': {outcome['report']: outcome['status'] for outcome in outcomes}
+        }
+        self.log('run', job=job.name, deadline=timing['deadline'], planned_start=timing['start'],
+                 started=started, finished=finished, **result)
+        return result
+
+    def tick(self, now: Optional[datetime] = None):
+        """
+        Pre-warm or start every job that is due
+
+        Jobs run one at a time; a job held up behind another starts as soon
+        as it can and its lateness is logged.
+        """
+        now = now or datetime.now()
+        for job in self.jobs:
+            today = now.date()
+            key = (job.name, today)
+            state = self._state.get(key)
+            if state == "finished" or not job.runs_on(today):
+                continue
+
+            timing = self.get_timing(job, today)
+            if state is None and self.started_at >= timing['deadline']:
+                # Scheduler was started after today's deadline
+                self._state[key] = "finished"
+                self.log('skipped', job=job.name, deadline=timing['deadline'], reason='scheduler started after deadline')
+                continue
+
+            if state is None and now >= timing['prewarm']:
+                self.prewarm(job)
+                self._state[key] = state = "prewarmed"
+
+            if state == "prewarmed" and now >= timing['start']:
+                try:
+                    self.run_job(job, timing)
+                except Exception as e:
+                    print(f"❌ {job.name} failed: {str(e)}")
+                    self.log('run', job=job.name, deadline=timing['deadline'], success=False, error=str(e))
+                self._state[key] = "finished"
+
+    def run_forever(self):
+        """Check for due jobs until interrupted (Ctrl+C)"""
+        self.print_plan()
+        print("\n⏳ Scheduler running - press Ctrl+C to stop")
+        try:
+            while True:
+                self.tick()
+                time.sleep(self.settings["poll_seconds"])
+        finally:
+            # A warm browser started by pre-warming is stopped with the scheduler
+            browser_daemon = sys.modules.get("web_automation.browser_daemon")
+            if browser_daemon:
+                browser_daemon.stop_warm_browser()
@@ -0,0 +1,155 @@
+"""
+SEED HTTP Client
+================
+
+Browserless access to SEED pages and exports using the saved SEED session.
+Cookies come from one browser login and are reused over a pooled HTTP session.
+"""
+
+import os
+import requests
+from datetime import datetime
+from requests.adapters import HTTPAdapter
+from config.report_config import SEED_BASE_URL, PRODUCT_LIST_API_ENDPOINT, MAX_CONCURRENT_DOWNLOADS
+from utils.session_cache import SeedSessionCache
+from utils.tracing import span
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0'
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+class SeedSessionExpired(Exception):
+    """Raised when SEED answers with the login page instead of content"""
+
+def format_route_summary_path(target_date):
+    """
+    Build the RoutesSummary path for a date
+
+    Args:
+        target_date (str): Date in YYYY-MM-DD format
+
+    Returns:
+        str: Path relative to the cluster root
+    """
+    date_obj = datetime.strptime(target_date, "%Y-%m-%d")
+    formatted_date = date_obj.strftime("%m%%2F%d%%2F%Y%%2000%%3A00%%3A00")
+    return f"Scheduling/RoutesSummary?ScheduleDateOnly={formatted_date}"
+
+class SeedHttpClient:
+    """
+    Pooled HTTP session authenticated with SEED browser cookies
+    """
+
+    def __init__(self, cookies, cluster=None, pool_size=MAX_CONCURRENT_DOWNLOADS):
+        """
+        Initialize HTTP client
+
+        Args:
+            cookies (list): Playwright cookie dictionaries
+            cluster (str): SEED cluster (e.g. "cs4")
+            pool_size (int): Maximum pooled connections per host
+        """
+        self.cluster = cluster
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
+
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain'), path=cookie.get('path', '/')
+            )
+
+    @classmethod
+    def from_session_cache(cls, session_cache=None):
+        """
+        Build a client from the saved SEED session
+
+        Returns:
+            SeedHttpClient or None if there is no usable saved session
+        """
+        session = (session_cache or SeedSessionCache()).load()
+        if not session:
+            return None
+        return cls(session['storage_state'].get('cookies', []), session.get('cluster'))
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+
+    def get_cluster_url(self, path):
+        """Absolute URL for a path on the session's cluster"""
+        cluster = self.cluster or "cs1"
+        return f"{SEED_BASE_URL}/{cluster}/{path.lstrip('/')}"
+
+    def fetch_html(self, url):
+        """
+        Fetch an authenticated SEED page
+
+        Args:
+            url (str): Absolute page URL
+
+        Returns:
+            tuple: (html, final_url)
+        """
+        with span("http.get", url=url) as current:
+            response = self.session.get(url, timeout=60)
+            current.set(status=response.status_code, bytes=len(response.content))
+        self.check_response(response)
+        return response.text, response.url
+
+    def get_product_list_url(self):
+        """Product list export URL on the session's cluster"""
+        if self.cluster:
+            return PRODUCT_LIST_API_ENDPOINT.replace("/cs4/", f"/{self.cluster}/")
+        return PRODUCT_LIST_API_ENDPOINT
+
+    def check_response(self, response):
+        """
+        Verify a response is authenticated content
+
+        Raises:
+            SeedSessionExpired: If SEED redirected to the login page
+        """
+        if response.status_code in (401, 403) or "login" in response.url.lower():
+            raise SeedSessionExpired("SEED session expired")
+        response.raise_for_status()
+
+    def download_product_list(self, target_path):
+        """
+        Stream the importable product list export to disk
+
+        Args:
+            target_path (str): Where to save the .xlsx file
+
+        Returns:
+            str: Path to downloaded file
+        """
+        with span("http.product_list_export") as current, \
+                self.session.get(self.get_product_list_url(), stream=True, timeout=120) as response:
+            self.check_response(response)
+
+            content_type = response.headers.get('Content-Type', '')
+            if 'text/html' in content_type:
+                # Logged-out requests land on an HTML page instead of the workbook
+                raise SeedSessionExpired("Export returned HTML instead of Excel data")
+
+            directory = os.path.dirname(target_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            partial_path = f"{target_path}.part"
+            with open(partial_path, 'wb') as file:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    file.write(chunk)
+                current.set(bytes=file.tell())
+
+        # .xlsx files are zip archives
+        with open(partial_path, 'rb') as file:
+            if file.read(2) != b'PK':
+                os.remove(partial_path)
+                raise SeedSessionExpired("Export did not return an Excel workbook")
+
+        os.replace(partial_path, target_path)
+        return target_path
@@ -0,0 +1,122 @@
+"""
+SEED Session Cache
+==================
+
+Persists the authenticated Playwright storage state and detected cluster
+so new scrapers can skip the login round trips while the session is valid.
+Plain file I/O: the browser scrapers and the HTTP client both read it.
+"""
+
+import os
+import json
+import time
+from typing import Optional, Dict, Any
+from config.report_config import SEED_SESSION_FILE, SEED_SESSION_MAX_AGE
+from utils.file_io import write_atomic
+
+class SeedSessionCache:
+    """
+    File-backed cache of the SEED storage state with hit/login statistics
+    """
+
+    def __init__(self, state_file: str = SEED_SESSION_FILE, max_age: int = SEED_SESSION_MAX_AGE):
+        """
+        Initialize session cache
+
+        Args:
+            state_file: Path of the saved session file
+            max_age: Seconds after which a saved session is not worth trying
+        """
+        self.state_file = state_file
+        self.stats_file = os.path.splitext(state_file)[0] + "_stats.json"
+        self.max_age = max_age
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the saved session
+
+        Returns:
+            Dict with 'storage_state', 'cluster' and 'saved_at', or None if missing/too old
+        """
+        try:
+            with open(self.state_file, 'r') as file:
+                session = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - session.get('saved_at', 0) > self.max_age:
+            return None
+        return session
+
+    def save(self, storage_state: Dict[str, Any], cluster: Optional[str]):
+        """
+        Save the authenticated storage state
+
+        Args:
+            storage_state: Playwright storage state (cookies and origins)
+            cluster: Detected SEED cluster (e.g. "cs4")
+        """
+        self._write_json(self.state_file, {
+            'storage_state': storage_state,
+            'cluster': cluster,
+            'saved_at': time.time()
+        })
+
+    def clear(self):
+        """Forget the saved session (e.g. after it was rejected)"""
+        try:
+            os.remove(self.state_file)
+        except OSError:
+            pass
+
+    def get_cookies(self) -> Optional[list]:
+        """Get saved session cookies, or None if there is no usable session"""
+        session = self.load()
+        if not session:
+            return None
+        return session['storage_state'].get('cookies', [])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with hits, logins, total/last login seconds
+        """
+        try:
+            with open(self.stats_file, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {'hits': 0, 'logins': 0, 'total_login_seconds': 0.0, 'last_login_seconds': None}
+
+    def record_hit(self):
+        """Record a restored session"""
+        stats = self.get_stats()
+        stats['hits'] += 1
+        self._write_stats(stats)
+        print(f"♻️ Reused saved SEED session ({self._format_stats(stats)})")
+
+    def record_login(self, login_seconds: float):
+        """Record a full login and how long it took"""
+        stats = self.get_stats()
+        stats['logins'] += 1
+        stats['total_login_seconds'] += login_seconds
+        stats['last_login_seconds'] = login_seconds
+        self._write_stats(stats)
+        print(f"🔑 SEED login took {login_seconds:.1f}s ({self._format_stats(stats)})")
+
+    def _format_stats(self, stats: Dict[str, Any]) -> str:
+        total = stats['hits'] + stats['logins']
+        hit_rate = stats['hits'] / total * 100 if total else 0
+        return f"session cache hit rate {hit_rate:.0f}% over {total} runs"
+
+    def _write_stats(self, stats: Dict[str, Any]):
+        # Statistics never fail a login or a restored session
+        try:
+            self._write_json(self.stats_file, stats)
+        except OSError as e:
+            print(f"⚠️ Could not save session statistics: {str(e)}")
+
+    def _write_json(self, path: str, data: Dict[str, Any]):
+        # Unique temp file per writer: pooled scrapers, the sweep and the concurrent runner write at once
+        write_atomic(path, json.dumps(data).encode())
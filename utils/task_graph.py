@@ -0,0 +1,233 @@
+"""
+Task Graph Runner
+=================
+
+Runs workflow steps as a dependency graph on one asyncio event loop.
+Async steps run on the loop, blocking steps (database, file parsing) on a
+thread pool and Excel automation on a dedicated COM-initialized thread.
+Shared resources (browser, database, ...) are capped with semaphores.
+"""
+
+import time
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any, Iterable
+from utils.tracing import span
+
+# Where a step runs
+ASYNC = "async"      # Coroutine function on the event loop
+THREAD = "thread"    # Blocking function on the shared thread pool
+EXCEL = "excel"      # Blocking xlwings function on the single Excel thread
+
+def initialize_com():
+    """xlwings talks to Excel over COM, which must be initialized per thread on Windows"""
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+    except ImportError:
+        pass
+
+class TaskStep:
+    """
+    One step of a workflow
+
+    The step function receives a dict of its dependencies' results keyed by step name.
+    """
+
+    def __init__(self, name: str, function: Callable, depends_on: Iterable[str] = (),
+                 kind: str = THREAD, resource: Optional[str] = None, workflow: Optional[str] = None):
+        """
+        Initialize task step
+
+        Args:
+            name: Unique step name (e.g. "stockout.fetch")
+            function: Coroutine function (ASYNC) or plain function (THREAD/EXCEL)
+            depends_on: Names of steps that must succeed first
+            kind: ASYNC, THREAD or EXCEL
+            resource: Resource limit this step holds while running (e.g. "browser")
+            workflow: Workflow the step belongs to (default: name prefix before ".")
+        """
+        self.name = name
+        self.function = function
+        self.depends_on = list(depends_on)
+        self.kind = kind
+        self.resource = resource
+        self.workflow = workflow or name.split(".")[0]
+
+        self.status = "pending"
+        self.result = None
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds the step ran (0 if it never started)"""
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+class TaskGraph:
+    """
+    Dependency graph of steps with per-resource concurrency limits
+
+    Usage:
+        graph = TaskGraph({"browser": 1, "db": 2})
+        graph.add(TaskStep("report.fetch", fetch, resource="db"))
+        graph.add(TaskStep("report.excel", render, ["report.fetch"], kind=EXCEL))
+        await graph.run()
+    """
+
+    def __init__(self, resource_limits: Optional[Dict[str, int]] = None, max_threads: int = 8):
+        """
+        Initialize task graph
+
+        Args:
+            resource_limits: Maximum concurrent steps per resource name
+            max_threads: Size of the thread pool for THREAD steps
+        """
+        self.resource_limits = resource_limits or {}
+        self.max_threads = max_threads
+        self.steps: Dict[str, TaskStep] = {}
+        self.started_at = None
+        self.finished_at = None
+
+    def add(self, step: TaskStep) -> TaskStep:
+        """Add a step (dependencies must already be added)"""
+        if step.name in self.steps:
+            raise ValueError(f"Duplicate step: {step.name}")
+        missing = [name for name in step.depends_on if name not in self.steps]
+        if missing:
+            raise ValueError(f"Step {step.name} depends on unknown steps: {', '.join(missing)}")
+        self.steps[step.name] = step
+        return step
+
+    async def run(self) -> Dict[str, TaskStep]:
+        """
+        Run every step as soon as its dependencies have succeeded
+
+        Steps whose dependencies failed are skipped; other branches keep running.
+
+        Returns:
+            Dict of step name to finished TaskStep
+        """
+        loop = asyncio.get_running_loop()
+        semaphores = {name: asyncio.Semaphore(limit) for name, limit in self.resource_limits.items()}
+        thread_pool = ThreadPoolExecutor(max_workers=self.max_threads, thread_name_prefix="task")
+        excel_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="excel", initializer=initialize_com)
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_step(step: TaskStep):
+            # Wait for dependencies (their tasks never raise)
+            for name in step.depends_on:
+                await tasks[name]
+            failed = [name for name in step.depends_on if self.steps[name].status != "success"]
+            if failed:
+                step.status = "skipped"
+                step.error = f"dependency failed: {', '.join(failed)}"
+                return
+
+            inputs = {name: self.steps[name].result for name in step.depends_on}
+            semaphore = semaphores.get(step.resource)
+            # Acquired outside the try: a step cancelled while waiting must not release a slot it never held
+            if semaphore:
+                await semaphore.acquire()
+            try:
+                step.started_at = time.time()
+                step.status = "running"
+                with span(step.name, category="step", kind=step.kind, resource=step.resource):
+                    if step.kind == ASYNC:
+                        step.result = await step.function(inputs)
+                    else:
+                        # Run in the step's context so the run's trace follows it onto the thread
+                        executor = excel_thread if step.kind == EXCEL else thread_pool
+                        context = contextvars.copy_context()
+                        step.result = await loop.run_in_executor(executor, context.run, step.function, inputs)
+                step.status = "success"
+            except Exception as e:
+                step.status = "failed"
+                step.error = str(e)
+                print(f"❌ {step.name} failed: {str(e)}")
+            finally:
+                step.finished_at = time.time()
+                if semaphore:
+                    semaphore.release()
+
+        self.started_at = time.time()
+        try:
+            # Steps were added after their dependencies, so every awaited task exists
+            for step in self.steps.values():
+                tasks[step.name] = asyncio.create_task(run_step(step))
+            await asyncio.gather(*tasks.values())
+        finally:
+            self.finished_at = time.time()
+            thread_pool.shutdown(wait=False)
+            excel_thread.shutdown(wait=True)
+        return self.steps
+
+    def get_critical_path(self) -> List[TaskStep]:
+        """
+        Chain of steps that determined the total run time
+
+        Walks back from the last step to finish through the dependency that finished last.
+
+        Returns:
+            Steps in execution order
+        """
+        finished = [step for step in self.steps.values() if step.finished_at is not None and step.started_at is not None]
+        if not finished:
+            return []
+
+        path = [max(finished, key=lambda step: step.finished_at)]
+        while True:
+            predecessors = [self.steps[name] for name in path[-1].depends_on if self.steps[name].finished_at is not None]
+            if not predecessors:
+                break
+            path.append(max(predecessors, key=lambda step: step.finished_at))
+        return list(reversed(path))
+
+    def get_workflow_summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Status and wall time per workflow
+
+        Returns:
+            Dict of workflow name to {'success', 'elapsed', 'steps', 'error'}
+        """
+        summary = {}
+        for step in self.steps.values():
+            workflow = summary.setdefault(step.workflow, {'success': True, 'start': None, 'end': None, 'steps': [], 'error': None})
+            workflow['steps'].append(step.name)
+            if step.status != "success":
+                workflow['success'] = False
+                workflow['error'] = workflow['error'] or f"{step.name}: {step.error}"
+            if step.started_at is not None:
+                workflow['start'] = min(filter(None, [workflow['start'], step.started_at]))
+                workflow['end'] = max(filter(None, [workflow['end'], step.finished_at]))
+
+        for workflow in summary.values():
+            workflow['elapsed'] = (workflow['end'] - workflow['start']) if workflow['start'] else 0.0
+        return summary
+
+    def print_summary(self):
+        """Print per-workflow results, step timings and the critical path"""
+        total = (self.finished_at or time.time()) - (self.started_at or time.time())
+
+        print("🏁 CONCURRENT RUN SUMMARY")
+        print("=" * 50)
+        for name, workflow in self.get_workflow_summary().items():
+            status = "✅" if workflow['success'] else "❌"
+            print(f"{status} {name}: {workflow['elapsed']:.1f}s")
+            if workflow['error']:
+                print(f"   • {workflow['error']}")
+
+        print("\n⏱️ Step timings")
+        for step in sorted(self.steps.values(), key=lambda step: step.started_at or float('inf')):
+            offset = (step.started_at - self.started_at) if step.started_at else 0.0
+            print(f"   {step.name:<32} {step.status:<8} +{offset:5.1f}s  {step.duration:5.1f}s")
+
+        critical_path = self.get_critical_path()
+        if critical_path:
+            chain = " → ".join(f"{step.name} ({step.duration:.1f}s)" for step in critical_path)
+            print(f"\n🧭 Critical path: {chain}")
+        print(f"⚡ Total wall time: {total:.1f}s")
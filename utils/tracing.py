@@ -0,0 +1,298 @@
+"""
+Run Tracing
+===========
+
+Nested timing spans for one workflow run: database queries, SEED HTTP
+calls, browser navigation and Excel writes. A run's spans are written to
+trace.json in its run directory in Chrome trace format, which
+https://ui.perfetto.dev and chrome://tracing show as a timeline.
+
+Tracing is off unless TRACING_SETTINGS["enabled"] (MONUMATOR_TRACE=1) or
+--trace turns it on. While off, span() and @traced cost one context
+variable lookup.
+
+Usage:
+    with span("db.query", query="highlights") as current:
+        df = pd.read_sql(query, connection)
+        current.set(rows=len(df))
+
+    @traced("excel.save")
+    def save_workbook(self): ...
+"""
+
+import os
+import json
+import time
+import asyncio
+import threading
+import functools
+import contextvars
+from typing import Any, Dict, List, Optional
+from config.report_config import TRACING_SETTINGS
+
+_enabled = TRACING_SETTINGS["enabled"]
+_current_trace: contextvars.ContextVar = contextvars.ContextVar("monumator_trace", default=None)
+_current_span: contextvars.ContextVar = contextvars.ContextVar("monumator_span", default=None)
+_active_traces: List["RunTrace"] = []
+
+TRACE_FILE = "trace.json"
+
+def set_tracing(enabled: bool):
+    """Turn tracing on or off for runs started from now on"""
+    global _enabled
+    _enabled = enabled
+
+def is_tracing_enabled() -> bool:
+    """Check whether new runs are traced"""
+    return _enabled
+
+class RunTrace:
+    """Spans of one workflow run"""
+
+    def __init__(self, workflow: str, max_spans: int = TRACING_SETTINGS["max_spans"]):
+        """
+        Initialize run trace
+
+        Args:
+            workflow: Workflow name
+            max_spans: Spans kept; later ones are only counted
+        """
+        self.workflow = workflow
+        self.max_spans = max_spans
+        self.started_at = time.time()
+        self.dropped = 0
+        self._origin = time.perf_counter()
+        self._events: List[Dict[str, Any]] = []
+        self._tracks: Dict[tuple, int] = {}
+        self._track_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._token = None
+
+    def get_track(self) -> int:
+        """
+        Timeline row for the calling code
+
+        Each thread gets a row, and so does each asyncio task, so spans of
+        concurrent tasks (browser tabs, gathered downloads) don't overlap.
+        """
+        thread = threading.current_thread()
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = (thread.ident, id(task) if task else None)
+        with self._lock:
+            track = self._tracks.get(key)
+            if track is None:
+                track = self._tracks[key] = len(self._tracks) + 1
+                self._track_names[track] = f"{thread.name} / {task.get_name()}" if task else thread.name
+        return track
+
+    def add(self, span: "Span", end: float):
+        """Record a finished span"""
+        event = {
+            'name': span.name,
+            'cat': span.category,
+            'ph': "X",
+            'ts': round((span.start - self._origin) * 1_000_000, 1),
+            'dur': round((end - span.start) * 1_000_000, 1),
+            'pid': 1,
+            'tid': span.track,
+            'args': span.attributes
+        }
+        with self._lock:
+            if len(self._events) < self.max_spans:
+                self._events.append(event)
+            else:
+                self.dropped += 1
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Trace in Chrome trace event format"""
+        with self._lock:
+            events = list(self._events)
+            track_names = dict(self._track_names)
+        metadata = [{'name': "process_name", 'ph': "M", 'pid': 1, 'tid': 0, 'args': {'name': self.workflow}}]
+        metadata += [{'name': "thread_name", 'ph': "M", 'pid': 1, 'tid': track, 'args': {'name': name}}
+                     for track, name in track_names.items()]
+        return {
+            'traceEvents': metadata + events,
+            'displayTimeUnit': "ms",
+            'otherData': {'workflow': self.workflow, 'started_at': self.started_at, 'dropped_spans': self.dropped}
+        }
+
+    def write(self, directory: str) -> str:
+        """
+        Write trace.json to a run directory
+
+        Returns:
+            str: Path of the trace file
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, TRACE_FILE)
+        with open(path, 'w') as file:
+            json.dump(self.to_chrome_trace(), file, default=str)
+        return path
+
+class Span:
+    """One timed operation; use as a context manager"""
+
+    __slots__ = ('trace', 'name', 'category', 'attributes', 'start', 'track', '_token')
+
+    def __init__(self, trace: RunTrace, name: str, category: str, attributes: Dict[str, Any]):
+        self.trace = trace
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        self.start = 0.0
+        self.track = 0
+        self._token = None
+
+    def set(self, **attributes):
+        """Add attributes (row counts, sizes, ...)"""
+        self.attributes.update(attributes)
+
+    def __enter__(self):
+        self.track = self.trace.get_track()
+        self._token = _current_span.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.attributes['error'] = f"{exc_type.__name__}: {exc_val}"
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            _current_span.set(None)  # Exited in a different context than it was entered
+        self.trace.add(self, end)
+        return False
+
+class _NoopSpan:
+    """Stand-in used while tracing is off"""
+
+    __slots__ = ()
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+_NOOP_SPAN = _NoopSpan()
+
+def current_trace() -> Optional[RunTrace]:
+    """Trace of the run the calling code belongs to (None while not tracing)"""
+    trace = _current_trace.get()
+    if trace is None and len(_active_traces) == 1:
+        # Code that lost the run's context can only be attributed when a single run is traced
+        trace = _active_traces[0]
+    return trace
+
+def set_current_trace(trace: Optional[RunTrace]):
+    """
+    Make a trace current in the calling context
+
+    Used where work crosses into a context that didn't inherit the run's, such
+    as a task on the warm browser's event loop.
+
+    Args:
+        trace: current_trace() captured by the caller
+    """
+    _current_trace.set(trace)
+
+def span(name: str, category: Optional[str] = None, **attributes):
+    """
+    Time a block as a span
+
+    Args:
+        name: Span name, e.g. "db.query"; the part before the first dot is the default category
+        category: Category shown in the viewer
+        **attributes: Values attached to the span
+
+    Returns:
+        Context manager yielding the span (a no-op while not tracing)
+    """
+    trace = current_trace()
+    if trace is None:
+        return _NOOP_SPAN
+    return Span(trace, name, category or name.split(".", 1)[0], attributes)
+
+def annotate(**attributes):
+    """Add attributes to the innermost open span (no-op while not tracing)"""
+    current = _current_span.get()
+    if current is not None:
+        current.set(**attributes)
+
+def traced(name: Optional[str] = None, **attributes):
+    """
+    Decorator that runs a function or coroutine function inside a span
+
+    Args:
+        name: Span name (default: module.function)
+        **attributes: Values attached to every span
+    """
+    def decorator(func):
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if current_trace() is None:
+                    return await func(*args, **kwargs)
+                with span(span_name, **attributes):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if current_trace() is None:
+                return func(*args, **kwargs)
+            with span(span_name, **attributes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def start_trace(workflow: str) -> Optional[RunTrace]:
+    """
+    Begin tracing a run in the current context
+
+    Returns:
+        RunTrace or None: None while tracing is off
+    """
+    if not _enabled:
+        return None
+    trace = RunTrace(workflow)
+    trace._token = _current_trace.set(trace)
+    _active_traces.append(trace)
+    return trace
+
+def finish_trace(trace: Optional[RunTrace], directory: str) -> Optional[str]:
+    """
+    Stop tracing a run and write its trace file
+
+    Args:
+        trace: start_trace() result
+        directory: Run directory
+
+    Returns:
+        str or None: Path of the trace file
+    """
+    if trace is None:
+        return None
+    if trace in _active_traces:
+        _active_traces.remove(trace)
+    try:
+        _current_trace.reset(trace._token)
+    except ValueError:
+        _current_trace.set(None)
+    try:
+        path = trace.write(directory)
+        print(f"🧭 Trace written to {path} (open in https://ui.perfetto.dev)")
+        return path
+    except OSError as e:
+        print(f"⚠️ Could not write trace: {str(e)}")
+        return None
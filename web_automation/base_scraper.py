@@ -5,28 +5,52 @@ Base Web Scraper - Playwright Edition
 Async browser automation with Firefox and Playwright.
 Handles browser setup, cleanup, and common utilities.
 """
+import time
 from typing import Optional
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from playwright.async_api import TimeoutError as PlaywrightTimeout
+from config.report_config import BROWSER_RECYCLE_SETTINGS
+from utils.process_memory import get_browser_memory_mb
+from .resource_policy import ResourcePolicy
+from .browser_metrics import BrowserMetrics
+from utils.tracing import traced
 
 class BaseScraper:
     """
     Base class for async web scraping with Playwright and Firefox
     """
     
-    def __init__(self, headless: bool = True):
+    # Network resource policy profile (config RESOURCE_POLICY_PROFILES), None = load everything
+    resource_profile: Optional[str] = None
+    
+    # Count pool leases toward the pool's page totals (False for health probes)
+    count_pages = True
+    
+    def __init__(self, headless: bool = True, pool=None):
         """
         Initialize base scraper
         
         Args:
             headless: Run browser in headless mode
+            pool: Optional BrowserPool to lease a context from instead of launching Firefox
         """
         self.headless = headless
+        self.pool = pool
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.resource_policy: Optional[ResourcePolicy] = None
+        
+        # Long-session recycling (see checkpoint_page)
+        self.recycle_settings = dict(BROWSER_RECYCLE_SETTINGS)
+        self.metrics = BrowserMetrics(type(self).__name__)
+        self.total_navigations = 0
+        self.page_navigations = 0
+        self.context_navigations = 0
+        self.last_memory_mb: Optional[float] = None
         
+    @traced("browser.setup")
     async def setup_browser(self) -> Page:
         """
         Setup Firefox browser with optimized configuration
@@ -34,27 +58,17 @@ class BaseScraper:
         Returns:
             Page: Configured browser page
         """
+        if self.pool:
+            self.context, self.page = await self.pool.acquire(count=self.count_pages)
+            await self.apply_resource_policy()
+            return self.page
+        
         print("🦊 Setting up Firefox browser...")
         
         try:
             # Start Playwright
             self.playwright = await async_playwright().start()
-            
-            # Launch Firefox with persistent profile for extensions
-            self.context = await self.playwright.firefox.launch_persistent_context(
-                user_data_dir="./web_automation/firefox_profile",
-                headless=self.headless,
-                viewport={'width': 1024, 'height': 600},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0',
-                accept_downloads=True,
-                ignore_https_errors=True
-            )
-            
-            # Set default timeout
-            self.context.set_default_timeout(10000)
-            
-            # Use existing page from persistent context
-            self.page = self.context.pages[0]
+            await self.launch_persistent_context()
             
             print("✅ Firefox browser setup complete")
             return self.page
@@ -64,10 +78,152 @@ class BaseScraper:
             await self.cleanup_browser()
             raise
     
+    async def launch_persistent_context(self):
+        """Launch Firefox with the persistent profile and use its first page"""
+        # Launch Firefox with persistent profile for extensions
+        self.context = await self.playwright.firefox.launch_persistent_context(
+            user_data_dir="./web_automation/firefox_profile",
+            headless=self.headless,
+            viewport={'width': 1024, 'height': 600},
+            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0',
+            accept_downloads=True,
+            ignore_https_errors=True
+        )
+        
+        # Set default timeout
+        self.context.set_default_timeout(10000)
+        await self.apply_resource_policy()
+        
+        # Use existing page from persistent context
+        self.page = self.context.pages[0]
+    
+    async def checkpoint_page(self, allow_recycle: bool = True) -> Page:
+        """
+        Count a navigation, sample browser memory and recycle past the thresholds
+        
+        Call between units of work (e.g. after returning to a summary page), where
+        the current URL is a safe place to resume from.
+        
+        Args:
+            allow_recycle: False while other tabs of this context are still working
+            
+        Returns:
+            Page: The page to keep working with (replaced after a recycle)
+        """
+        self.total_navigations += 1
+        self.page_navigations += 1
+        self.context_navigations += 1
+        settings = self.recycle_settings
+        
+        if self.total_navigations % settings['sample_every'] == 0:
+            memory = get_browser_memory_mb()
+            self.last_memory_mb = memory['rss_mb'] if memory else None
+            open_pages = len(self.context.pages) if self.context else 0
+            self.metrics.record_sample(self.total_navigations, open_pages, self.last_memory_mb)
+            
+            if allow_recycle and self.last_memory_mb is not None and self.last_memory_mb >= settings['max_browser_memory_mb']:
+                await self.recycle_context(f"browser using {self.last_memory_mb:.0f} MB")
+                return self.page
+        
+        if not allow_recycle:
+            return self.page
+        if self.context_navigations >= settings['max_pages_per_context']:
+            await self.recycle_context(f"{self.context_navigations} navigations on this context")
+        elif self.page_navigations >= settings['max_navigations_per_page']:
+            await self.recycle_page(f"{self.page_navigations} navigations on this page")
+        return self.page
+    
+    async def recycle_page(self, reason: str):
+        """
+        Replace the current page with a fresh one at the same URL
+        
+        Args:
+            reason: Threshold that triggered the recycle (for metrics)
+        """
+        start_time = time.time()
+        memory_before = self.last_memory_mb
+        current_url = self.page.url
+        
+        new_page = await self.context.new_page()
+        if current_url and current_url != "about:blank":
+            await new_page.goto(current_url, wait_until="domcontentloaded")
+        await self.page.close()
+        self.page = new_page
+        self.page_navigations = 0
+        
+        self._record_recycle("page", reason, start_time, memory_before)
+    
+    async def recycle_context(self, reason: str):
+        """
+        Replace the browser context, carrying the cookies and URL over
+        
+        Pooled scrapers lease a new context; the persistent context is relaunched,
+        which restarts the Firefox process and returns its memory.
+        
+        Args:
+            reason: Threshold that triggered the recycle (for metrics)
+        """
+        print(f"♻️ Recycling browser context: {reason}")
+        start_time = time.time()
+        memory_before = self.last_memory_mb
+        current_url = self.page.url if self.page else None
+        cookies = (await self.context.storage_state())['cookies']
+        
+        if self.resource_policy:
+            self.release_resource_policy()
+            await self.resource_policy.detach(self.context)
+            self.resource_policy = None
+        
+        if self.pool:
+            await self.pool.release(self.context, self.page, discard=True)
+            self.context, self.page = await self.pool.acquire(count=self.count_pages)
+            await self.apply_resource_policy()
+        else:
+            await self.context.close()
+            await self.launch_persistent_context()
+        
+        await self.context.add_cookies(cookies)
+        if current_url and current_url != "about:blank":
+            await self.page.goto(current_url, wait_until="domcontentloaded")
+        self.page_navigations = 0
+        self.context_navigations = 0
+        
+        self._record_recycle("context", reason, start_time, memory_before)
+    
+    def _record_recycle(self, kind: str, reason: str, start_time: float, memory_before: Optional[float]):
+        memory = get_browser_memory_mb()
+        self.last_memory_mb = memory['rss_mb'] if memory else None
+        self.metrics.record_recycle(kind, reason, time.time() - start_time, memory_before, self.last_memory_mb)
+    
+    async def apply_resource_policy(self):
+        """Attach this scraper's network resource policy to the context"""
+        if self.resource_profile and self.context:
+            self.resource_policy = ResourcePolicy(self.resource_profile)
+            await self.resource_policy.attach(self.context)
+    
+    def release_resource_policy(self):
+        """Report blocked requests and bytes loaded"""
+        if self.resource_policy:
+            self.resource_policy.print_summary()
+    
+    @traced("browser.cleanup")
     async def cleanup_browser(self):
         """
         Clean up browser resources
         """
+        self.release_resource_policy()
+        self.metrics.print_summary()
+        self.metrics.flush()
+        if self.pool:
+            if self.context and self.resource_policy:
+                await self.resource_policy.detach(self.context)
+            self.resource_policy = None
+            if self.context:
+                await self.pool.release(self.context, self.page)
+            self.page = None
+            self.context = None
+            return
+        
         try:
             if self.page:
                 await self.page.close()
@@ -80,6 +236,7 @@ class BaseScraper:
         except Exception as e:
             print(f"⚠️ Browser cleanup warning: {str(e)}")
         finally:
+            self.resource_policy = None
             self.page = None
             self.context = None
             self.browser = None
@@ -0,0 +1,276 @@
+"""
+Warm Browser Daemon - Playwright Edition
+=======================================
+
+Keeps one Firefox browser with a logged-in SEED context alive while
+Monumator is running, so menu actions skip the browser launch and login.
+Runs its own event loop on a background thread; scrapers run on that loop
+through run().
+"""
+
+import time
+import asyncio
+import threading
+from typing import Optional, Callable, Awaitable, Any, Dict
+from config.report_config import WARM_BROWSER_SETTINGS
+from utils.process_memory import get_browser_memory_mb
+from utils.tracing import current_trace, set_current_trace
+from .browser_pool import BrowserPool
+
+class WarmBrowserDaemon:
+    """
+    Background browser server shared across menu actions
+
+    Usage:
+        daemon = WarmBrowserDaemon(headless=True).start()
+        routes = daemon.run(lambda pool: scrape(InventoryConfirmationScraper(pool=pool)))
+        daemon.stop()
+    """
+
+    def __init__(self, headless: bool = True, settings: Optional[Dict[str, Any]] = None):
+        """
+        Initialize warm browser daemon
+
+        Args:
+            headless: Run browser in headless mode
+            settings: Overrides for WARM_BROWSER_SETTINGS
+        """
+        self.headless = headless
+        self.settings = {**WARM_BROWSER_SETTINGS, **(settings or {})}
+
+        self.pool: Optional[BrowserPool] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._stopping = False
+        self._health_task = None
+        self._restart_lock = None
+
+        self.started_at = None
+        self.restarts = 0
+        self.recycles = 0
+        self.last_health_check = None
+        self.last_error = None
+
+    def start(self, wait: bool = False) -> "WarmBrowserDaemon":
+        """
+        Start the background loop and warm the browser
+
+        Args:
+            wait: Block until the first login has finished (up to startup_timeout)
+        """
+        if not (self.thread and self.thread.is_alive()):
+            self._stopping = False
+            self._ready.clear()
+            self.loop = asyncio.new_event_loop()
+            self.thread = threading.Thread(target=self._run_loop, name="warm-browser", daemon=True)
+            self.thread.start()
+
+        # Also waits when an earlier start() is still logging in
+        if wait:
+            self._ready.wait(timeout=self.settings['startup_timeout'])
+        return self
+
+    def _run_loop(self):
+        """Background thread body"""
+        asyncio.set_event_loop(self.loop)
+        self._restart_lock = asyncio.Lock()
+        self._health_task = self.loop.create_task(self._health_loop())
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    async def _warm_up(self) -> bool:
+        """Launch Firefox and log one pooled context in to SEED"""
+        from .seed_browser import SeedBrowser
+
+        self.pool = BrowserPool(
+            headless=self.headless,
+            max_pages=self.settings['max_concurrent_pages'],
+            max_context_uses=self.settings['max_pages']
+        )
+        await self.pool.start()
+
+        seed = SeedBrowser(headless=self.headless, pool=self.pool)
+        try:
+            logged_in = await seed.setup_and_login()
+        finally:
+            await seed.cleanup_browser()
+
+        if not logged_in:
+            raise Exception("Warm browser could not log in to SEED")
+        self.started_at = time.time()
+        print("🔥 Warm browser ready")
+        return True
+
+    async def _restart(self, reason: str):
+        """Close the current browser and warm a new one"""
+        async with self._restart_lock:
+            print(f"♻️ Restarting warm browser: {reason}")
+            if self.pool:
+                await self.pool.close()
+                self.pool = None
+            await self._warm_up()
+
+    async def verify_session(self) -> bool:
+        """Lease the warm context, load Home and confirm we are still logged in"""
+        from .seed_browser import SeedBrowser
+
+        seed = SeedBrowser(headless=self.headless, pool=self.pool)
+        seed.count_pages = False  # Probes are not pages served
+        try:
+            await seed.setup_browser()
+            if await seed.restore_session():
+                self.pool.mark_session_verified(seed.context)
+                return True
+            return await seed.setup_and_login(force_login=True)
+        finally:
+            await seed.cleanup_browser()
+
+    def needs_recycle(self) -> Optional[str]:
+        """
+        Reason to recycle the browser, or None
+
+        Returns:
+            str or None: Page or memory limit that was reached
+        """
+        if self.pool.pages_leased >= self.settings['max_pages']:
+            return f"{self.pool.pages_leased} pages served"
+
+        memory = get_browser_memory_mb()
+        if memory and memory['rss_mb'] >= self.settings['max_memory_mb']:
+            return f"browser using {memory['rss_mb']:.0f} MB"
+        return None
+
+    async def _health_loop(self):
+        """Warm up, then check health and recycle until stopped"""
+        while not self._stopping:
+            try:
+                if not self.pool or not self.pool.browser or not self.pool.browser.is_connected():
+                    if self.pool:
+                        self.restarts += 1
+                        await self._restart("browser disconnected")
+                    else:
+                        await self._warm_up()
+                elif self.pool.active_leases == 0:
+                    # Only recycle or probe while no scraper is using the browser
+                    reason = self.needs_recycle()
+                    if reason:
+                        self.recycles += 1
+                        await self._restart(reason)
+                    elif not await self.verify_session():
+                        self.restarts += 1
+                        await self._restart("SEED session lost")
+
+                self.last_health_check = time.time()
+                self.last_error = None
+                self._ready.set()
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"⚠️ Warm browser health check failed: {str(e)}")
+
+            await asyncio.sleep(self.settings['health_check_interval'])
+
+    @property
+    def is_ready(self) -> bool:
+        """True when the browser is up and has logged in"""
+        return (self._ready.is_set() and self.pool is not None
+                and self.pool.browser is not None and self.pool.browser.is_connected())
+
+    def run(self, coroutine_function: Callable[[BrowserPool], Awaitable[Any]], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the daemon loop with the warm pool
+
+        Playwright objects belong to the loop that created them, so callers pass a
+        function that builds the coroutine instead of a coroutine from their own loop.
+
+        Args:
+            coroutine_function: Called with the BrowserPool, returns a coroutine
+            timeout: Seconds to wait for the result
+
+        Returns:
+            Whatever the coroutine returns
+        """
+        if not self._ready.wait(timeout=self.settings['startup_timeout']) or not self.is_ready:
+            raise Exception(f"Warm browser is not ready: {self.last_error or 'still starting'}")
+
+        # The daemon loop's tasks don't inherit the caller's context, so carry the run's trace over
+        trace = current_trace()
+
+        async def call():
+            set_current_trace(trace)
+            # Let a restart in progress finish before leasing
+            async with self._restart_lock:
+                pool = self.pool
+            return await coroutine_function(pool)
+
+        future = asyncio.run_coroutine_threadsafe(call(), self.loop)
+        return future.result(timeout=timeout)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Daemon health details for the status screen
+
+        Returns:
+            dict: ready, uptime, pages served, health probes, memory, restarts, recycles, last error
+        """
+        memory = get_browser_memory_mb()
+        return {
+            'ready': self.is_ready,
+            'uptime': time.time() - self.started_at if self.started_at else 0,
+            'pages_served': self.pool.pages_leased if self.pool else 0,
+            'health_probes': self.pool.probe_leases if self.pool else 0,
+            'active_leases': self.pool.active_leases if self.pool else 0,
+            'memory_mb': memory['rss_mb'] if memory else None,
+            'restarts': self.restarts,
+            'recycles': self.recycles,
+            'last_health_check': self.last_health_check,
+            'last_error': self.last_error
+        }
+
+    def stop(self):
+        """Close the browser and stop the background loop"""
+        if not self.loop or not self.thread:
+            return
+        self._stopping = True
+
+        async def shutdown():
+            if self._health_task:
+                self._health_task.cancel()
+            if self.pool:
+                await self.pool.close()
+                self.pool = None
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result(timeout=30)
+        except Exception as e:
+            print(f"⚠️ Warm browser shutdown warning: {str(e)}")
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=10)
+            self.thread = None
+            self._ready.clear()
+
+
+_warm_browser: Optional[WarmBrowserDaemon] = None
+
+def start_warm_browser(headless: bool = True, wait: bool = False) -> WarmBrowserDaemon:
+    """Start the shared warm browser (once), optionally waiting until it has logged in"""
+    global _warm_browser
+    if _warm_browser is None:
+        _warm_browser = WarmBrowserDaemon(headless=headless)
+    return _warm_browser.start(wait)
+
+def get_warm_browser() -> Optional[WarmBrowserDaemon]:
+    """The running warm browser, or None when it was not started"""
+    if _warm_browser and _warm_browser.thread and _warm_browser.thread.is_alive():
+        return _warm_browser
+    return None
+
+def stop_warm_browser():
+    """Stop the shared warm browser if it is running"""
+    global _warm_browser
+    if _warm_browser:
+        _warm_browser.stop()
+        _warm_browser = None
@@ -0,0 +1,111 @@
+"""
+Browser Metrics
+===============
+
+Memory samples and page/context recycle events for one scraper session,
+appended to a JSON-lines file so long sweeps can be charted afterwards.
+"""
+
+import os
+import json
+import time
+from typing import Optional, Dict, Any, List
+from config.report_config import BROWSER_METRICS_FILE
+
+class BrowserMetrics:
+    """
+    Collects browser memory samples and recycle events
+    """
+
+    def __init__(self, scraper_name: str, metrics_file: str = BROWSER_METRICS_FILE):
+        """
+        Initialize browser metrics
+
+        Args:
+            scraper_name: Scraper class name recorded with every event
+            metrics_file: JSON-lines file events are appended to
+        """
+        self.scraper_name = scraper_name
+        self.metrics_file = metrics_file
+        self.session_started = time.time()
+        self.samples: List[Dict[str, Any]] = []
+        self.recycles: List[Dict[str, Any]] = []
+        self._unsaved: List[Dict[str, Any]] = []
+
+    def _event(self, event_type: str, **fields) -> Dict[str, Any]:
+        event = {
+            'type': event_type,
+            'scraper': self.scraper_name,
+            'timestamp': time.time(),
+            'elapsed': time.time() - self.session_started,
+            **fields
+        }
+        self._unsaved.append(event)
+        return event
+
+    def record_sample(self, navigations: int, open_pages: int, memory_mb: Optional[float]):
+        """
+        Record one memory sample
+
+        Args:
+            navigations: Navigations since the session started
+            open_pages: Pages open in the current context
+            memory_mb: Firefox RSS in MB (None without psutil)
+        """
+        self.samples.append(self._event('sample', navigations=navigations, open_pages=open_pages, memory_mb=memory_mb))
+
+    def record_recycle(self, kind: str, reason: str, seconds: float, memory_before: Optional[float], memory_after: Optional[float]):
+        """
+        Record a page or context recycle
+
+        Args:
+            kind: "page" or "context"
+            reason: Threshold that triggered it
+            seconds: Time spent recycling
+            memory_before: Firefox RSS before, in MB
+            memory_after: Firefox RSS after, in MB
+        """
+        self.recycles.append(self._event(
+            'recycle', kind=kind, reason=reason, seconds=seconds,
+            memory_before_mb=memory_before, memory_after_mb=memory_after
+        ))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Session summary
+
+        Returns:
+            dict: samples, peak memory, page/context recycles and time spent recycling
+        """
+        memory_values = [sample['memory_mb'] for sample in self.samples if sample['memory_mb'] is not None]
+        return {
+            'samples': len(self.samples),
+            'peak_memory_mb': max(memory_values) if memory_values else None,
+            'page_recycles': sum(1 for event in self.recycles if event['kind'] == 'page'),
+            'context_recycles': sum(1 for event in self.recycles if event['kind'] == 'context'),
+            'recycle_seconds': sum(event['seconds'] for event in self.recycles)
+        }
+
+    def print_summary(self):
+        """Print a one-line summary when anything was recorded"""
+        stats = self.get_stats()
+        if not stats['samples'] and not self.recycles:
+            return
+        peak = f"{stats['peak_memory_mb']:.0f} MB" if stats['peak_memory_mb'] is not None else "n/a"
+        print(f"🧠 Browser memory peak {peak}, {stats['page_recycles']} page / "
+              f"{stats['context_recycles']} context recycles ({stats['recycle_seconds']:.1f}s)")
+
+    def flush(self):
+        """Append unsaved events to the metrics file"""
+        if not self._unsaved or not self.metrics_file:
+            return
+        try:
+            directory = os.path.dirname(self.metrics_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.metrics_file, 'a') as file:
+                for event in self._unsaved:
+                    file.write(json.dumps(event) + "\n")
+            self._unsaved = []
+        except OSError as e:
+            print(f"⚠️ Could not save browser metrics: {str(e)}")
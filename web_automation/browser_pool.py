@@ -0,0 +1,181 @@
+"""
+Shared Browser Pool - Playwright Edition
+========================================
+
+Launches Firefox once per run and hands out isolated contexts and pages
+with the saved SEED session preloaded. Caps concurrent pages and recycles
+contexts after a number of uses.
+"""
+
+import time
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional, List, Tuple
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from utils.session_cache import SeedSessionCache
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0'
+
+class BrowserPool:
+    """
+    One Firefox process shared by several scrapers
+
+    Usage:
+        async with BrowserPool(headless=True, max_pages=3) as pool:
+            items = ItemsScraper(pool=pool)
+            confirmation = InventoryConfirmationScraper(pool=pool)
+    """
+
+    def __init__(self, headless: bool = True, max_pages: int = 4, max_context_uses: int = 20):
+        """
+        Initialize browser pool
+
+        Args:
+            headless: Run browser in headless mode
+            max_pages: Maximum pages leased at the same time
+            max_context_uses: Leases before a context is closed and replaced
+        """
+        self.headless = headless
+        self.max_pages = max_pages
+        self.max_context_uses = max_context_uses
+        self.session_cache = SeedSessionCache()
+
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        self._page_slots = asyncio.Semaphore(max_pages)
+        self._idle_contexts: List[BrowserContext] = []
+        self._context_uses = {}
+        self._launch_lock = asyncio.Lock()
+
+        self.pages_leased = 0
+        self.probe_leases = 0
+        self.active_leases = 0
+        self._session_verified_at = {}
+
+    async def start(self) -> "BrowserPool":
+        """Launch Firefox (once)"""
+        async with self._launch_lock:
+            if self.browser and self.browser.is_connected():
+                return self
+
+            print("🦊 Launching shared Firefox browser...")
+            if not self.playwright:
+                self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.firefox.launch(headless=self.headless)
+            self._idle_contexts = []
+            self._context_uses = {}
+            print("✅ Shared Firefox browser ready")
+        return self
+
+    async def new_context(self) -> BrowserContext:
+        """Create a context with the saved SEED session preloaded"""
+        session = self.session_cache.load()
+        context = await self.browser.new_context(
+            storage_state=session['storage_state'] if session else None,
+            viewport={'width': 1024, 'height': 600},
+            user_agent=USER_AGENT,
+            accept_downloads=True,
+            ignore_https_errors=True
+        )
+        context.set_default_timeout(10000)
+        self._context_uses[context] = 0
+        return context
+
+    async def acquire(self, count: bool = True) -> Tuple[BrowserContext, Page]:
+        """
+        Lease an isolated context and a fresh page
+
+        Waits while max_pages leases are outstanding.
+
+        Args:
+            count: Count the lease toward pages_leased and the context's uses
+                   (False for health probes, which are not pages served)
+
+        Returns:
+            Tuple of (context, page)
+        """
+        await self._page_slots.acquire()
+        try:
+            await self.start()
+            context = self._idle_contexts.pop() if self._idle_contexts else await self.new_context()
+            page = await context.new_page()
+            if count:
+                self._context_uses[context] += 1
+                self.pages_leased += 1
+            else:
+                self.probe_leases += 1
+            self.active_leases += 1
+            return context, page
+        except Exception:
+            self._page_slots.release()
+            raise
+
+    async def release(self, context: BrowserContext, page: Optional[Page] = None, discard: bool = False):
+        """
+        Return a leased context, recycling it once it has been used enough
+
+        Args:
+            context: Context from acquire()
+            page: Page from acquire()
+            discard: Close the context instead of keeping it for reuse
+        """
+        self.active_leases -= 1
+        try:
+            for open_page in list(context.pages):
+                await open_page.close()
+
+            if discard or self._context_uses.get(context, 0) >= self.max_context_uses or not self.browser.is_connected():
+                self._context_uses.pop(context, None)
+                self._session_verified_at.pop(context, None)
+                await context.close()
+            else:
+                self._idle_contexts.append(context)
+        except Exception as e:
+            print(f"⚠️ Browser pool release warning: {str(e)}")
+            self._context_uses.pop(context, None)
+            self._session_verified_at.pop(context, None)
+        finally:
+            self._page_slots.release()
+
+    def mark_session_verified(self, context: BrowserContext):
+        """Record that a context was just confirmed to be logged in to SEED"""
+        self._session_verified_at[context] = time.time()
+
+    def is_session_fresh(self, context: BrowserContext, max_age: float = 120) -> bool:
+        """Check whether a context was confirmed logged in within max_age seconds"""
+        return time.time() - self._session_verified_at.get(context, 0) < max_age
+
+    @asynccontextmanager
+    async def lease(self):
+        """Async context manager around acquire()/release()"""
+        context, page = await self.acquire()
+        try:
+            yield context, page
+        finally:
+            await self.release(context, page)
+
+    async def close(self):
+        """Close all contexts, the browser and Playwright"""
+        try:
+            for context in list(self._context_uses):
+                await context.close()
+            if self.browser:
+                await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+        except Exception as e:
+            print(f"⚠️ Browser pool cleanup warning: {str(e)}")
+        finally:
+            self._idle_contexts = []
+            self._context_uses = {}
+            self._session_verified_at = {}
+            self.browser = None
+            self.playwright = None
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
@@ -5,118 +5,392 @@ Inventory Confirmation Scraper - Simplified
 Checks SEED routes for incomplete inventory, excluding FF/STATIC assets.
 """
 
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urljoin
+from playwright.async_api import Page
+from config.report_config import ROUTE_DRILL_DOWN_CONCURRENCY, ROUTE_HTTP_CONCURRENCY
+from utils.seed_http import SeedHttpClient, SeedSessionExpired, format_route_summary_path
+from utils.html_tables import parse_table_rows
+from utils.route_result_cache import RouteResultCache
+from utils.route_records import AssetRecord, RouteRecord, AssetBatch
+from utils.tracing import span, traced
 from .seed_browser import SeedBrowser
 
+# Route data rows start at row 6 of the routes summary page
+SUMMARY_FIRST_ROUTE_ROW = 6
+
+# Assets containing these keywords don't need inventory confirmation
+EXCLUDED_ASSET_KEYWORDS = ['COFFEE', 'FF', 'STATIC', 'CONDIMENT']
+
+class PageNeedsBrowser(Exception):
+    """Raised when fetched HTML has no usable tables (content is rendered by JavaScript)"""
+
+def has_detail_url(href: Optional[str]) -> bool:
+    """Check whether a route link can be opened by URL (not missing, not a javascript: handler)"""
+    return bool(href) and not href.startswith("javascript")
+
+def parse_route_summary_rows(rows: List[Dict[str, List]]) -> List[Tuple[str, int, Optional[str]]]:
+    """
+    Find routes with missing inventory in extracted routes summary rows
+
+    Args:
+        rows: Rows from SeedBrowser.extract_table_rows()
+
+    Returns:
+        List of (route_name, missing_count, detail_href)
+    """
+    routes_with_missing = []
+
+    for row in rows[SUMMARY_FIRST_ROUTE_ROW:]:
+        cells = row['cells']
+        if len(cells) < 5:
+            continue
+
+        route_name = cells[1]
+        missing_text = cells[4]
+
+        # Only process routes with missing inventory
+        if route_name.startswith('Rt') and missing_text.isdigit():
+            routes_with_missing.append((route_name, int(missing_text), row['hrefs'][4]))
+
+    return routes_with_missing
+
+def parse_incomplete_asset_rows(rows: List[Dict[str, List]]) -> List[AssetRecord]:
+    """
+    Find incomplete (YES/NO) assets in extracted route detail rows
+
+    Args:
+        rows: Rows from SeedBrowser.extract_table_rows()
+
+    Returns:
+        List of incomplete AssetRecords
+    """
+    incomplete_assets = []
+
+    for row in rows:
+        cells = row['cells']
+
+        # Only rows with a YES/NO status cell
+        if len(cells) < 5 or not any(' '.join(cell.split()) == 'YES/NO' for cell in cells):
+            continue
+
+        asset_id, location, asset_type, restock_time, inventory_status = cells[:5]
+
+        # Skip if contains excluded keywords
+        combined_text = f"{asset_id} {asset_type}".upper()
+        if any(x in combined_text for x in EXCLUDED_ASSET_KEYWORDS):
+            continue
+
+        # Track this incomplete asset with all required fields
+        incomplete_assets.append(AssetRecord(asset_id, location, asset_type, restock_time, inventory_status))
+
+    return incomplete_assets
+
 class InventoryConfirmationScraper(SeedBrowser):
     """Scraper for inventory confirmation data"""
-    
+
+    resource_profile = "inventory_confirmation"
+
+    def __init__(self, headless: bool = True, pool=None, use_cache: bool = True, cache_directory: Optional[str] = None):
+        """
+        Initialize inventory confirmation scraper
+
+        Args:
+            headless: Run browser in headless mode
+            pool: Optional BrowserPool to lease a context from instead of launching Firefox
+            use_cache: Reuse and store extracted routes per target date (False always scrapes)
+            cache_directory: Route cache directory (default: downloads/cache/routes)
+        """
+        super().__init__(headless, pool)
+        self.route_cache = RouteResultCache(cache_directory) if use_cache else None
+
+    def get_cached_routes(self, target_date: str) -> Optional[AssetBatch]:
+        """Cached routes for a closed date (or a recent scrape of an open one), so no page needs to be loaded"""
+        if not self.route_cache:
+            return None
+        cached_routes = self.route_cache.get_final_routes(target_date)
+        if cached_routes is not None:
+            print(f"♻️ Using cached routes for {target_date} ({len(cached_routes.routes)} routes)")
+        return cached_routes
+
+    def split_cached_routes(self, target_date: str, routes_with_missing: list) -> Tuple[Dict[str, RouteRecord], list]:
+        """Cached records that can be reused and the summary routes that still need fetching"""
+        if not self.route_cache:
+            return {}, routes_with_missing
+        reusable, to_fetch = self.route_cache.split_routes(target_date, routes_with_missing)
+        if reusable:
+            print(f"♻️ Reusing {len(reusable)} cached routes, fetching {len(to_fetch)}")
+        return reusable, to_fetch
+
+    def store_routes(self, target_date: str, routes_with_missing: list, reusable: Dict[str, RouteRecord],
+                     route_data: List[RouteRecord]) -> AssetBatch:
+        """Combine cached and fetched routes in summary order and save them for reruns"""
+        if not self.route_cache:
+            return AssetBatch.from_routes(route_data)
+        route_data = self.route_cache.merge(routes_with_missing, reusable, route_data)
+        self.route_cache.store(target_date, routes_with_missing, route_data)
+        return route_data
+
     def get_previous_business_day(self) -> str:
         """Get target date: Monday=Friday (3 days ago), else previous day"""
         today = datetime.now()
         days_back = 3 if today.weekday() == 0 else 1  # Monday=0
         target_date = today - timedelta(days=days_back)
         return target_date.strftime("%Y-%m-%d")
-    
-    async def get_incomplete_routes(self, target_date: str) -> List[Dict[str, Any]]:
+
+    @traced("scrape.routes_browser")
+    async def get_incomplete_routes(self, target_date: str, concurrency: int = ROUTE_DRILL_DOWN_CONCURRENCY) -> AssetBatch:
         """
         Find routes with incomplete inventory dynamically
-        
+
         Args:
             target_date: Date in YYYY-MM-DD format
-            
+            concurrency: Route detail pages opened in parallel tabs (1 = click through sequentially)
+
         Returns:
-            List of incomplete route data dictionaries
+            AssetBatch of incomplete routes in summary order
         """
+        cached_routes = self.get_cached_routes(target_date)
+        if cached_routes is not None:
+            return cached_routes
+
         if not await self.navigate_to_route_summary(target_date):
             raise Exception("Failed to navigate to routes summary")
-        
+
         print("🔍 Scanning for routes with missing inventory...")
-        
-        # Get all table rows and find routes with missing inventory
-        rows = await self.page.locator("table tr").all()
-        routes_with_missing = []
-        
-        # Check route data rows (starting from row 6 where route data begins)
-        for i in range(6, len(rows)):
-            row = rows[i]
-            cells = await row.locator("td").all()
-            
-            if len(cells) < 5:
-                continue
-                
-            route_name = (await cells[1].text_content() or "").strip()
-            missing_text = (await cells[4].text_content() or "").strip()
-            
-            # Only process routes with missing inventory
-            if route_name.startswith('Rt') and missing_text.isdigit():
-                routes_with_missing.append((route_name, int(missing_text)))
-                print(f"🔴 Found: {route_name} ({missing_text} missing)")
-        
+
+        # Read the whole summary table in one round trip, then filter in Python
+        rows = await self.extract_table_rows("table tr")
+        routes_with_missing = parse_route_summary_rows(rows)
+
+        for route_name, missing_count, _ in routes_with_missing:
+            print(f"🔴 Found: {route_name} ({missing_count} missing)")
+
         print(f"📊 Found {len(routes_with_missing)} routes with missing inventory")
-        
+
+        reusable, routes_to_fetch = self.split_cached_routes(target_date, routes_with_missing)
+
+        # Parallel tabs need a real detail URL for every route
+        can_open_in_tabs = all(has_detail_url(href) for _, _, href in routes_to_fetch)
+        if concurrency > 1 and can_open_in_tabs:
+            route_data = await self.drill_down_in_tabs(routes_to_fetch, target_date, concurrency)
+        else:
+            route_data = await self.click_through_routes(routes_to_fetch, target_date)
+
+        return self.store_routes(target_date, routes_with_missing, reusable, route_data)
+
+    async def click_through_routes(self, routes_with_missing: list, target_date: str) -> List[RouteRecord]:
+        """
+        Open each route's detail page from the summary page, one at a time
+
+        Args:
+            routes_with_missing: List of (route_name, missing_count, href)
+            target_date: Date in YYYY-MM-DD format
+
+        Returns:
+            RouteRecords in summary order
+        """
         route_data = []
-        
+
         # Process each route
-        for route_name, missing_count in routes_with_missing:
+        for route_name, missing_count, _ in routes_with_missing:
             print(f"📋 Processing {route_name}...")
-            
-            route_info = {
-                'route': route_name,
-                'date': target_date,
-                'status': 'Incomplete',
-                'missing_count': missing_count,
-                'incomplete_assets': []
-            }
-            
+
+            route_info = self.new_route_info(route_name, missing_count, target_date)
+
             try:
                 # Click the missing count number in column 4 (5th td, 0-indexed)
                 route_name_clean = ' '.join(route_name.split())
                 route_row = self.page.locator(f"tr:has(td:has-text('{route_name_clean}'))")
                 missing_link = route_row.locator("td:nth-child(5) a").first
-                
-                # Click the link
-                await missing_link.click()
-                await self.page.wait_for_timeout(2000)
-                
-                # Find rows with YES/NO status
-                yes_no_rows = await self.page.locator("tr:has(td:text-is('YES/NO'))").all()
-                
-                for row in yes_no_rows:
-                    cells = await row.locator("td").all()
-                    if len(cells) < 5:
-                        continue
-                    
-                    asset_id = (await cells[0].text_content() or "").strip()
-                    location = (await cells[1].text_content() or "").strip()
-                    asset_type = (await cells[2].text_content() or "").strip()
-                    restock_time = (await cells[3].text_content() or "").strip() if len(cells) > 3 else ""
-                    inventory_status = (await cells[4].text_content() or "").strip() if len(cells) > 4 else "YES/NO"
-                    
-                    # Skip if contains excluded keywords
-                    excluded = ['COFFEE', 'FF', 'STATIC', 'CONDIMENT']
-                    combined_text = f"{asset_id} {asset_type}".upper()
-                    if any(x in combined_text for x in excluded):
-                        continue
-                    
-                    # Track this incomplete asset with all required fields
-                    route_info['incomplete_assets'].append({
-                        'asset_id': asset_id,
-                        'location': location,
-                        'type': asset_type,
-                        'restock_time': restock_time,
-                        'inventory_taken': inventory_status
-                    })
-                
-                # Navigate back
+
+                # Click the link and wait for the detail table instead of a fixed sleep
+                with span("browser.open_route", route=route_name):
+                    async with self.page.expect_navigation(wait_until="domcontentloaded"):
+                        await missing_link.click()
+                    await self.page.wait_for_selector("table tr", state="attached")
+
+                route_info.assets = await self.read_incomplete_assets(self.page)
+
+                # Navigate back (replaces the page/context once it has been used enough)
                 await self.page.go_back()
-                print(f"✅ {route_name}: {len(route_info['incomplete_assets'])} incomplete assets found")
-                
+                await self.checkpoint_page()
+                print(f"✅ {route_name}: {len(route_info.assets)} incomplete assets found")
+
             except Exception as e:
                 print(f"❌ Error processing {route_name}: {str(e)}")
-                route_info['status'] = 'Error'
-            
+                route_info.status = 'Error'
+
             route_data.append(route_info)
-        
-        return route_data
\ No newline at end of file
+
+        return route_data
+
+    def new_route_info(self, route_name: str, missing_count: int, target_date: str) -> RouteRecord:
+        """Build an empty route record"""
+        return RouteRecord(route_name, target_date, missing_count)
+
+    async def read_incomplete_assets(self, page: Page) -> List[AssetRecord]:
+        """
+        Read the YES/NO asset rows from a route detail page
+
+        Args:
+            page: Page showing a route detail table
+
+        Returns:
+            List of incomplete AssetRecords
+        """
+        rows = await self.extract_table_rows("table tr", page)
+        return parse_incomplete_asset_rows(rows)
+
+    async def drill_down_in_tabs(self, routes_with_missing: list, target_date: str, concurrency: int, summary_url: Optional[str] = None) -> List[RouteRecord]:
+        """
+        Open route detail pages on a bounded set of parallel tabs
+
+        Args:
+            routes_with_missing: List of (route_name, missing_count, href)
+            target_date: Date in YYYY-MM-DD format
+            concurrency: Maximum tabs open at once
+            summary_url: URL the hrefs are relative to (defaults to the current page)
+
+        Returns:
+            RouteRecords in summary order
+        """
+        print(f"⚡ Opening route details on up to {concurrency} parallel tabs...")
+
+        summary_url = summary_url or self.page.url
+        tab_slots = asyncio.Semaphore(concurrency)
+
+        async def drill_down(route_name: str, missing_count: int, href: str) -> RouteRecord:
+            route_info = self.new_route_info(route_name, missing_count, target_date)
+            page: Optional[Page] = None
+
+            async with tab_slots:
+                try:
+                    page = await self.context.new_page()
+                    with span("browser.open_route", route=route_name):
+                        await page.goto(urljoin(summary_url, href), wait_until="domcontentloaded")
+                        await page.wait_for_selector("table tr", state="attached")
+
+                    route_info.assets = await self.read_incomplete_assets(page)
+                    print(f"✅ {route_name}: {len(route_info.assets)} incomplete assets found")
+
+                except Exception as e:
+                    print(f"❌ Error processing {route_name}: {str(e)}")
+                    route_info.status = 'Error'
+                finally:
+                    if page:
+                        await page.close()
+                    # Other tabs are still open, so only sample memory here
+                    await self.checkpoint_page(allow_recycle=False)
+
+            return route_info
+
+        # gather() keeps results in route order; each route handles its own errors
+        return list(await asyncio.gather(*(
+            drill_down(route_name, missing_count, href)
+            for route_name, missing_count, href in routes_with_missing
+        )))
+
+    @traced("scrape.routes_http")
+    async def get_incomplete_routes_http(self, target_date: str, concurrency: int = ROUTE_HTTP_CONCURRENCY) -> AssetBatch:
+        """
+        Find routes with incomplete inventory without rendering pages
+
+        Fetches RoutesSummary and route detail HTML with the saved SEED session over
+        pooled HTTP and parses the tables. Route pages without usable tables are
+        opened in the browser (set up on demand).
+
+        Args:
+            target_date: Date in YYYY-MM-DD format
+            concurrency: Route detail pages fetched at once
+
+        Returns:
+            AssetBatch of incomplete routes (same records as the browser path)
+
+        Raises:
+            SeedSessionExpired: No saved session or SEED rejected it
+            PageNeedsBrowser: The routes summary is rendered by JavaScript
+        """
+        cached_routes = self.get_cached_routes(target_date)
+        if cached_routes is not None:
+            return cached_routes
+
+        client = SeedHttpClient.from_session_cache()
+        if not client:
+            raise SeedSessionExpired("No saved SEED session")
+
+        try:
+            print(f"🌐 Fetching routes summary for {target_date} over HTTP...")
+            summary_html, summary_url = await asyncio.to_thread(
+                client.fetch_html, client.get_cluster_url(format_route_summary_path(target_date))
+            )
+            rows = parse_table_rows(summary_html)
+
+            # A rendered summary always lists routes, complete or not
+            if not any(len(row['cells']) > 1 and row['cells'][1].startswith('Rt') for row in rows):
+                raise PageNeedsBrowser("Routes summary has no route rows in its HTML")
+
+            routes_with_missing = parse_route_summary_rows(rows)
+            for route_name, missing_count, _ in routes_with_missing:
+                print(f"🔴 Found: {route_name} ({missing_count} missing)")
+            print(f"📊 Found {len(routes_with_missing)} routes with missing inventory")
+
+            reusable, routes_to_fetch = self.split_cached_routes(target_date, routes_with_missing)
+
+            def fetch_route(route_name: str, missing_count: int, href: Optional[str]) -> RouteRecord:
+                route_info = self.new_route_info(route_name, missing_count, target_date)
+                if not has_detail_url(href):
+                    route_info.status = 'NeedsBrowser'
+                    return route_info
+                try:
+                    detail_html, _ = client.fetch_html(urljoin(summary_url, href))
+                    detail_rows = parse_table_rows(detail_html)
+                    if not detail_rows:
+                        route_info.status = 'NeedsBrowser'
+                        return route_info
+                    route_info.assets = parse_incomplete_asset_rows(detail_rows)
+                    print(f"✅ {route_name}: {len(route_info.assets)} incomplete assets found")
+                except SeedSessionExpired:
+                    raise
+                except Exception as e:
+                    print(f"❌ Error processing {route_name}: {str(e)}")
+                    route_info.status = 'Error'
+                return route_info
+
+            # executor.map keeps results in route order; each fetch runs in a copy of the run's context
+            def fetch_all_routes() -> List[RouteRecord]:
+                context = contextvars.copy_context()
+                with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                    return list(executor.map(lambda route: context.copy().run(fetch_route, *route), routes_to_fetch))
+
+            route_data = await asyncio.to_thread(fetch_all_routes)
+        finally:
+            client.close()
+
+        # Render the few route pages that need JavaScript in the browser
+        needs_browser = [i for i, route_info in enumerate(route_data) if route_info.status == 'NeedsBrowser']
+        if needs_browser:
+            print(f"🦊 {len(needs_browser)} route pages need the browser")
+            if not self.page and not await self.setup_and_login():
+                raise Exception("Failed to setup browser and login to SEED")
+            if not await self.navigate_to_route_summary(target_date):
+                raise Exception("Failed to navigate to routes summary")
+            # Tabs need a real detail URL; routes without one are clicked from the summary page
+            in_tabs = [i for i in needs_browser if has_detail_url(routes_to_fetch[i][2])]
+            clicked = [i for i in needs_browser if not has_detail_url(routes_to_fetch[i][2])]
+            if in_tabs:
+                rendered = await self.drill_down_in_tabs(
+                    [routes_to_fetch[i] for i in in_tabs], target_date, ROUTE_DRILL_DOWN_CONCURRENCY
+                )
+                for i, route_info in zip(in_tabs, rendered):
+                    route_data[i] = route_info
+            if clicked:
+                rendered = await self.click_through_routes([routes_to_fetch[i] for i in clicked], target_date)
+                for i, route_info in zip(clicked, rendered):
+                    route_data[i] = route_info
+
+        return self.store_routes(target_date, routes_with_missing, reusable, route_data)
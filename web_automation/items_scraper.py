@@ -13,6 +13,7 @@ from typing import Optional
 import pandas as pd
 from playwright.async_api import Download
 from playwright.async_api import TimeoutError as PlaywrightTimeout
+from utils.tracing import traced
 from .seed_browser import SeedBrowser
 
 class ItemsScraper(SeedBrowser):
@@ -21,9 +22,11 @@ class ItemsScraper(SeedBrowser):
     Inherits SEED login/navigation from SeedBrowser
     """
     
-    def __init__(self, headless: bool = True):
+    resource_profile = "items_export"
+    
+    def __init__(self, headless: bool = True, pool=None):
         """Initialize items scraper with SEED capabilities"""
-        super().__init__(headless)
+        super().__init__(headless, pool)
         self.download_dir: Optional[str] = None
     
     def setup_download_directory(self) -> str:
@@ -78,6 +81,7 @@ class ItemsScraper(SeedBrowser):
             except:
                 pass
     
+    @traced("browser.download_items_list")
     async def download_items_list(self) -> str:
         """
         Download items list from ItemImportExport page
@@ -0,0 +1,132 @@
+"""
+Network Resource Policy - Playwright Edition
+============================================
+
+Route interception profiles that block or stub resources the scrapers
+don't need (images, fonts, media, trackers). Counts blocked requests and
+the bytes actually loaded; bytes saved is the difference to the same
+pages loaded under the "off" profile.
+"""
+
+from urllib.parse import urlparse
+from typing import Dict, Any
+from playwright.async_api import BrowserContext, Route, Response
+from config.report_config import RESOURCE_POLICY_PROFILES
+
+# Empty bodies for stubbed resource types
+STUB_RESPONSES = {
+    "stylesheet": ("text/css", ""),
+    "script": ("application/javascript", ""),
+    "image": ("image/gif", ""),
+    "font": ("font/woff2", ""),
+    "media": ("video/mp4", ""),
+}
+
+class ResourcePolicy:
+    """
+    Blocks or stubs unneeded requests on a browser context
+    """
+
+    def __init__(self, profile_name: str):
+        """
+        Initialize resource policy
+
+        Args:
+            profile_name: Key of RESOURCE_POLICY_PROFILES
+        """
+        profile = RESOURCE_POLICY_PROFILES[profile_name]
+        self.profile_name = profile_name
+        self.block_types = set(profile.get("block_types", []))
+        self.stub_types = set(profile.get("stub_types", []))
+        self.block_domains = tuple(profile.get("block_domains", []))
+        self.allow_patterns = tuple(profile.get("allow_patterns", []))
+
+        self.allowed_requests = 0
+        self.blocked_requests = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.bytes_loaded = 0
+        self.unknown_size_responses = 0
+        self._blocked_urls = set()
+
+    async def attach(self, context: BrowserContext):
+        """Start intercepting requests on a context"""
+        await context.route("**/*", self.handle_route)
+        context.on("response", self.record_response)
+
+    async def detach(self, context: BrowserContext):
+        """Stop intercepting (e.g. before a pooled context is handed to another scraper)"""
+        try:
+            await context.unroute("**/*", self.handle_route)
+            context.remove_listener("response", self.record_response)
+        except Exception:
+            pass
+
+    def is_tracker(self, url: str) -> bool:
+        """Check whether the URL belongs to a blocked third-party host"""
+        host = urlparse(url).hostname or ""
+        return any(host == domain or host.endswith(f".{domain}") for domain in self.block_domains)
+
+    async def handle_route(self, route: Route):
+        """Decide whether a request continues, is stubbed or is aborted"""
+        request = route.request
+        url = request.url
+        resource_type = request.resource_type
+
+        if any(pattern in url for pattern in self.allow_patterns):
+            self.allowed_requests += 1
+            await route.continue_()
+            return
+
+        if self.is_tracker(url):
+            self._count_block("tracker", url)
+            content_type, body = STUB_RESPONSES.get(resource_type, ("text/plain", ""))
+            await route.fulfill(status=200, content_type=content_type, body=body)
+        elif resource_type in self.stub_types:
+            self._count_block(resource_type, url)
+            content_type, body = STUB_RESPONSES.get(resource_type, ("text/plain", ""))
+            await route.fulfill(status=200, content_type=content_type, body=body)
+        elif resource_type in self.block_types:
+            self._count_block(resource_type, url)
+            await route.abort("blockedbyclient")
+        else:
+            self.allowed_requests += 1
+            await route.continue_()
+
+    def record_response(self, response: Response):
+        """Add the size of a response that reached the page to the bytes loaded"""
+        if response.url in self._blocked_urls:
+            return  # Our own stub, nothing was transferred
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.bytes_loaded += int(length)
+        else:
+            self.unknown_size_responses += 1
+
+    def _count_block(self, category: str, url: str):
+        self.blocked_requests += 1
+        self._blocked_urls.add(url)
+        self.blocked_by_type[category] = self.blocked_by_type.get(category, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get interception statistics
+
+        Returns:
+            Dict with allowed/blocked counts, per-type blocks and bytes loaded
+        """
+        return {
+            'profile': self.profile_name,
+            'allowed_requests': self.allowed_requests,
+            'blocked_requests': self.blocked_requests,
+            'blocked_by_type': dict(self.blocked_by_type),
+            'bytes_loaded': self.bytes_loaded,
+            'unknown_size_responses': self.unknown_size_responses
+        }
+
+    def print_summary(self):
+        """Print blocked request counts and bytes loaded"""
+        if not self.blocked_requests:
+            return
+        by_type = ", ".join(f"{name}: {count}" for name, count in sorted(self.blocked_by_type.items()))
+        print(f"🚫 Blocked {self.blocked_requests} requests ({by_type}), "
+              f"{self.bytes_loaded / 1024:.0f} KB loaded [{self.profile_name}]")
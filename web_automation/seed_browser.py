@@ -7,9 +7,30 @@ Provides reusable SEED-specific browser operations.
 """
 
 import os
+import time
+from typing import List, Dict
+from urllib.parse import urlparse
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 from dotenv import load_dotenv
 from .base_scraper import BaseScraper
+from config.report_config import SEED_BASE_URL
+from utils.seed_http import format_route_summary_path
+from utils.tracing import traced
+from utils.session_cache import SeedSessionCache
+
+# Reads every row's td text and first link href in one evaluation
+TABLE_EXTRACTION_SCRIPT = """
+rows => rows.map(row => {
+    const cells = Array.from(row.querySelectorAll('td'));
+    return {
+        cells: cells.map(cell => (cell.textContent || '').trim()),
+        hrefs: cells.map(cell => {
+            const link = cell.querySelector('a[href]');
+            return link ? link.getAttribute('href') : null;
+        })
+    };
+})
+"""
 
 class SeedBrowser(BaseScraper):
     """
@@ -17,10 +38,13 @@ class SeedBrowser(BaseScraper):
     Inherits browser setup/cleanup from BaseScraper
     """
     
-    def __init__(self, headless: bool = True):
-        super().__init__(headless)
-        self.base_url = "https://mycantaloupe.com"
+    resource_profile = "seed_default"
+    
+    def __init__(self, headless: bool = True, pool=None):
+        super().__init__(headless, pool)
+        self.base_url = SEED_BASE_URL
         self.cluster = None
+        self.session_cache = SeedSessionCache()
         
         load_dotenv()
         self.username = os.getenv('SEED_USERNAME')
@@ -29,6 +53,7 @@ class SeedBrowser(BaseScraper):
         if not self.username or not self.password:
             raise ValueError("SEED_USERNAME and SEED_PASSWORD must be set in environment variables")
     
+    @traced("browser.login")
     async def login(self) -> bool:
         try:
             await self.page.goto(self.base_url)
@@ -52,14 +77,10 @@ class SeedBrowser(BaseScraper):
             print(f"Login failed: {e}")
             return False
     
+    @traced("browser.navigate_route_summary")
     async def navigate_to_route_summary(self, target_date: str) -> bool:
         try:
-            from datetime import datetime
-            date_obj = datetime.strptime(target_date, "%Y-%m-%d")
-            formatted_date = date_obj.strftime("%m%%2F%d%%2F%Y%%2000%%3A00%%3A00")
-            
-            cluster = self.cluster or "cs1"
-            routes_url = f"{self.base_url}/{cluster}/Scheduling/RoutesSummary?ScheduleDateOnly={formatted_date}"
+            routes_url = self.get_cluster_url(format_route_summary_path(target_date))
             print(f"🧭 Navigating to routes summary for {target_date}")
             
             await self.page.goto(routes_url)
@@ -75,6 +96,7 @@ class SeedBrowser(BaseScraper):
             print(f"❌ Navigation failed: {str(e)}")
             return False
     
+    @traced("browser.navigate_item_import_export")
     async def navigate_to_item_import_export(self) -> bool:
         try:
             print("🧭 Navigating to Item Import/Export page...")
@@ -130,11 +152,31 @@ class SeedBrowser(BaseScraper):
             print(f"⚠️ Element not clickable: {selector}")
             return None
     
+    @traced("browser.extract_table_rows")
+    async def extract_table_rows(self, row_selector: str = "table tr", page=None) -> List[Dict[str, List]]:
+        """
+        Extract table rows in a single in-page evaluation
+        
+        Replaces per-cell text_content() calls (one browser round trip each)
+        with one round trip for the whole table.
+        
+        Args:
+            row_selector: Selector matching the table rows
+            page: Page to read (defaults to self.page)
+            
+        Returns:
+            List of rows: {'cells': [trimmed td text], 'hrefs': [first link href per td or None]}
+        """
+        page = page or self.page
+        return await page.locator(row_selector).evaluate_all(TABLE_EXTRACTION_SCRIPT)
+    
     async def check_logged_in(self) -> bool:
         try:
             current_url = self.page.url
             
-            if "mycantaloupe.com" in current_url and "login" not in current_url.lower():
+            seed_host = urlparse(self.base_url).hostname or ""
+            
+            if seed_host in current_url and "login" not in current_url.lower():
                 if "dashboard" in current_url or "Reports" in current_url or "/cs" in current_url:
                     return True
             return False
@@ -142,10 +184,89 @@ class SeedBrowser(BaseScraper):
         except Exception:
             return False
     
-    async def setup_and_login(self) -> bool:
+    async def get_session_cookies(self) -> list:
+        """
+        Get the authenticated SEED cookies for browserless HTTP requests
+        
+        Returns:
+            List of Playwright cookie dictionaries
+        """
+        return await self.context.cookies()
+    
+    @traced("browser.restore_session")
+    async def restore_session(self) -> bool:
+        """
+        Restore the saved SEED session and verify it is still logged in
+        
+        Returns:
+            bool: True if the saved session is valid
+        """
+        session = self.session_cache.load()
+        if not session:
+            return False
+        
+        logged_in = False
+        try:
+            await self.context.add_cookies(session['storage_state'].get('cookies', []))
+            self.cluster = session.get('cluster')
+            await self.page.goto(self.get_cluster_url("Home"))
+            logged_in = await self.check_logged_in()
+        except Exception as e:
+            print(f"⚠️ Could not restore saved session: {str(e)}")
+        
+        if logged_in:
+            self.session_cache.record_hit()
+            return True
+        
+        print("⌛ Saved SEED session expired")
+        self.session_cache.clear()
+        return False
+    
+    async def save_session(self):
+        """Save the authenticated storage state and cluster for later runs"""
+        try:
+            storage_state = await self.context.storage_state()
+            self.session_cache.save(storage_state, self.cluster)
+        except Exception as e:
+            print(f"⚠️ Could not save SEED session: {str(e)}")
+    
+    @traced("browser.setup_and_login")
+    async def setup_and_login(self, force_login: bool = False) -> bool:
+        """
+        Setup browser and authenticate, reusing the saved session when it is still valid
+        
+        Args:
+            force_login: Skip the saved session and log in with credentials
+            
+        Returns:
+            bool: True if logged in
+        """
         try:
-            await self.setup_browser()
-            return await self.login()
+            if not self.page:
+                await self.setup_browser()
+            
+            # Warm pooled contexts were verified moments ago, skip the Home round trip
+            # (only while the saved session, and with it the cluster, still exists)
+            session = self.session_cache.load() if not force_login and self.pool else None
+            if session and self.pool.is_session_fresh(self.context):
+                self.cluster = session.get('cluster')
+                self.session_cache.record_hit()
+                return True
+            
+            if not force_login and await self.restore_session():
+                if self.pool:
+                    self.pool.mark_session_verified(self.context)
+                return True
+            
+            start_time = time.time()
+            if not await self.login():
+                return False
+            
+            self.session_cache.record_login(time.time() - start_time)
+            await self.save_session()
+            if self.pool:
+                self.pool.mark_session_verified(self.context)
+            return True
         except Exception as e:
             print(f"❌ Setup and login failed: {str(e)}")
             return False